@@ -31,26 +31,45 @@ class JDAgent:
     def generate_jd(self, state):
         """Generate a job description based on the current state"""
         if not all([state.get('current_role'), state.get('required_skills')]):
-            return {"messages": [{"type": "ai", "content": "I need more information about the role and required skills to generate a job description."}]}
+            return self._missing_information()
         
         try:
-            jd = self.chain.invoke({
-                "role": state['current_role'],
-                "skills": ", ".join(state['required_skills']),
-                "experience": state.get('experience_level', 'Not specified'),
-                "budget": state.get('budget_range', 'Not specified'),
-                "company_info": str(state.get('company_info', {})),
-                "format_instructions": self.parser.get_format_instructions()
-            })
-            
-            jd_markdown = self._format_jd_to_markdown(jd)
-            return {
-                "messages": [{"type": "ai", "content": jd_markdown}],
-                "jd_generated": True
-            }
-            
+            return self._result(self.chain.invoke(self._chain_inputs(state)))
         except Exception as e:
-            return {"messages": [{"type": "ai", "content": f"Error generating job description: {str(e)}"}]}
+            return self._error(e)
+    
+    async def agenerate_jd(self, state):
+        """generate_jd without blocking the event loop while the LLM responds"""
+        if not all([state.get('current_role'), state.get('required_skills')]):
+            return self._missing_information()
+        
+        try:
+            return self._result(await self.chain.ainvoke(self._chain_inputs(state)))
+        except Exception as e:
+            return self._error(e)
+    
+    def _chain_inputs(self, state):
+        return {
+            "role": state['current_role'],
+            "skills": ", ".join(state['required_skills']),
+            "experience": state.get('experience_level', 'Not specified'),
+            "budget": state.get('budget_range', 'Not specified'),
+            "company_info": str(state.get('company_info', {})),
+            "format_instructions": self.parser.get_format_instructions()
+        }
+    
+    def _result(self, jd: JobDescription):
+        jd_markdown = self._format_jd_to_markdown(jd)
+        return {
+            "messages": [{"type": "ai", "content": jd_markdown}],
+            "jd_generated": True
+        }
+    
+    def _missing_information(self):
+        return {"messages": [{"type": "ai", "content": "I need more information about the role and required skills to generate a job description."}]}
+    
+    def _error(self, e: Exception):
+        return {"messages": [{"type": "ai", "content": f"Error generating job description: {str(e)}"}]}
     
     def _format_jd_to_markdown(self, jd: JobDescription) -> str:
         """Convert JobDescription object to markdown format"""
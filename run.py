@@ -4,12 +4,10 @@ Intelligent HR Assistant - Main Entry Point
 """
 
 import argparse
-import asyncio
-from graph.stategraph import HRAssistantGraph
-from stateclass import AgentState
-from langchain_core.messages import HumanMessage
-from src.utils.logger import setup_logging
-from src.utils.config import load_config
+import sys
+
+# Each subcommand imports its own stack, so e.g. --api never pays for langchain
+# graph construction and --train never pays for FastAPI
 
 def main():
     """Main CLI application"""
@@ -18,8 +16,20 @@ def main():
     parser.add_argument("--api", action="store_true", help="Start API server")
     parser.add_argument("--web", action="store_true", help="Start web interface")
     parser.add_argument("--train", action="store_true", help="Train models")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Report import and model load times for the selected mode instead of running it")
+    parser.add_argument("--startup-budget", type=float, default=None,
+                        help="With --profile-startup, exit non-zero if startup exceeds this many seconds")
     
     args = parser.parse_args()
+    
+    if args.profile_startup:
+        mode = "cli" if args.cli else "api" if args.api else "train" if args.train else "web"
+        sys.exit(profile_startup(mode, args.startup_budget))
+    
+    from src.utils.logger import setup_logging
+    from src.utils.config import load_config
+    
     config = load_config()
     setup_logging(config)
     
@@ -34,8 +44,26 @@ def main():
     else:
         run_web()
 
+def profile_startup(mode, budget=None):
+    """Print the startup profile of a subcommand; returns the process exit code"""
+    from src.utils.startup_profile import profile_startup as run_profile, format_report
+    from src.utils.config import load_config
+    
+    models = load_config().get('models', {}).get('warm') if mode in ("api", "web") else None
+    report = run_profile(mode, models)
+    print(format_report(report))
+    
+    if budget is not None and report['total_seconds'] > budget:
+        print(f"Startup took {report['total_seconds']:.2f} s, over the {budget:.2f} s budget")
+        return 1
+    return 0
+
 def run_cli():
     """Run the CLI version"""
+    from graph.stategraph import HRAssistantGraph
+    from stateclass import AgentState
+    from langchain_core.messages import HumanMessage
+    
     print("🤖 Intelligent HR Assistant - CLI Version")
     print("Type 'quit' to exit, 'reset' to start over\n")
     
@@ -95,6 +123,7 @@ def run_api():
     """Start the FastAPI server"""
     import uvicorn
     from src.api.main import app
+    from src.utils.config import load_config
     
     config = load_config()
     uvicorn.run(
@@ -107,7 +136,7 @@ def run_api():
 def run_web():
     """Start the Streamlit web interface"""
     import subprocess
-    import sys
+    from src.utils.config import load_config
     
     config = load_config()
     subprocess.run([
@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+Script to benchmark performance-critical paths of the HR Assistant
+"""
+
+import argparse
+import time
+import numpy as np
+
+def _timeit(func, repeat=5):
+    """Return the best wall-clock time of func over repeat runs"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def benchmark_similarity(n_targets=100000, dim=384, top_k=10):
+    """Compare the per-target similarity loop with the matrix top-k search"""
+    from src.ml_models.embedding_model import top_k_similarity
+    
+    print(f"Similarity search: {n_targets} targets x {dim} dims, top {top_k}")
+    rng = np.random.default_rng(42)
+    targets = rng.normal(size=(n_targets, dim)).astype(np.float32)
+    query = rng.normal(size=dim).astype(np.float32)
+    
+    def loop_search():
+        scores = [
+            np.dot(query, target) / (np.linalg.norm(query) * np.linalg.norm(target))
+            for target in targets
+        ]
+        return sorted(range(len(scores)), key=scores.__getitem__, reverse=True)[:top_k]
+    
+    loop_time = _timeit(loop_search, repeat=1)
+    matrix_time = _timeit(lambda: top_k_similarity(query, targets, top_k))
+    chunked_time = _timeit(lambda: top_k_similarity(query, targets, top_k, chunk_size=16384))
+    
+    print(f"  python loop:    {loop_time * 1000:.1f} ms")
+    print(f"  matrix top-k:   {matrix_time * 1000:.1f} ms ({loop_time / matrix_time:.0f}x)")
+    print(f"  chunked top-k:  {chunked_time * 1000:.1f} ms ({loop_time / chunked_time:.0f}x)")
+
+def _clustered_embeddings(rng, centers, n_vectors, noise=1.0):
+    """Synthetic embeddings with the topical clustering real job postings have"""
+    labels = rng.integers(0, len(centers), n_vectors)
+    return (centers[labels] + noise * rng.normal(size=(n_vectors, centers.shape[1]))).astype(np.float32)
+
+def benchmark_ann(n_vectors=100000, dim=384, top_k=10, n_queries=100):
+    """Measure IVF recall and latency against exact search"""
+    from src.ml_models.ann_index import IVFIndex
+    from src.ml_models.embedding_model import top_k_similarity
+    
+    print(f"ANN index: {n_vectors} vectors x {dim} dims, recall@{top_k} over {n_queries} queries")
+    rng = np.random.default_rng(7)
+    centers = rng.normal(size=(2000, dim)).astype(np.float32)
+    vectors = _clustered_embeddings(rng, centers, n_vectors)
+    queries = _clustered_embeddings(rng, centers, n_queries)
+    
+    start = time.perf_counter()
+    index = IVFIndex(dim, n_lists=int(np.sqrt(n_vectors)) * 2)
+    index.train(vectors)
+    index.add(list(range(n_vectors)), vectors)
+    print(f"  build: {time.perf_counter() - start:.1f} s ({index.n_lists} lists)")
+    
+    start = time.perf_counter()
+    exact = [set(top_k_similarity(query, vectors, top_k)[0].tolist()) for query in queries]
+    exact_ms = (time.perf_counter() - start) / n_queries * 1000
+    print(f"  exact:     {exact_ms:.2f} ms/query")
+    
+    for n_probe in [1, 4, 8, 16, 32, 64]:
+        start = time.perf_counter()
+        results = [index.search(query, top_k, n_probe=n_probe) for query in queries]
+        ann_ms = (time.perf_counter() - start) / n_queries * 1000
+        recall = np.mean([
+            len({int(match["id"]) for match in matches} & truth) / top_k
+            for matches, truth in zip(results, exact)
+        ])
+        print(f"  n_probe={n_probe:<3} {ann_ms:.2f} ms/query, recall {recall:.3f}")
+
+def benchmark_bm25(n_docs=100000, doc_length=150, vocab_size=50000, top_k=10, n_queries=200):
+    """Compare exhaustive BM25 scoring with MaxScore early termination"""
+    from src.ml_models.bm25_model import BM25Model
+    
+    print(f"BM25: {n_docs} documents x {doc_length} tokens, top {top_k} over {n_queries} queries")
+    rng = np.random.default_rng(3)
+    # Zipf-distributed vocabulary, like words in real job postings
+    probabilities = 1 / np.arange(1, vocab_size + 1) ** 1.1
+    probabilities /= probabilities.sum()
+    vocabulary = np.array([f"term{i}" for i in range(vocab_size)])
+    documents = [" ".join(vocabulary[rng.choice(vocab_size, doc_length, p=probabilities)]) for _ in range(n_docs)]
+    queries = [" ".join(vocabulary[rng.choice(vocab_size, 4, p=probabilities)]) for _ in range(n_queries)]
+    
+    model = BM25Model()
+    start = time.perf_counter()
+    model.index_documents(documents)
+    print(f"  index:       {time.perf_counter() - start:.1f} s")
+    
+    for early_termination in [False, True]:
+        start = time.perf_counter()
+        for query in queries:
+            model.search(query, top_k, early_termination=early_termination)
+        elapsed_ms = (time.perf_counter() - start) / n_queries * 1000
+        label = "maxscore" if early_termination else "exhaustive"
+        print(f"  {label + ':':<12} {elapsed_ms:.2f} ms/query")
+
+def benchmark_skills(corpus_mb=5, n_docs=2000):
+    """Compare skill extraction throughput of regex passes and the Aho-Corasick matcher"""
+    import re
+    from src.data_processing.skill_matcher import SkillMatcher
+    
+    matcher = SkillMatcher()
+    rng = np.random.default_rng(11)
+    filler = ("led team designed built scalable services for customers using modern tools and "
+              "improved reliability while mentoring engineers across the organization").split()
+    surfaces = [name for skills in matcher.taxonomy.values() for name in skills]
+    doc_bytes = corpus_mb * 1024 * 1024 // n_docs
+    documents = []
+    for _ in range(n_docs):
+        words = []
+        while sum(len(word) + 1 for word in words) < doc_bytes:
+            words.append(surfaces[rng.integers(len(surfaces))] if rng.random() < 0.1 else filler[rng.integers(len(filler))])
+        documents.append(" ".join(words))
+    size_mb = sum(len(doc) for doc in documents) / (1024 * 1024)
+    print(f"Skill extraction: {n_docs} documents, {size_mb:.1f} MB, {len(matcher.skills)} taxonomy skills")
+    
+    # The previous NERModel.extract_skills: four findall passes over ~25 hard-coded skills
+    legacy_patterns = [
+        r'\b(?:python|java|javascript|typescript|react|angular|vue)\b',
+        r'\b(?:machine learning|deep learning|ai|nlp|computer vision)\b',
+        r'\b(?:aws|azure|gcp|docker|kubernetes|terraform)\b',
+        r'\b(?:sql|mysql|postgresql|mongodb|redis)\b'
+    ]
+    legacy_time = _timeit(lambda: [re.findall(p, doc, re.IGNORECASE) for doc in documents for p in legacy_patterns], repeat=1)
+    
+    # The same regex approach extended to the full taxonomy: one pass per skill
+    taxonomy_patterns = [re.compile(r'(?<!\w)' + re.escape(name) + r'(?!\w)', re.IGNORECASE) for name in surfaces]
+    sample = documents[:max(1, n_docs // 20)]
+    sample_mb = sum(len(doc) for doc in sample) / (1024 * 1024)
+    taxonomy_time = _timeit(lambda: [p.findall(doc) for doc in sample for p in taxonomy_patterns], repeat=1)
+    
+    matcher_time = _timeit(lambda: [matcher.find(doc) for doc in documents], repeat=1)
+    
+    print(f"  regex, 25 skills:             {size_mb / legacy_time:.1f} MB/s")
+    print(f"  regex, full taxonomy:         {sample_mb / taxonomy_time:.2f} MB/s")
+    print(f"  aho-corasick, full taxonomy:  {size_mb / matcher_time:.1f} MB/s")
+
+def _synthetic_resume_pages(rng, n_pages, skills):
+    """Pages of a plausible resume: contact block, dated roles with skill-laden bullets, education"""
+    pages = []
+    for page_number in range(n_pages):
+        lines = ["Jane Doe", "jane.doe@example.com | +1 555 123 4567", "Experience"] if page_number == 0 else []
+        for _ in range(8):
+            start = int(rng.integers(2000, 2020))
+            lines.append(f"Senior Engineer, Company {rng.integers(1000)}, {start} - {start + int(rng.integers(1, 5))}")
+            for _ in range(5):
+                used = ", ".join(skills[i] for i in rng.integers(0, len(skills), 3))
+                lines.append(f"- Built and operated services using {used} for millions of users")
+        if page_number == n_pages - 1:
+            lines += ["Education", "BSc Computer Science, State University, 2000 - 2004"]
+        pages.append("\n".join(lines))
+    return pages
+
+def benchmark_resume_parsing(n_resumes=400, pages_per_resume=4, workers=(1, 2, 4)):
+    """Resume extraction throughput, sequential and fanned out across processes"""
+    import os
+    import tempfile
+    from src.data_processing.resume_parser import EnhancedResumeParser
+    
+    parser = EnhancedResumeParser()
+    rng = np.random.default_rng(5)
+    skills = [name for category in parser.skill_matcher.taxonomy.values() for name in category]
+    
+    try:
+        import docx
+    except ImportError:
+        docx = None
+    
+    with tempfile.TemporaryDirectory() as corpus_dir:
+        paths = []
+        for i in range(n_resumes):
+            pages = _synthetic_resume_pages(rng, pages_per_resume, skills)
+            if docx is not None and i % 2:
+                document = docx.Document()
+                for page_number, page in enumerate(pages):
+                    for line in page.split("\n"):
+                        document.add_paragraph(line)
+                    if page_number < len(pages) - 1:
+                        document.add_page_break()
+                path = os.path.join(corpus_dir, f"resume-{i}.docx")
+                document.save(path)
+            else:
+                path = os.path.join(corpus_dir, f"resume-{i}.txt")
+                with open(path, "w") as f:
+                    f.write("\f".join(pages))
+            paths.append(path)
+        
+        size_mb = sum(os.path.getsize(path) for path in paths) / (1024 * 1024)
+        formats = "TXT and DOCX" if docx is not None else "TXT"
+        print(f"Resume parsing: {n_resumes} {formats} resumes x {pages_per_resume} pages, {size_mb:.1f} MB")
+        
+        start = time.perf_counter()
+        first_page = next(parser.iter_pages(paths[0]))
+        print(f"  first page of one resume: {(time.perf_counter() - start) * 1000:.2f} ms ({len(first_page)} chars)")
+        
+        for n_workers in workers:
+            start = time.perf_counter()
+            failed = sum(error is not None for _, _, error in parser.parse_many(paths, workers=n_workers))
+            elapsed = time.perf_counter() - start
+            print(f"  workers={n_workers}: {n_resumes / elapsed:.0f} resumes/s, "
+                  f"{n_resumes * pages_per_resume / elapsed:.0f} pages/s, {size_mb / elapsed:.1f} MB/s ({failed} failed)")
+
+def _synthetic_job_posting(rng, skills):
+    """A posting with a title, labelled sections of bullets, location and salary"""
+    picked = lambda n: ", ".join(skills[i] for i in rng.integers(0, len(skills), n))
+    low = int(rng.integers(60, 150)) * 1000
+    lines = [
+        f"Senior Engineer {rng.integers(1000)}", "Company: Tech Corp", "Austin, TX | Hybrid",
+        f"Salary: ${low:,} - ${low + 40000:,}", "", "About us", "We build software for hiring teams.", "",
+        "Responsibilities:"
+    ]
+    lines += [f"- Design and operate services using {picked(2)}" for _ in range(6)]
+    lines += ["", "Requirements:"] + [f"- 3+ years with {picked(2)}" for _ in range(6)]
+    lines += ["", "What we offer"] + [f"- {perk}" for perk in ("Health insurance", "401(k) match", "Remote budget")]
+    return "\n".join(lines)
+
+def benchmark_job_parsing(n_postings=20000, workers=(1, 4)):
+    """Job posting parse throughput: previous multi-pass parser vs single pass, sequential and pooled"""
+    import re
+    from src.data_processing.job_parser import JobParser
+    from src.data_processing.skill_matcher import SkillMatcher
+    
+    rng = np.random.default_rng(13)
+    skills = [name for category in SkillMatcher().taxonomy.values() for name in category]
+    postings = [_synthetic_job_posting(rng, skills) for _ in range(n_postings)]
+    size_mb = sum(len(posting) for posting in postings) / (1024 * 1024)
+    print(f"Job parsing: {n_postings} postings, {size_mb:.1f} MB")
+    
+    # The previous JobParser: one split per field and patterns recompiled from the re cache on every call
+    def legacy_parse(text):
+        lines = text.split('\n')
+        title = next((line.strip() for line in lines if line.strip() and len(line.strip()) < 100), None)
+        location = next((m[0] for p in [r'\b(?:remote|hybrid|onsite)\b', r'\b[A-Z][a-z]+,\s*[A-Z]{2}\b']
+                         for m in [re.findall(p, text, re.IGNORECASE)] if m), None)
+        salary = next((m[0] for p in [r'\$\d{1,3}(?:,\d{3})*(?:\.\d{2})?\s*-\s*\$\d{1,3}(?:,\d{3})*(?:\.\d{2})?']
+                       for m in [re.findall(p, text, re.IGNORECASE)] if m), None)
+        sections = {}
+        for name, keywords in [("requirements", ['requirement', 'qualification', 'must have', 'should have']),
+                               ("responsibilities", ['responsibility', 'duty', 'role', 'will']),
+                               ("benefits", ['benefit', 'perk', 'advantage', 'offer'])]:
+            sections[name] = [line.strip() for line in text.split('\n') if any(k in line.lower() for k in keywords)]
+        return title, location, salary, sections
+    
+    legacy_time = _timeit(lambda: [legacy_parse(posting) for posting in postings], repeat=1)
+    print(f"  previous parser:      {n_postings / legacy_time:.0f} postings/s")
+    
+    parser = JobParser()
+    for n_workers in workers:
+        elapsed = _timeit(lambda: sum(1 for _ in parser.parse_many(postings, workers=n_workers)), repeat=1)
+        print(f"  single pass, workers={n_workers}: {n_postings / elapsed:.0f} postings/s, {size_mb / elapsed:.1f} MB/s")
+
+def benchmark_salary_index(n_jobs=1000000, n_queries=200):
+    """Jobs paying at least X in location Y: sorted salary index vs scanning every job"""
+    from src.data_processing.salary import SalaryIndex
+    
+    rng = np.random.default_rng(17)
+    locations = [f"City {i}, ST" for i in range(200)] + ["Remote"]
+    mins = rng.integers(40, 250, n_jobs) * 1000
+    spreads = rng.integers(0, 60, n_jobs) * 1000
+    job_locations = rng.integers(0, len(locations), n_jobs)
+    jobs = [
+        {"id": str(i), "location": locations[job_locations[i]],
+         "salary_normalized": {"annual_min": float(mins[i]), "annual_max": float(mins[i] + spreads[i]), "currency": "USD"}}
+        for i in range(n_jobs)
+    ]
+    print(f"Salary index: {n_jobs} jobs in {len(locations)} locations, {n_queries} queries")
+    
+    start = time.perf_counter()
+    index = SalaryIndex.build(jobs)
+    print(f"  build:         {time.perf_counter() - start:.1f} s")
+    
+    queries = [(float(rng.integers(150, 300) * 1000), locations[rng.integers(len(locations))]) for _ in range(n_queries)]
+    scan_time = _timeit(lambda: [
+        [job["id"] for job in jobs if job["salary_normalized"]["annual_max"] >= floor and job["location"] == location]
+        for floor, location in queries[:20]
+    ], repeat=1) / 20
+    index_time = _timeit(lambda: [index.search(min_salary=floor, location=location) for floor, location in queries]) / n_queries
+    print(f"  linear scan:   {scan_time * 1000:.2f} ms/query")
+    print(f"  sorted index:  {index_time * 1000:.3f} ms/query ({scan_time / index_time:.0f}x)")
+
+def benchmark_api_load(concurrency_levels=(1, 4, 16, 64), requests_per_level=200):
+    """Requests/sec of /parse-resume under concurrency, and /health latency while it runs"""
+    import asyncio
+    import httpx
+    from src.api.main import app
+    
+    resume = ("Jane Doe\njane@example.com\n\nExperience\nSenior Engineer, Tech Corp, 2019 - 2024\n"
+              "Built Python services on AWS with Docker and Kubernetes.\n\nEducation\nBSc Computer Science\n" * 20).encode()
+    print(f"API load: {requests_per_level} /parse-resume requests per level, "
+          f"{app.state.executor.cpu_workers} parser processes")
+    
+    async def run_level(concurrency):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=300) as client:
+            gate = asyncio.Semaphore(concurrency)
+            statuses = []
+            
+            async def upload():
+                async with gate:
+                    response = await client.post("/api/v1/parse-resume", files={"file": ("resume.txt", resume, "text/plain")})
+                    statuses.append(response.status_code)
+            
+            async def probe_health(done):
+                latencies = []
+                while not done.is_set():
+                    start = time.perf_counter()
+                    await client.get("/health")
+                    latencies.append(time.perf_counter() - start)
+                    await asyncio.sleep(0.01)
+                return latencies
+            
+            done = asyncio.Event()
+            probe = asyncio.create_task(probe_health(done))
+            start = time.perf_counter()
+            await asyncio.gather(*[upload() for _ in range(requests_per_level)])
+            elapsed = time.perf_counter() - start
+            done.set()
+            latencies = sorted(await probe)
+            return statuses, elapsed, latencies
+    
+    # Start the worker processes and load the parser before timing
+    asyncio.run(run_level(1))
+    for concurrency in concurrency_levels:
+        statuses, elapsed, latencies = asyncio.run(run_level(concurrency))
+        ok = statuses.count(200)
+        p50 = latencies[len(latencies) // 2] * 1000 if latencies else 0.0
+        p99 = latencies[int(len(latencies) * 0.99)] * 1000 if latencies else 0.0
+        print(f"  concurrency={concurrency:<3} {ok / elapsed:.1f} req/s ({ok}/{len(statuses)} ok), "
+              f"/health p50 {p50:.1f} ms, p99 {p99:.1f} ms")
+    print(f"  lanes: {app.state.executor.stats()}")
+    app.state.executor.shutdown()
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HR Assistant components")
+    parser.add_argument("--all", action="store_true", help="Run all benchmarks")
+    parser.add_argument("--similarity", action="store_true", help="Benchmark embedding similarity search")
+    parser.add_argument("--ann", action="store_true", help="Benchmark ANN index recall vs latency")
+    parser.add_argument("--bm25", action="store_true", help="Benchmark BM25 top-k retrieval")
+    parser.add_argument("--skills", action="store_true", help="Benchmark skill extraction throughput")
+    parser.add_argument("--resume-parsing", action="store_true", help="Benchmark resume text extraction throughput")
+    parser.add_argument("--job-parsing", action="store_true", help="Benchmark job posting parse throughput")
+    parser.add_argument("--salary-index", action="store_true", help="Benchmark salary range queries")
+    parser.add_argument("--api-load", action="store_true", help="Load test the API's resume parsing route")
+    parser.add_argument("--ann-size", type=int, default=100000, help="Number of vectors for the ANN benchmark")
+    
+    args = parser.parse_args()
+    
+    if args.all or args.similarity:
+        benchmark_similarity()
+    
+    if args.all or args.ann:
+        benchmark_ann(n_vectors=args.ann_size)
+    
+    if args.all or args.bm25:
+        benchmark_bm25()
+    
+    if args.all or args.skills:
+        benchmark_skills()
+    
+    if args.all or args.resume_parsing:
+        benchmark_resume_parsing()
+    
+    if args.all or args.job_parsing:
+        benchmark_job_parsing()
+    
+    if args.all or args.salary_index:
+        benchmark_salary_index()
+    
+    if args.all or args.api_load:
+        benchmark_api_load()
+    
+    if not any([args.all, args.similarity, args.ann, args.bm25, args.skills, args.resume_parsing,
+                args.job_parsing, args.salary_index, args.api_load]):
+        print("No benchmarks specified. Use --help for options.")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
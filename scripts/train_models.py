@@ -4,9 +4,13 @@ Script to train ML models for the HR Assistant
 """
 
 import argparse
+from pathlib import Path
 from src.ml_models.ner_model import NERModel
 from src.ml_models.embedding_model import EmbeddingModel
 from src.ml_models.ranking_model import RankingModel
+from src.ml_models.ann_index import IVFIndex
+from src.data_processing.job_parser import JobParser
+from src.data_processing.salary import LocationIndex, SalaryIndex
 from src.utils.logger import setup_logging
 from src.utils.config import load_config
 
@@ -28,12 +32,41 @@ def train_ranking_model():
     # This would be implemented with actual training data
     print("Ranking model training complete")
 
+def build_job_index(jobs_dir="data/job_descriptions", index_path="models/job_index.npz",
+                    salary_index_path="models/salary_index.json", locations_path="models/job_locations.json"):
+    """Build the ANN index used for resume-to-job matching, and the salary and location data used to filter it"""
+    print("Building job matching index...")
+    job_files = sorted(Path(jobs_dir).glob("*.txt"))
+    if not job_files:
+        print(f"No job descriptions found in {jobs_dir}")
+        return
+    
+    texts = [path.read_text(encoding="utf-8") for path in job_files]
+    embedding_model = EmbeddingModel(cache_dir="models/embedding_cache")
+    embeddings = embedding_model.encode(texts)
+    
+    index = IVFIndex(embeddings.shape[1], n_lists=max(1, int(len(job_files) ** 0.5) * 2))
+    index.train(embeddings)
+    index.add([path.stem for path in job_files], embeddings)
+    Path(index_path).parent.mkdir(parents=True, exist_ok=True)
+    index.save(index_path)
+    print(f"Job matching index built with {len(index)} postings: {index_path}")
+    
+    jobs = [dict(job, id=path.stem) for path, job in zip(job_files, JobParser().parse_many(texts))]
+    salary_index = SalaryIndex.build(jobs)
+    salary_index.save(salary_index_path)
+    print(f"Salary index built with {len(salary_index)} postings with a stated salary: {salary_index_path}")
+    location_index = LocationIndex.build(jobs)
+    location_index.save(locations_path)
+    print(f"Location index built with {len(location_index)} postings with a stated location: {locations_path}")
+
 def main():
     parser = argparse.ArgumentParser(description="Train ML models for HR Assistant")
     parser.add_argument("--all", action="store_true", help="Train all models")
     parser.add_argument("--ner", action="store_true", help="Train NER model")
     parser.add_argument("--embedding", action="store_true", help="Train embedding model")
     parser.add_argument("--ranking", action="store_true", help="Train ranking model")
+    parser.add_argument("--job-index", action="store_true", help="Build job matching index")
     
     args = parser.parse_args()
     config = load_config()
@@ -48,7 +81,10 @@ def main():
     if args.all or args.ranking:
         train_ranking_model()
     
-    if not any([args.all, args.ner, args.embedding, args.ranking]):
+    if args.all or args.job_index:
+        build_job_index()
+    
+    if not any([args.all, args.ner, args.embedding, args.ranking, args.job_index]):
         print("No models specified for training. Use --help for options.")
 
 if __name__ == "__main__":
@@ -0,0 +1,149 @@
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional
+from fastapi import HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from src.data_processing.resume_parser import RESUME_EXTENSIONS
+from .executor import ExecutionLayer, parse_resume_cached
+from .uploads import spool_upload
+
+class BatchItem:
+    """One resume of a batch: its position in the request, and a file (with its SHA-256) or an error"""
+    
+    def __init__(self, item_id: int, filename: str, path: Optional[str] = None, error: Optional[str] = None,
+                 sha: Optional[str] = None):
+        self.item_id = item_id
+        self.filename = filename
+        self.path = path
+        self.error = error
+        self.sha = sha
+
+def _extract_zip(archive_path: str, directory: str, max_files: int, max_bytes: int) -> List[Dict[str, Any]]:
+    """Unpack resume members of a zip into `directory`, checking sizes before extracting"""
+    members = []
+    with zipfile.ZipFile(archive_path) as archive:
+        for info in archive.infolist():
+            if info.is_dir():
+                continue
+            if len(members) >= max_files:
+                raise HTTPException(status_code=413, detail=f"Batch exceeds {max_files} files")
+            
+            name = info.filename
+            if Path(name).suffix.lower() not in RESUME_EXTENSIONS:
+                members.append({"filename": name, "error": "Unsupported file type"})
+            elif info.file_size > max_bytes:
+                members.append({"filename": name, "error": f"File exceeds {max_bytes} bytes"})
+            else:
+                # Never use the member path on disk: names like ../../x must not escape the directory
+                fd, path = tempfile.mkstemp(prefix="batch-", suffix=Path(name).suffix.lower(), dir=directory)
+                sha256 = hashlib.sha256()
+                with os.fdopen(fd, "wb") as out, archive.open(info) as member:
+                    for chunk in iter(lambda: member.read(1024 * 1024), b""):
+                        sha256.update(chunk)
+                        out.write(chunk)
+                members.append({"filename": name, "path": path, "sha": sha256.hexdigest()})
+    return members
+
+async def collect_batch(files: List[UploadFile], directory: str, max_files: int, max_bytes: int,
+                        chunk_size: int) -> List[BatchItem]:
+    """Spool uploaded files (and the contents of uploaded zips) into `directory` as numbered items"""
+    items: List[BatchItem] = []
+    
+    def add(filename: str, path: Optional[str] = None, error: Optional[str] = None, sha: Optional[str] = None):
+        if len(items) >= max_files:
+            raise HTTPException(status_code=413, detail=f"Batch exceeds {max_files} files")
+        items.append(BatchItem(len(items), filename, path, error, sha))
+    
+    for file in files:
+        filename = file.filename or f"file-{len(items)}"
+        suffix = Path(filename).suffix.lower()
+        if suffix == ".zip":
+            # An archive may be larger than one resume, but not larger than the batch
+            archive_path = await spool_upload(file, max_bytes=max_bytes * max_files, chunk_size=chunk_size,
+                                              directory=directory)
+            try:
+                members = await run_in_threadpool(
+                    _extract_zip, archive_path, directory, max_files - len(items), max_bytes
+                )
+            except zipfile.BadZipFile:
+                add(filename, error="Not a valid zip archive")
+                continue
+            finally:
+                os.unlink(archive_path)
+            for member in members:
+                add(member["filename"], member.get("path"), member.get("error"), member.get("sha"))
+        elif suffix not in RESUME_EXTENSIONS:
+            add(filename, error="Unsupported file type")
+        else:
+            sha256 = hashlib.sha256()
+            try:
+                path = await spool_upload(file, max_bytes=max_bytes, chunk_size=chunk_size, directory=directory,
+                                          hasher=sha256)
+                add(filename, path, sha=sha256.hexdigest())
+            except HTTPException as e:
+                if e.status_code != 413:
+                    raise
+                add(filename, error=e.detail)
+    return items
+
+def _line(record: Dict[str, Any]) -> str:
+    return json.dumps(record, default=str) + "\n"
+
+async def stream_parse_results(executor: ExecutionLayer, items: List[BatchItem], directory: str,
+                               cache=None) -> AsyncIterator[str]:
+    """Parse items in the worker pool and yield one NDJSON line per resume as soon as it finishes.
+    
+    Lines arrive in completion order and carry the item's `id` (its position
+    in the request). The last line is a summary with counts and throughput.
+    Resumes already in `cache` (a ResumeCache) are answered without parsing.
+    At most `executor.cpu.limit` items of the batch are in flight, so a large
+    batch does not fill the shared queue and starve single-file requests.
+    The temp directory is removed when the stream ends or the client goes away.
+    """
+    start = time.perf_counter()
+    counts = {"succeeded": 0, "failed": 0}
+    in_flight = asyncio.Semaphore(executor.cpu.limit)
+    
+    async def parse(item: BatchItem) -> Dict[str, Any]:
+        record = {"id": item.item_id, "filename": item.filename}
+        if item.error is not None:
+            return dict(record, success=False, error=item.error)
+        async with in_flight:
+            item_start = time.perf_counter()
+            try:
+                data = await parse_resume_cached(executor, cache, item.path, item.sha)
+                record.update(success=True, data=data)
+            except HTTPException as e:
+                record.update(success=False, error=e.detail)
+            except Exception as e:
+                record.update(success=False, error=str(e))
+            finally:
+                Path(item.path).unlink(missing_ok=True)
+            record["elapsed_ms"] = round((time.perf_counter() - item_start) * 1000, 1)
+        return record
+    
+    tasks = [asyncio.ensure_future(parse(item)) for item in items]
+    try:
+        for finished in asyncio.as_completed(tasks):
+            record = await finished
+            counts["succeeded" if record["success"] else "failed"] += 1
+            yield _line(record)
+        
+        elapsed = time.perf_counter() - start
+        yield _line({"summary": dict(
+            counts,
+            total=len(items),
+            seconds=round(elapsed, 3),
+            resumes_per_second=round(len(items) / elapsed, 1) if elapsed else 0.0
+        )})
+    finally:
+        for task in tasks:
+            task.cancel()
+        shutil.rmtree(directory, ignore_errors=True)
@@ -0,0 +1,149 @@
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Optional
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+
+def parse_resume_file(file_path: str) -> Dict[str, Any]:
+    """Parse one resume inside a pool worker, loading the parser once per process"""
+    from src.data_processing.resume_parser import EnhancedResumeParser
+    from src.ml_models.model_registry import registry
+    return registry.get("resume_parser", EnhancedResumeParser).parse_resume(file_path)
+
+async def parse_resume_cached(executor: "ExecutionLayer", cache, file_path: str, sha: Optional[str] = None) -> Dict[str, Any]:
+    """Parse in the worker pool unless this content was parsed before.
+    
+    With a ResumeCache the file is moved into its content-addressed store, so
+    duplicate uploads keep one copy on disk and return the stored result.
+    """
+    if cache is None:
+        return await executor.run_cpu(parse_resume_file, file_path)
+    # Pinned: the pool worker opens stored_path later, after other uploads may have triggered eviction
+    sha, stored_path = await run_in_threadpool(cache.add_file, file_path, sha, True, True)
+    result = await run_in_threadpool(cache.get, sha)
+    if result is not None:
+        await run_in_threadpool(cache.unpin, sha)
+        return result
+    try:
+        result = await executor.run_cpu(parse_resume_file, stored_path)
+    except BaseException:
+        await run_in_threadpool(cache.unpin, sha)
+        raise
+    await run_in_threadpool(cache.put, sha, result)
+    return result
+
+class ConcurrencyLane:
+    """Caps how many jobs of one kind run at once and how many may wait.
+    
+    Jobs over `limit` queue on a semaphore; once `max_queue` are already
+    waiting, new jobs are refused with 503 instead of piling up latency.
+    """
+    
+    def __init__(self, name: str, limit: int, max_queue: int):
+        self.name = name
+        self.limit = limit
+        self.max_queue = max_queue
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.active = 0
+        self.waiting = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.max_waiting = 0
+        self._busy_seconds = 0.0
+        self._wait_seconds = 0.0
+    
+    async def run(self, job: Callable[[], Awaitable[Any]]) -> Any:
+        if self.waiting >= self.max_queue:
+            self.rejected += 1
+            raise HTTPException(status_code=503, detail=f"{self.name} queue is full, retry later")
+        if self._semaphore is None:
+            # Created lazily so it binds to the running event loop
+            self._semaphore = asyncio.Semaphore(self.limit)
+        
+        queued_at = time.perf_counter()
+        self.waiting += 1
+        self.max_waiting = max(self.max_waiting, self.waiting)
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        
+        started_at = time.perf_counter()
+        self._wait_seconds += started_at - queued_at
+        self.active += 1
+        try:
+            result = await job()
+            self.completed += 1
+            return result
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.active -= 1
+            self._busy_seconds += time.perf_counter() - started_at
+            self._semaphore.release()
+    
+    def stats(self) -> Dict[str, Any]:
+        finished = self.completed + self.failed
+        return {
+            "limit": self.limit,
+            "active": self.active,
+            "queue_depth": self.waiting,
+            "max_queue_depth": self.max_waiting,
+            "max_queue": self.max_queue,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "avg_wait_ms": round(self._wait_seconds / finished * 1000, 1) if finished else 0.0,
+            "avg_run_ms": round(self._busy_seconds / finished * 1000, 1) if finished else 0.0
+        }
+
+class ExecutionLayer:
+    """Runs blocking route work off the event loop.
+    
+    CPU-bound work (resume parsing) goes to a process pool, so it neither
+    blocks the loop nor contends for the GIL. I/O-bound LLM calls stay on the
+    loop as coroutines (`ainvoke`). Each kind has its own ConcurrencyLane.
+    """
+    
+    def __init__(self, cpu_workers: int = 2, cpu_concurrency: Optional[int] = None,
+                 llm_concurrency: int = 8, max_queue: int = 64):
+        self.cpu_workers = cpu_workers
+        self.cpu = ConcurrencyLane("cpu", cpu_concurrency or cpu_workers, max_queue)
+        self.llm = ConcurrencyLane("llm", llm_concurrency, max_queue)
+        self._pool: Optional[ProcessPoolExecutor] = None
+    
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "ExecutionLayer":
+        return cls(
+            cpu_workers=config.get('cpu_workers', 2),
+            cpu_concurrency=config.get('cpu_concurrency'),
+            llm_concurrency=config.get('llm_concurrency', 8),
+            max_queue=config.get('max_queue', 64)
+        )
+    
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        """Worker processes, started on first CPU job"""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.cpu_workers)
+        return self._pool
+    
+    async def run_cpu(self, func: Callable[..., Any], *args) -> Any:
+        """Run a picklable function in the process pool"""
+        loop = asyncio.get_running_loop()
+        return await self.cpu.run(lambda: loop.run_in_executor(self.pool, func, *args))
+    
+    async def run_llm(self, coroutine_factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Await an LLM coroutine within the LLM concurrency limit"""
+        return await self.llm.run(coroutine_factory)
+    
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {"cpu": dict(self.cpu.stats(), workers=self.cpu_workers), "llm": self.llm.stats()}
+    
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
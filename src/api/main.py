@@ -1,7 +1,12 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from .routes import router as api_router
+from .executor import ExecutionLayer
+from .uploads import UploadLimitMiddleware, DEFAULT_CHUNK_SIZE
+from src.data_processing.resume_cache import ResumeCache
+from src.data_processing.resume_parser import EnhancedResumeParser
 from src.utils.config import load_config
+from src.ml_models.model_registry import registry
 
 def create_app():
     """Create FastAPI application"""
@@ -22,9 +27,39 @@ def create_app():
         allow_headers=["*"],
     )
     
+    # Upload size is checked from Content-Length before the body is read, and again while it is copied
+    api_config = config['api']
+    max_upload_bytes = int(api_config.get('max_upload_mb', 10) * 1024 * 1024)
+    max_batch_bytes = int(api_config.get('max_batch_upload_mb', 500) * 1024 * 1024)
+    app.add_middleware(
+        UploadLimitMiddleware,
+        max_bytes=max_upload_bytes,
+        path_limits={"/api/v1/parse-resumes": max_batch_bytes}
+    )
+    app.state.upload_limits = {
+        "max_bytes": max_upload_bytes,
+        "chunk_size": int(api_config.get('upload_chunk_kb', DEFAULT_CHUNK_SIZE // 1024) * 1024)
+    }
+    app.state.max_batch_files = api_config.get('max_batch_files', 1000)
+    
+    # Parsing runs in worker processes and LLM calls are awaited, each under its own concurrency limit
+    app.state.executor = ExecutionLayer.from_config(api_config.get('executor', {}))
+    
+    @app.on_event("shutdown")
+    async def shutdown_executor():
+        app.state.executor.shutdown()
+    
+    # Duplicate uploads are answered from the parse cache and stored once under storage.resumes
+    app.state.resume_cache = ResumeCache.from_config(config, parser_version=EnhancedResumeParser.VERSION)
+    
     # Include routers
     app.include_router(api_router, prefix="/api/v1")
     
+    if config.get('models', {}).get('warm_on_startup', False):
+        @app.on_event("startup")
+        async def warm_models():
+            registry.warm(config['models'].get('warm', None))
+    
     return app
 
 app = create_app()
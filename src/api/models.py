@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 class ResumeParseRequest(BaseModel):
@@ -27,6 +27,13 @@ class HealthResponse(BaseModel):
     status: str
     timestamp: str
 
+class ModelStatusResponse(BaseModel):
+    models: Dict[str, Dict[str, Any]]
+
+class ExecutorStatusResponse(BaseModel):
+    lanes: Dict[str, Dict[str, Any]]
+    resume_cache: Optional[Dict[str, Any]] = None
+
 class ErrorResponse(BaseModel):
     error: str
     details: Optional[str] = None
\ No newline at end of file
@@ -1,30 +1,59 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException
+import hashlib
+import shutil
+import tempfile
+from typing import List
+from fastapi import APIRouter, UploadFile, File, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from src.data_processing.resume_parser import EnhancedResumeParser
+from src.ml_models.model_registry import registry
 from agents.jd_agent import JDAgent
 from .models import *
+from .batch import collect_batch, stream_parse_results
+from .executor import parse_resume_cached
+from .uploads import spooled_upload
 
 router = APIRouter()
-resume_parser = EnhancedResumeParser()
-jd_agent = JDAgent()
+
+# Built on first request and shared with the Streamlit portal through the registry
+registry.register("resume_parser", EnhancedResumeParser)
+registry.register("jd_agent", JDAgent)
 
 @router.post("/parse-resume", response_model=ResumeParseResponse)
-async def parse_resume(file: UploadFile = File(...)):
+async def parse_resume(request: Request, file: UploadFile = File(...)):
     """Parse a resume file"""
     try:
-        # Save uploaded file temporarily
-        file_path = f"/tmp/{file.filename}"
-        with open(file_path, "wb") as f:
-            f.write(await file.read())
-        
-        # Parse resume
-        result = resume_parser.parse_resume(file_path)
+        # Stream the upload to its own temp file (hashing it on the way), then parse it in a worker process
+        sha256 = hashlib.sha256()
+        async with spooled_upload(file, hasher=sha256, **request.app.state.upload_limits) as file_path:
+            result = await parse_resume_cached(
+                request.app.state.executor, request.app.state.resume_cache, file_path, sha256.hexdigest()
+            )
         return ResumeParseResponse(success=True, data=result)
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/parse-resumes")
+async def parse_resumes(request: Request, files: List[UploadFile] = File(...)):
+    """Parse many resumes (files and/or zip archives), streaming one NDJSON line per resume"""
+    directory = tempfile.mkdtemp(prefix="resume-batch-")
+    try:
+        items = await collect_batch(files, directory, max_files=request.app.state.max_batch_files,
+                                    **request.app.state.upload_limits)
+    except BaseException:
+        shutil.rmtree(directory, ignore_errors=True)
+        raise
+    
+    return StreamingResponse(
+        stream_parse_results(request.app.state.executor, items, directory, request.app.state.resume_cache),
+        media_type="application/x-ndjson"
+    )
+
 @router.post("/generate-job-description", response_model=JobDescriptionResponse)
-async def generate_job_description(request: JobDescriptionRequest):
+async def generate_job_description(request: JobDescriptionRequest, http_request: Request):
     """Generate a job description"""
     try:
         state = {
@@ -35,12 +64,30 @@ async def generate_job_description(request: JobDescriptionRequest):
             "company_info": {}
         }
         
-        result = jd_agent.generate_jd(state)
+        # The first call builds the agent (blocking); the LLM call itself is awaited natively
+        agent = await run_in_threadpool(registry.get, "jd_agent")
+        result = await http_request.app.state.executor.run_llm(lambda: agent.agenerate_jd(state))
         return JobDescriptionResponse(success=True, job_description=result)
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/models", response_model=ModelStatusResponse)
+async def model_status():
+    """Load state and load time of each shared model"""
+    return ModelStatusResponse(models=registry.stats())
+
+@router.get("/executor", response_model=ExecutorStatusResponse)
+async def executor_status(request: Request):
+    """Concurrency, queue depth and latency of the CPU and LLM work lanes"""
+    cache = request.app.state.resume_cache
+    return ExecutorStatusResponse(
+        lanes=request.app.state.executor.stats(),
+        resume_cache=cache.stats() if cache is not None else None
+    )
+
 @router.get("/health", response_model=HealthResponse)
 async def health():
     """Health check endpoint"""
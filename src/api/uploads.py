@@ -0,0 +1,76 @@
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Dict, Optional
+from fastapi import HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from starlette.responses import PlainTextResponse
+
+DEFAULT_MAX_UPLOAD_BYTES = 10 * 1024 * 1024
+DEFAULT_CHUNK_SIZE = 256 * 1024
+
+class UploadLimitMiddleware:
+    """Rejects request bodies whose declared Content-Length is over the limit.
+    
+    Runs before the multipart form is parsed, so an oversized upload is
+    refused without being spooled to disk first. Bodies sent without a
+    Content-Length are still capped while they are copied (see spool_upload).
+    `path_limits` gives individual routes (e.g. batch uploads) their own limit.
+    """
+    
+    def __init__(self, app, max_bytes: int = DEFAULT_MAX_UPLOAD_BYTES, path_limits: Optional[Dict[str, int]] = None):
+        self.app = app
+        self.max_bytes = max_bytes
+        self.path_limits = path_limits or {}
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            max_bytes = self.path_limits.get(scope.get("path"), self.max_bytes)
+            for name, value in scope.get("headers", []):
+                if name == b"content-length" and value.isdigit() and int(value) > max_bytes:
+                    response = PlainTextResponse("Upload too large", status_code=413)
+                    await response(scope, receive, send)
+                    return
+        await self.app(scope, receive, send)
+
+async def spool_upload(file: UploadFile, max_bytes: int = DEFAULT_MAX_UPLOAD_BYTES,
+                       chunk_size: int = DEFAULT_CHUNK_SIZE, directory: Optional[str] = None, hasher=None) -> str:
+    """Copy an upload to a new, uniquely named temp file in chunks; returns its path.
+    
+    Only the file's extension is kept from the client's filename, so concurrent
+    uploads of "resume.pdf" never overwrite each other. Raises 413 as soon as
+    the copied size passes `max_bytes`. A hashlib object passed as `hasher` is
+    fed every chunk, so the content hash comes without a second read.
+    """
+    if file.size is not None and file.size > max_bytes:
+        raise HTTPException(status_code=413, detail=f"File exceeds {max_bytes} bytes")
+    
+    suffix = Path(file.filename or "").suffix.lower()
+    fd, path = tempfile.mkstemp(prefix="upload-", suffix=suffix, dir=directory)
+    written = 0
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while True:
+                chunk = await file.read(chunk_size)
+                if not chunk:
+                    break
+                written += len(chunk)
+                if written > max_bytes:
+                    raise HTTPException(status_code=413, detail=f"File exceeds {max_bytes} bytes")
+                if hasher is not None:
+                    hasher.update(chunk)
+                await run_in_threadpool(out.write, chunk)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return path
+
+@asynccontextmanager
+async def spooled_upload(file: UploadFile, **limits) -> AsyncIterator[str]:
+    """spool_upload that removes the temp file when the block exits (unless it was moved away)"""
+    path = await spool_upload(file, **limits)
+    try:
+        yield path
+    finally:
+        Path(path).unlink(missing_ok=True)
@@ -1,93 +1,168 @@
+import multiprocessing
 import re
-from typing import Dict, List, Any
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
+from .salary import normalize_salary
+
+SECTIONS = ("requirements", "responsibilities", "benefits")
+
+# A line that is only a section name ("Requirements:", "What we offer") starts that section
+SECTION_HEADER_PATTERN = re.compile(
+    r"^(?:#+\s*)?(?:"
+    r"(?P<requirements>requirements|qualifications|what you(?:'ll)? need|what we(?:'re)? looking for|skills|must haves?)|"
+    r"(?P<responsibilities>responsibilities|duties|what you(?:'ll)? do|the role|your role|key responsibilities)|"
+    r"(?P<benefits>benefits|perks|what we offer|why join us|compensation(?: and| &) benefits)|"
+    r"(?P<other>about (?:us|the company|the team)|description|summary|overview|how to apply)"
+    r")\s*:?$",
+    re.IGNORECASE
+)
+# Longest line treated as a possible section header
+MAX_HEADER_LENGTH = 40
+# Keywords that put any line into a section, wherever it appears; substring tests on the
+# lowercased line beat a regex alternation here
+SECTION_KEYWORDS = (
+    ("requirements", ('requirement', 'qualification', 'must have', 'should have')),
+    ("responsibilities", ('responsibility', 'duty', 'role', 'will')),
+    ("benefits", ('benefit', 'perk', 'advantage', 'offer'))
+)
+BULLET_STARTS = set("-*•·▪◦‣0123456789")
+BULLET_PATTERN = re.compile(r"^(?:[-*•·▪◦‣]|\d{1,2}[.)])\s+")
+COMPANY_PATTERN = re.compile(r"^(?:company|employer|organi[sz]ation)\s*:\s*(.+)$", re.IGNORECASE)
+LOCATION_PATTERNS = [
+    re.compile(r'\b(?:remote|hybrid|onsite)\b', re.IGNORECASE),
+    re.compile(r'\b[A-Z][a-z]+,\s*[A-Z]{2}\b', re.IGNORECASE),
+    re.compile(r'\b(?:san francisco|new york|los angeles|chicago|austin)\b', re.IGNORECASE)
+]
+SALARY_PATTERNS = [
+    re.compile(r'\$\d{1,3}(?:,\d{3})*(?:\.\d{2})?\s*-\s*\$\d{1,3}(?:,\d{3})*(?:\.\d{2})?', re.IGNORECASE),
+    re.compile(r'\$\d{1,3}(?:,\d{3})*(?:\.\d{2})?\s*(?:per year|annually|annual)', re.IGNORECASE),
+    re.compile(r'\$\d{1,3}(?:,\d{3})*(?:\.\d{2})?\s*(?:per hour|hourly)', re.IGNORECASE)
+]
+
+def _first_match(patterns: List["re.Pattern"], text: str) -> Optional[str]:
+    for pattern in patterns:
+        match = pattern.search(text)
+        if match:
+            return match.group(0)
+    return None
+
+_worker_parser: Optional["JobParser"] = None
+
+def _parse_in_worker(text: str) -> Dict[str, Any]:
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = JobParser()
+    return _worker_parser.parse_job_description(text)
 
 class JobParser:
+    """Parses job postings in one pass over their lines.
+    
+    Each line is stripped and lowercased once and classified against every
+    section: a short header line ("Benefits:") attributes the lines below it
+    to that section until the next header, and a line anywhere that mentions
+    a section keyword is added to that section as well. Location and salary
+    use module-level precompiled patterns.
+    
+    The line pass of the last posting is kept, so reading several fields of
+    one posting with the extract_* accessors scans it once and skips the
+    location and salary patterns.
+    """
+    
     def __init__(self):
-        pass
+        self._last_scan: Optional[Tuple[str, Dict[str, Any]]] = None
+    
+    def _scan_lines(self, text: str) -> Dict[str, Any]:
+        """Title, company and sections from one pass over the lines, remembered for the last text"""
+        last = self._last_scan
+        if last is not None and last[0] == text:
+            return last[1]
+        
+        title = None
+        company = None
+        sections: Dict[str, List[str]] = {name: [] for name in SECTIONS}
+        current = None
+        
+        for raw_line in text.split('\n'):
+            line = raw_line.strip()
+            if not line:
+                continue
+            if title is None and len(line) < 100:
+                title = line
+            
+            if len(line) <= MAX_HEADER_LENGTH:
+                header = SECTION_HEADER_PATTERN.match(line)
+                if header:
+                    current = header.lastgroup if header.lastgroup in sections else None
+                    continue
+            
+            if company is None and ':' in line:
+                labelled = COMPANY_PATTERN.match(line)
+                if labelled:
+                    company = labelled.group(1).strip()
+            
+            item = BULLET_PATTERN.sub("", line) if line[0] in BULLET_STARTS else line
+            lowered = line.lower()
+            for name, keywords in SECTION_KEYWORDS:
+                if name == current or any(keyword in lowered for keyword in keywords):
+                    sections[name].append(item)
+        
+        scan = {"title": title or "Unknown Position", "company": company or "Unknown Company", "sections": sections}
+        self._last_scan = (text, scan)
+        return scan
     
     def parse_job_description(self, text: str) -> Dict[str, Any]:
         """Parse job description text into structured data"""
+        scan = self._scan_lines(text)
+        sections = scan["sections"]
         return {
-            "title": self.extract_title(text),
-            "company": self.extract_company(text),
+            "title": scan["title"],
+            "company": scan["company"],
             "location": self.extract_location(text),
             "salary": self.extract_salary(text),
-            "requirements": self.extract_requirements(text),
-            "responsibilities": self.extract_responsibilities(text),
-            "benefits": self.extract_benefits(text)
+            "salary_normalized": normalize_salary(text),
+            "requirements": list(sections["requirements"]),
+            "responsibilities": list(sections["responsibilities"]),
+            "benefits": list(sections["benefits"])
         }
     
+    def parse_many(self, texts: Iterable[str], workers: int = 1, chunksize: int = 64) -> Iterator[Dict[str, Any]]:
+        """Parse a stream of postings lazily, in input order.
+        
+        With workers > 1 the postings are parsed in a process pool, `chunksize`
+        postings per task. The feed is consumed a window of a few chunks per
+        worker at a time, so a large feed is never held in memory at once.
+        """
+        if workers <= 1:
+            for text in texts:
+                yield self.parse_job_description(text)
+            return
+        
+        texts = iter(texts)
+        window = workers * chunksize * 4
+        with multiprocessing.Pool(workers) as pool:
+            while True:
+                batch = list(islice(texts, window))
+                if not batch:
+                    return
+                yield from pool.imap(_parse_in_worker, batch, chunksize)
+    
     def extract_title(self, text: str) -> str:
-        # Simple title extraction
-        lines = text.split('\n')
-        for line in lines:
-            if line.strip() and len(line.strip()) < 100:
-                return line.strip()
-        return "Unknown Position"
+        return self._scan_lines(text)["title"]
     
     def extract_company(self, text: str) -> str:
-        # Placeholder for company extraction
-        return "Unknown Company"
+        return self._scan_lines(text)["company"]
     
     def extract_location(self, text: str) -> str:
-        # Simple location pattern matching
-        patterns = [
-            r'\b(?:remote|hybrid|onsite)\b',
-            r'\b[A-Z][a-z]+,\s*[A-Z]{2}\b',
-            r'\b(?:san francisco|new york|los angeles|chicago|austin)\b'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                return matches[0]
-        
-        return "Location not specified"
+        return _first_match(LOCATION_PATTERNS, text) or "Location not specified"
     
     def extract_salary(self, text: str) -> str:
-        # Salary pattern matching
-        patterns = [
-            r'\$\d{1,3}(?:,\d{3})*(?:\.\d{2})?\s*-\s*\$\d{1,3}(?:,\d{3})*(?:\.\d{2})?',
-            r'\$\d{1,3}(?:,\d{3})*(?:\.\d{2})?\s*(?:per year|annually|annual)',
-            r'\$\d{1,3}(?:,\d{3})*(?:\.\d{2})?\s*(?:per hour|hourly)'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                return matches[0]
-        
-        return "Salary not specified"
+        return _first_match(SALARY_PATTERNS, text) or "Salary not specified"
     
     def extract_requirements(self, text: str) -> List[str]:
-        # Simple requirement extraction
-        requirements = []
-        lines = text.split('\n')
-        
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['requirement', 'qualification', 'must have', 'should have']):
-                requirements.append(line.strip())
-        
-        return requirements
+        return list(self._scan_lines(text)["sections"]["requirements"])
     
     def extract_responsibilities(self, text: str) -> List[str]:
-        # Simple responsibility extraction
-        responsibilities = []
-        lines = text.split('\n')
-        
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['responsibility', 'duty', 'role', 'will']):
-                responsibilities.append(line.strip())
-        
-        return responsibilities
+        return list(self._scan_lines(text)["sections"]["responsibilities"])
     
     def extract_benefits(self, text: str) -> List[str]:
-        # Simple benefits extraction
-        benefits = []
-        lines = text.split('\n')
-        
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['benefit', 'perk', 'advantage', 'offer']):
-                benefits.append(line.strip())
-        
-        return benefits
\ No newline at end of file
+        return list(self._scan_lines(text)["sections"]["benefits"])
\ No newline at end of file
@@ -0,0 +1,237 @@
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+HASH_CHUNK_SIZE = 1024 * 1024
+# How long a file added for parsing is protected from eviction if its result never arrives
+PIN_SECONDS = 600
+
+def file_digest(path: str) -> str:
+    """SHA-256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class ResumeCache:
+    """Content-addressed resume files plus their parse results, bounded with LRU eviction.
+    
+    Each distinct file is stored once as `<root>/<sha[:2]>/<sha><ext>`, whatever
+    name it was uploaded under. Parse results are keyed by (sha, parser version),
+    so bumping the parser version invalidates them without touching the files.
+    When files and results together exceed `max_bytes`, the least recently used
+    files are deleted along with their results. The index is a SQLite database,
+    so the API workers and the Streamlit app can share one cache.
+    
+    A file added with `pin=True` is skipped by eviction until its result is
+    put (or `pin_seconds` pass), since it may be parsed in another process
+    after add_file returns.
+    """
+    
+    def __init__(self, root: str = "data/raw_resumes", index_path: str = "data/processed_resumes/resume_cache.db",
+                 max_bytes: int = 2 * 1024 ** 3, parser_version: str = "1", pin_seconds: float = PIN_SECONDS):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.index_path = Path(index_path)
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.parser_version = parser_version
+        self.pin_seconds = pin_seconds
+        self.hits = 0
+        self.misses = 0
+        self._conn = sqlite3.connect(str(self.index_path), check_same_thread=False, timeout=30)
+        self._lock = threading.Lock()
+        self._create_schema()
+    
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], parser_version: str = "1") -> Optional["ResumeCache"]:
+        """Cache described by the resume_cache section, or None when it is disabled"""
+        cache_config = config.get('resume_cache', {})
+        if not cache_config.get('enabled', True):
+            return None
+        return cls(
+            root=config.get('storage', {}).get('resumes', "data/raw_resumes"),
+            index_path=cache_config.get('index_path', "data/processed_resumes/resume_cache.db"),
+            max_bytes=int(cache_config.get('max_mb', 2048) * 1024 * 1024),
+            parser_version=parser_version
+        )
+    
+    def _create_schema(self):
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS resume_files (
+                    sha TEXT PRIMARY KEY,
+                    path TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_used REAL NOT NULL,
+                    pinned_until REAL NOT NULL DEFAULT 0
+                )
+            """)
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(resume_files)")}
+            if "pinned_until" not in columns:
+                self._conn.execute("ALTER TABLE resume_files ADD COLUMN pinned_until REAL NOT NULL DEFAULT 0")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_resume_files_lru ON resume_files(last_used)")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS resume_results (
+                    sha TEXT NOT NULL,
+                    parser_version TEXT NOT NULL,
+                    result TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    PRIMARY KEY (sha, parser_version)
+                )
+            """)
+    
+    def stored_path(self, sha: str, suffix: str = "") -> Path:
+        return self.root / sha[:2] / f"{sha}{suffix.lower()}"
+    
+    def add_file(self, source_path: str, sha: Optional[str] = None, move: bool = False,
+                 pin: bool = False) -> Tuple[str, str]:
+        """Store a file under its content hash; returns (sha, stored path).
+        
+        A file already stored is not written again. With `move`, the source is
+        consumed (renamed into place, or deleted if it was a duplicate). With
+        `pin`, the file is not evicted until put() stores its result or unpin().
+        """
+        sha = sha or file_digest(source_path)
+        now = time.time()
+        pinned_until = now + self.pin_seconds if pin else 0
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT path FROM resume_files WHERE sha = ?", (sha,)).fetchone()
+            if row is not None and Path(row[0]).exists():
+                self._conn.execute(
+                    "UPDATE resume_files SET last_used = ?, pinned_until = MAX(pinned_until, ?) WHERE sha = ?",
+                    (now, pinned_until, sha)
+                )
+                if move:
+                    os.unlink(source_path)
+                return sha, row[0]
+            
+            target = self.stored_path(sha, Path(source_path).suffix)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if move:
+                shutil.move(source_path, target)
+            else:
+                # Copy next to the target and rename, so readers never see a partial file
+                fd, tmp_path = tempfile.mkstemp(dir=target.parent, suffix=".part")
+                with os.fdopen(fd, "wb") as out, open(source_path, "rb") as source:
+                    shutil.copyfileobj(source, out)
+                os.replace(tmp_path, target)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO resume_files (sha, path, size, last_used, pinned_until) VALUES (?, ?, ?, ?, ?)",
+                (sha, str(target), target.stat().st_size, now, pinned_until)
+            )
+            self._evict(keep=sha)
+        return sha, str(target)
+    
+    def add_bytes(self, content: bytes, filename: str) -> Tuple[str, str]:
+        """add_file for in-memory content, e.g. a Streamlit upload"""
+        sha = hashlib.sha256(content).hexdigest()
+        target = self.stored_path(sha, Path(filename).suffix)
+        if not target.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=target.parent, suffix=Path(filename).suffix.lower())
+            with os.fdopen(fd, "wb") as out:
+                out.write(content)
+            return self.add_file(tmp_path, sha, move=True)
+        return self.add_file(str(target), sha)
+    
+    def get(self, sha: str) -> Optional[Dict[str, Any]]:
+        """Cached parse result of a file for the current parser version"""
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT result FROM resume_results WHERE sha = ? AND parser_version = ?", (sha, self.parser_version)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._conn.execute("UPDATE resume_files SET last_used = ? WHERE sha = ?", (time.time(), sha))
+        return json.loads(row[0])
+    
+    def put(self, sha: str, result: Dict[str, Any]):
+        payload = json.dumps(result, default=str)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO resume_results (sha, parser_version, result, size) VALUES (?, ?, ?, ?)",
+                (sha, self.parser_version, payload, len(payload))
+            )
+            self._conn.execute("UPDATE resume_files SET pinned_until = 0 WHERE sha = ?", (sha,))
+            self._evict(keep=sha)
+    
+    def unpin(self, sha: str):
+        """Release a pinned file whose parse failed, so it can be evicted again"""
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE resume_files SET pinned_until = 0 WHERE sha = ?", (sha,))
+            self._evict()
+    
+    def get_or_parse(self, path: str, parse: Callable[[str], Dict[str, Any]], sha: Optional[str] = None) -> Dict[str, Any]:
+        """Store the file, and parse it only if this content was never parsed by this parser version"""
+        sha, stored = self.add_file(path, sha, pin=True)
+        result = self.get(sha)
+        if result is not None:
+            self.unpin(sha)
+            return result
+        try:
+            result = parse(stored)
+        except Exception:
+            self.unpin(sha)
+            raise
+        self.put(sha, result)
+        return result
+    
+    def _total_bytes(self) -> int:
+        files = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM resume_files").fetchone()[0]
+        results = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM resume_results").fetchone()[0]
+        return files + results
+    
+    def _evict(self, keep: Optional[str] = None):
+        # Called with the lock held, inside a transaction; `keep` is the entry being added
+        excess = self._total_bytes() - self.max_bytes
+        if excess <= 0:
+            return
+        # Pinned files are still waiting for a parse, possibly in another process
+        for sha, path, size in self._conn.execute(
+            "SELECT sha, path, size FROM resume_files WHERE pinned_until <= ? ORDER BY last_used", (time.time(),)
+        ).fetchall():
+            if excess <= 0:
+                break
+            if sha == keep:
+                continue
+            result_bytes = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM resume_results WHERE sha = ?", (sha,)
+            ).fetchone()[0]
+            self._conn.execute("DELETE FROM resume_results WHERE sha = ?", (sha,))
+            self._conn.execute("DELETE FROM resume_files WHERE sha = ?", (sha,))
+            Path(path).unlink(missing_ok=True)
+            excess -= size + result_bytes
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            files = self._conn.execute("SELECT COUNT(*) FROM resume_files").fetchone()[0]
+            results = self._conn.execute(
+                "SELECT COUNT(*) FROM resume_results WHERE parser_version = ?", (self.parser_version,)
+            ).fetchone()[0]
+            total = self._total_bytes()
+        lookups = self.hits + self.misses
+        return {
+            "files": files,
+            "results": results,
+            "bytes": total,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0
+        }
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,275 @@
+import mmap
+import multiprocessing
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from .skill_matcher import SkillMatcher, get_default_matcher
+
+RESUME_EXTENSIONS = (".pdf", ".docx", ".txt")
+
+# Section headers: a short line made of one of these phrases, optionally followed by a colon
+SECTION_PATTERN = re.compile(
+    r"^\s*(?:"
+    r"(?P<education>education|academic background|academic qualifications|qualifications)|"
+    r"(?P<experience>(?:work |professional )?experience|employment(?: history)?|work history|career history)|"
+    r"(?P<skills>(?:technical |core )?skills|core competencies|technologies)|"
+    r"(?P<other>summary|profile|objective|projects|certifications|awards|publications|interests|references|languages)"
+    r")\s*:?\s*$",
+    re.IGNORECASE
+)
+MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?"
+YEAR = r"(?:19|20)\d{2}"
+DATE_RANGE_PATTERN = re.compile(
+    rf"(?:{MONTH}\s+)?(?P<start>{YEAR})\s*(?:-|–|—|to)\s*(?:(?:{MONTH}\s+)?(?P<end>{YEAR})|(?P<current>present|current|now))",
+    re.IGNORECASE
+)
+STATED_YEARS_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\+?\s*years?\s+(?:of\s+)?(?:professional\s+)?experience", re.IGNORECASE)
+DEGREE_PATTERN = re.compile(
+    r"\b(?:bachelor|master|doctorate|ph\.?\s?d|mba|b\.?\s?sc|m\.?\s?sc|b\.?\s?tech|m\.?\s?tech|b\.?a\.|m\.?a\.|"
+    r"b\.?s\.|m\.?s\.|associate(?:'s)? degree|diploma)",
+    re.IGNORECASE
+)
+INSTITUTION_PATTERN = re.compile(r"\b(?:university|college|institute|school|academy)\b", re.IGNORECASE)
+EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+PHONE_PATTERN = re.compile(r"(?:\+?\d{1,3}[\s.-]?)?(?:\(\d{2,4}\)|\d{2,4})[\s.-]?\d{3,4}[\s.-]?\d{3,4}")
+ENTRY_SEPARATORS = " \t|,-–—:()"
+
+def _mapped(path: str):
+    """Read-only memory map of a file; None for an empty file, which cannot be mapped"""
+    with open(path, "rb") as f:
+        if f.seek(0, 2) == 0:
+            return None
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+def iter_txt_pages(path: str) -> Iterator[str]:
+    """Pages of a text file, split on form feeds, decoded one page at a time"""
+    mapped = _mapped(path)
+    if mapped is None:
+        return
+    with mapped:
+        start = 0
+        while start < len(mapped):
+            end = mapped.find(b"\f", start)
+            if end == -1:
+                end = len(mapped)
+            yield mapped[start:end].decode("utf-8", errors="replace")
+            start = end + 1
+
+def iter_pdf_pages(path: str) -> Iterator[str]:
+    """Text of each PDF page, extracted only when the page is reached"""
+    from PyPDF2 import PdfReader
+    
+    mapped = _mapped(path)
+    if mapped is None:
+        return
+    with mapped:
+        for page in PdfReader(mapped).pages:
+            yield page.extract_text() or ""
+
+def iter_docx_pages(path: str) -> Iterator[str]:
+    """Text of a DOCX body in document order, split at explicit page breaks; table rows become lines"""
+    from docx import Document
+    from docx.table import Table
+    from docx.text.paragraph import Paragraph
+    
+    mapped = _mapped(path)
+    if mapped is None:
+        return
+    with mapped:
+        document = Document(mapped)
+        lines: List[str] = []
+        for child in document.element.body.iterchildren():
+            tag = child.tag.rsplit("}", 1)[-1]
+            if tag == "p":
+                if lines and child.xpath('.//w:br[@w:type="page"]'):
+                    yield "\n".join(lines)
+                    lines = []
+                lines.append(Paragraph(child, document).text)
+            elif tag == "tbl":
+                for row in Table(child, document).rows:
+                    lines.append(" | ".join(cell.text for cell in row.cells))
+        if lines:
+            yield "\n".join(lines)
+
+PAGE_READERS = {".pdf": iter_pdf_pages, ".docx": iter_docx_pages, ".txt": iter_txt_pages}
+
+class _ResumeFields:
+    """Accumulates parsed fields while lines stream past; each line is looked at once"""
+    
+    def __init__(self, skill_matcher: SkillMatcher, current_year: int):
+        self.skill_matcher = skill_matcher
+        self.current_year = current_year
+        self.section: Optional[str] = None
+        self.previous_line = ""
+        self.name: Optional[str] = None
+        self.email: Optional[str] = None
+        self.phone: Optional[str] = None
+        self.skills = {category: [] for category in skill_matcher.taxonomy}
+        self.education: List[str] = []
+        self.experience: List[Dict[str, Any]] = []
+        self.stated_years: Optional[float] = None
+        self.pages = 0
+        self.words = 0
+    
+    def add_page(self, text: str):
+        self.pages += 1
+        for category, skills in self.skill_matcher.extract(text).items():
+            known = self.skills[category]
+            known.extend(skill for skill in skills if skill not in known)
+        for line in text.splitlines():
+            self.add_line(line.strip())
+    
+    def add_line(self, line: str):
+        if not line:
+            return
+        self.words += len(line.split())
+        
+        header = SECTION_PATTERN.match(line)
+        if header:
+            self.section = header.lastgroup
+            self.previous_line = ""
+            return
+        
+        if self.email is None:
+            email = EMAIL_PATTERN.search(line)
+            if email:
+                self.email = email.group(0)
+        if self.phone is None:
+            phone = PHONE_PATTERN.search(line)
+            if phone and sum(ch.isdigit() for ch in phone.group(0)) >= 7:
+                self.phone = phone.group(0).strip()
+        # The name is a short line in the header block, before the first section
+        if self.name is None and self.section is None and self.pages == 1 and len(line) <= 60 \
+                and not any(ch.isdigit() or ch == "@" for ch in line):
+            self.name = line
+        
+        if self.stated_years is None:
+            stated = STATED_YEARS_PATTERN.search(line)
+            if stated:
+                self.stated_years = float(stated.group(1))
+        
+        if self.section == "education":
+            if DEGREE_PATTERN.search(line) or INSTITUTION_PATTERN.search(line):
+                self._add_education(line)
+        elif DEGREE_PATTERN.search(line) and self.section != "experience":
+            self._add_education(line)
+        else:
+            dates = DATE_RANGE_PATTERN.search(line)
+            if dates:
+                self._add_experience(line, dates)
+        self.previous_line = line
+    
+    def _add_education(self, line: str):
+        if line not in self.education:
+            self.education.append(line)
+    
+    def _add_experience(self, line: str, dates: "re.Match"):
+        start = int(dates.group("start"))
+        end = self.current_year if dates.group("current") else int(dates.group("end"))
+        # "Senior Engineer, Tech Corp, 2019 - 2024" or a date line under its title line
+        title = (line[:dates.start()] + " " + line[dates.end():]).strip(ENTRY_SEPARATORS)
+        self.experience.append({
+            "title": title or self.previous_line,
+            "start_year": start,
+            "end_year": end,
+            "current": bool(dates.group("current")),
+            "years": max(end - start, 0)
+        })
+    
+    def result(self) -> Dict[str, Any]:
+        spans = sorted((entry["start_year"], entry["end_year"]) for entry in self.experience)
+        # Overlapping roles count once
+        covered, reach = 0, None
+        for start, end in spans:
+            if reach is None or start > reach:
+                covered += end - start
+                reach = end
+            elif end > reach:
+                covered += end - reach
+                reach = end
+        return {
+            "name": self.name,
+            "email": self.email,
+            "phone": self.phone,
+            "skills": self.skills,
+            "education": self.education,
+            "experience": self.experience,
+            "total_experience_years": self.stated_years if self.stated_years is not None else covered,
+            "pages": self.pages,
+            "word_count": self.words
+        }
+
+_worker_parser: Optional["EnhancedResumeParser"] = None
+
+def _parse_in_worker(path: str) -> Tuple[str, Optional[Dict[str, Any]], Optional[str]]:
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = EnhancedResumeParser()
+    try:
+        return path, _worker_parser.parse_resume(path), None
+    except Exception as e:
+        return path, None, str(e)
+
+class EnhancedResumeParser:
+    """Extracts contact details, skills, education and experience from PDF, DOCX and TXT resumes.
+    
+    Files are memory-mapped and read page by page; every page is scanned once
+    by the skill automaton and once line by line for section headers, degrees
+    and date ranges, so the full document text is never held in memory.
+    """
+    
+    # Bump when parse output changes, so cached results are re-parsed
+    VERSION = "3"
+    
+    def __init__(self, skill_matcher: Optional[SkillMatcher] = None):
+        self.skill_matcher = skill_matcher or get_default_matcher()
+    
+    def iter_pages(self, file_path: str) -> Iterator[str]:
+        """Stream the text of a resume one page at a time"""
+        suffix = Path(file_path).suffix.lower()
+        if suffix not in PAGE_READERS:
+            raise ValueError(f"Unsupported resume format: {suffix or file_path}")
+        return PAGE_READERS[suffix](file_path)
+    
+    def extract_text(self, file_path: str) -> str:
+        return "\f".join(self.iter_pages(file_path))
+    
+    def extract_skills(self, text: str) -> Dict[str, List[str]]:
+        """Skills found in text, grouped by taxonomy category"""
+        return self.skill_matcher.extract(text)
+    
+    def parse_pages(self, pages: Iterable[str]) -> Dict[str, Any]:
+        """Parse a stream of page texts"""
+        fields = _ResumeFields(self.skill_matcher, datetime.now().year)
+        for page in pages:
+            fields.add_page(page)
+        return fields.result()
+    
+    def parse_text(self, text: str) -> Dict[str, Any]:
+        return self.parse_pages(text.split("\f"))
+    
+    def parse_resume(self, file_path: str) -> Dict[str, Any]:
+        """Parse a resume file"""
+        result = self.parse_pages(self.iter_pages(file_path))
+        result["file_name"] = Path(file_path).name
+        return result
+    
+    def parse_many(self, file_paths: Iterable[str], workers: Optional[int] = None,
+                   chunksize: int = 4) -> Iterator[Tuple[str, Optional[Dict[str, Any]], Optional[str]]]:
+        """Parse many resumes across a process pool, yielding (path, result, error) as each finishes.
+        
+        Results come in completion order; a file that fails yields its error
+        instead of stopping the run. Pool workers use the default skill
+        taxonomy; workers=1 parses in this process with this parser's matcher.
+        """
+        if workers == 1:
+            for path in file_paths:
+                try:
+                    yield path, self.parse_resume(path), None
+                except Exception as e:
+                    yield path, None, str(e)
+            return
+        
+        with multiprocessing.Pool(workers) as pool:
+            yield from pool.imap_unordered(_parse_in_worker, file_paths, chunksize)
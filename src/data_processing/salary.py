@@ -0,0 +1,314 @@
+import bisect
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+CURRENCY_SYMBOLS = {"$": "USD", "£": "GBP", "€": "EUR", "₹": "INR"}
+# Paid periods per year, for annualizing
+PERIODS_PER_YEAR = {"hour": 2080, "day": 260, "week": 52, "month": 12, "year": 1}
+PERIOD_ALIASES = {
+    "hour": "hour", "hr": "hour", "hourly": "hour",
+    "day": "day", "daily": "day",
+    "week": "week", "wk": "week", "weekly": "week",
+    "month": "month", "mo": "month", "monthly": "month",
+    "year": "year", "yr": "year", "annum": "year", "annual": "year", "annually": "year"
+}
+# Amounts without a stated period below this are taken as hourly rates
+HOURLY_THRESHOLD = 500
+
+# Western (1,234,567) and Indian lakh (12,34,567) digit grouping
+AMOUNT = r"\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d{1,2}(?:,\d{2})+,\d{3}(?:\.\d+)?|\d+(?:\.\d+)?"
+MULTIPLIER = r"[kKmM]\b|thousand\b|million\b|lakhs?\b|lacs?\b"
+MULTIPLIERS = {"k": 1e3, "thousand": 1e3, "m": 1e6, "million": 1e6, "lakh": 1e5, "lakhs": 1e5, "lac": 1e5, "lacs": 1e5}
+CURRENCY_CODES = r"USD|EUR|GBP|CAD|AUD|INR"
+SALARY_PATTERN = re.compile(
+    rf"(?:(?P<currency>[$£€₹])|\b(?P<lead_code>{CURRENCY_CODES})\s*)?\s*(?P<low>{AMOUNT})\s*(?P<low_mult>{MULTIPLIER})?"
+    rf"(?:\s*(?:-|–|—|to)\s*(?P<currency2>[$£€₹])?\s*(?P<high>{AMOUNT})\s*(?P<high_mult>{MULTIPLIER})?)?"
+    rf"(?:\s*(?P<code>{CURRENCY_CODES})\b)?"
+    r"(?:\s*(?:/|per|an|a)?\s*(?P<period>hourly|hour|hr|daily|day|weekly|week|wk|monthly|month|mo|"
+    r"annually|annual|annum|year|yr)\b)?",
+    re.IGNORECASE
+)
+# Lines that state the salary, and lines whose amounts are something else (perks, funding)
+SALARY_LABEL = re.compile(r"\b(?:salary|compensation|pay|base|wages?|rate|ctc|remuneration|ote)\b", re.IGNORECASE)
+NON_SALARY_LABEL = re.compile(
+    r"\b(?:stipend|bonus|allowance|reimburse\w*|perks?|budget|equity|raised|funding|revenue|valuation)\b",
+    re.IGNORECASE
+)
+SENTENCE_END = re.compile(r"[.;!?](?:\s|$)")
+
+def _amount(value: str) -> float:
+    return float(value.replace(",", ""))
+
+def _multiplier(value: Optional[str]) -> float:
+    return MULTIPLIERS[value.lower()] if value else 1
+
+def _clause_of(text: str, match: "re.Match") -> str:
+    # The sentence around a match, within its line; "." only ends one when followed by a space
+    start = text.rfind("\n", 0, match.start()) + 1
+    end = text.find("\n", match.end())
+    before = SENTENCE_END.split(text[start:match.start()])[-1]
+    after = SENTENCE_END.split(text[match.end():end if end != -1 else len(text)])[0]
+    return before + match.group(0) + after
+
+def _parse_match(match: "re.Match", default_currency: str) -> Optional[Dict[str, Any]]:
+    currency = match.group("currency") or match.group("currency2")
+    code = match.group("code") or match.group("lead_code")
+    low_mult, high_mult = _multiplier(match.group("low_mult")), _multiplier(match.group("high_mult"))
+    has_mult = low_mult != 1 or high_mult != 1
+    if not (currency or code or (has_mult and (match.group("high") or match.group("period")))):
+        return None
+    
+    low = _amount(match.group("low")) * low_mult
+    if match.group("high"):
+        high = _amount(match.group("high")) * high_mult
+        # A multiplier on one end applies to both: "$80-120k", "80k-120", "$1-1.5M"
+        if high_mult != 1 and low_mult == 1 and low < 1000:
+            low *= high_mult
+        if low_mult != 1 and high_mult == 1 and high < 1000:
+            high *= low_mult
+    else:
+        high = low
+    low, high = min(low, high), max(low, high)
+    
+    period = PERIOD_ALIASES.get((match.group("period") or "").lower())
+    if period is None:
+        period = "hour" if high < HOURLY_THRESHOLD else "year"
+    per_year = PERIODS_PER_YEAR[period]
+    if code:
+        currency = code.upper()
+    elif currency:
+        currency = CURRENCY_SYMBOLS[currency]
+    else:
+        # Lakhs are only used for rupees
+        lakh = any((match.group(group) or "").lower().startswith("la") for group in ("low_mult", "high_mult"))
+        currency = "INR" if lakh else default_currency
+    return {
+        "min": low,
+        "max": high,
+        "currency": currency,
+        "period": period,
+        "annual_min": round(low * per_year, 2),
+        "annual_max": round(high * per_year, 2)
+    }
+
+def normalize_salary(text: str, default_currency: str = "USD") -> Optional[Dict[str, Any]]:
+    """Salary stated in text as numbers, e.g. "$40-50/hr" ->
+    {"min": 40.0, "max": 50.0, "currency": "USD", "period": "hour", "annual_min": 83200.0, "annual_max": 104000.0}.
+    
+    A number only counts as a salary when it carries a currency (symbol or
+    code) or a multiplier (k, M, lakh) with a range or period, so years
+    ("2019 - 2024") and "401(k)" are skipped. Of several amounts, one in a
+    salary sentence ("Salary:", "Compensation") wins over one in a perk or
+    funding sentence, then a range over a single amount, then the first.
+    Without a period, amounts under HOURLY_THRESHOLD are hourly and the rest
+    yearly.
+    """
+    best, best_rank = None, None
+    for match in SALARY_PATTERN.finditer(text):
+        salary = _parse_match(match, default_currency)
+        if salary is None:
+            continue
+        clause = _clause_of(text, match)
+        label = bool(SALARY_LABEL.search(clause)) - bool(NON_SALARY_LABEL.search(clause))
+        rank = (label, match.group("high") is not None)
+        if best_rank is None or rank > best_rank:
+            best, best_rank = salary, rank
+    return best
+
+LOCATION_TOKEN = re.compile(r"[^\W_]+")
+# JobParser's placeholder for postings that name no location
+UNSPECIFIED_LOCATION = "location not specified"
+
+def location_key(location: Optional[str]) -> str:
+    return " ".join((location or "").lower().split())
+
+def location_tokens(location: Optional[str]) -> List[str]:
+    """Words of a location, e.g. "Austin, TX" -> ["austin", "tx"]"""
+    return LOCATION_TOKEN.findall((location or "").lower())
+
+class LocationIndex:
+    """Job ids by location token, for postings with or without a salary.
+    
+    "Austin, TX" is listed under "austin" and "tx", and a query matches the
+    postings whose location contains all of its tokens, so "Austin" finds
+    "Austin, TX". A query intersects the token sets from the smallest one up.
+    """
+    
+    def __init__(self):
+        self._locations: Dict[str, str] = {}
+        self._by_token: Dict[str, Set[str]] = {}
+    
+    def __len__(self):
+        return len(self._locations)
+    
+    @classmethod
+    def build(cls, jobs: Iterable[Dict[str, Any]]) -> "LocationIndex":
+        """Index parsed jobs ({"id", "location"}); postings without a location are left out"""
+        index = cls()
+        for job in jobs:
+            index.add(job)
+        return index
+    
+    def add(self, job: Dict[str, Any]) -> bool:
+        location = job.get("location")
+        if not location or location_key(location) == UNSPECIFIED_LOCATION:
+            return False
+        job_id = str(job["id"])
+        self._locations[job_id] = location
+        for token in location_tokens(location):
+            self._by_token.setdefault(token, set()).add(job_id)
+        return True
+    
+    def search(self, query: str) -> Set[str]:
+        """IDs of postings whose location has every token of `query`"""
+        tokens = set(location_tokens(query))
+        if not tokens:
+            return set()
+        postings = sorted((self._by_token.get(token, set()) for token in tokens), key=len)
+        matches = set(postings[0])
+        for ids in postings[1:]:
+            matches &= ids
+        return matches
+    
+    def get(self, job_id: str) -> Optional[str]:
+        return self._locations.get(str(job_id))
+    
+    def save(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self._locations, f)
+    
+    @classmethod
+    def load(cls, path: str) -> "LocationIndex":
+        with open(path, 'r', encoding='utf-8') as f:
+            locations = json.load(f)
+        return cls.build({"id": job_id, "location": location} for job_id, location in locations.items())
+
+class SalaryIndex:
+    """Jobs' annualized salary ranges, sorted by both ends, per currency and location.
+    
+    For each (currency, location) bucket, where either may be ALL, the ranges
+    are kept in two sorted lists, by annual minimum and by annual maximum.
+    "Pays at least X" is a bisect into the maximums, and a range query bisects
+    both lists and walks only the smaller candidate side, so queries take
+    logarithmic time plus the size of the answer rather than a scan of every
+    job. Salaries in different currencies are not converted; pass a currency
+    when a corpus mixes them. Locations match exactly here; LocationIndex
+    answers partial ones such as "Austin" for "Austin, TX".
+    """
+    
+    ALL = ""
+    
+    def __init__(self):
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._by_min: Dict[Tuple[str, str], List[Tuple[float, str]]] = {}
+        self._by_max: Dict[Tuple[str, str], List[Tuple[float, str]]] = {}
+    
+    def __len__(self):
+        return len(self._jobs)
+    
+    def __contains__(self, job_id):
+        return str(job_id) in self._jobs
+    
+    @classmethod
+    def build(cls, jobs: Iterable[Dict[str, Any]]) -> "SalaryIndex":
+        """Index parsed jobs ({"id", "location", "salary_normalized"}) with one sort per list"""
+        index = cls()
+        for job in jobs:
+            entry = index._entry(job)
+            if entry is None:
+                continue
+            index._jobs[entry["id"]] = entry
+            for key in cls._keys(entry):
+                index._by_min.setdefault(key, []).append((entry["annual_min"], entry["id"]))
+                index._by_max.setdefault(key, []).append((entry["annual_max"], entry["id"]))
+        for lists in (index._by_min, index._by_max):
+            for values in lists.values():
+                values.sort()
+        return index
+    
+    @staticmethod
+    def _entry(job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        salary = job.get("salary_normalized")
+        if not salary:
+            return None
+        return {
+            "id": str(job["id"]),
+            "location": location_key(job.get("location")),
+            "annual_min": salary["annual_min"],
+            "annual_max": salary["annual_max"],
+            "currency": salary.get("currency")
+        }
+    
+    @classmethod
+    def _keys(cls, entry: Dict[str, Any]) -> List[Tuple[str, str]]:
+        # Every job is listed under ALL, and under its currency and location when it has them
+        currencies = {cls.ALL, entry["currency"] or cls.ALL}
+        locations = {cls.ALL, entry["location"]}
+        return [(currency, location) for currency in currencies for location in locations]
+    
+    def add(self, job: Dict[str, Any]) -> bool:
+        """Index one parsed job; returns False when it has no salary"""
+        entry = self._entry(job)
+        if entry is None:
+            return False
+        if entry["id"] in self._jobs:
+            self.remove(entry["id"])
+        self._jobs[entry["id"]] = entry
+        for key in self._keys(entry):
+            bisect.insort(self._by_min.setdefault(key, []), (entry["annual_min"], entry["id"]))
+            bisect.insort(self._by_max.setdefault(key, []), (entry["annual_max"], entry["id"]))
+        return True
+    
+    def remove(self, job_id: str):
+        entry = self._jobs.pop(str(job_id))
+        for key in self._keys(entry):
+            for lists, value in ((self._by_min, entry["annual_min"]), (self._by_max, entry["annual_max"])):
+                values = lists[key]
+                del values[bisect.bisect_left(values, (value, entry["id"]))]
+    
+    def search(self, min_salary: Optional[float] = None, max_salary: Optional[float] = None,
+               location: Optional[str] = None, currency: Optional[str] = None) -> List[str]:
+        """IDs of jobs whose annual range overlaps [min_salary, max_salary], highest paying first.
+        
+        With only min_salary this is "jobs paying at least min_salary": their
+        range reaches it. Bounds left out are open.
+        """
+        key = (currency or self.ALL, self.ALL if location is None else location_key(location))
+        by_min = self._by_min.get(key, [])
+        by_max = self._by_max.get(key, [])
+        
+        # Jobs with annual_max >= min_salary are by_max[reach:]; those with annual_min <= max_salary by_min[:start]
+        reach = bisect.bisect_left(by_max, (min_salary, "")) if min_salary is not None else 0
+        start = bisect.bisect_right(by_min, (max_salary, "\uffff")) if max_salary is not None else len(by_min)
+        if len(by_max) - reach <= start:
+            ids = [by_max[i][1] for i in range(reach, len(by_max))
+                   if max_salary is None or self._jobs[by_max[i][1]]["annual_min"] <= max_salary]
+        else:
+            ids = [by_min[i][1] for i in range(start)
+                   if min_salary is None or self._jobs[by_min[i][1]]["annual_max"] >= min_salary]
+        return sorted(ids, key=lambda job_id: self._jobs[job_id]["annual_max"], reverse=True)
+    
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return self._jobs.get(str(job_id))
+    
+    def currencies(self) -> List[str]:
+        """Currencies of the indexed salaries, for choosing what a salary filter compares against"""
+        return sorted({entry["currency"] for entry in self._jobs.values() if entry["currency"]})
+    
+    def save(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(list(self._jobs.values()), f)
+    
+    @classmethod
+    def load(cls, path: str) -> "SalaryIndex":
+        with open(path, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+        return cls.build({
+            "id": entry["id"],
+            "location": entry["location"],
+            "salary_normalized": entry
+        } for entry in entries)
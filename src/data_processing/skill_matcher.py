@@ -0,0 +1,152 @@
+import json
+import re
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, List, Any, Optional
+from .skill_taxonomy import CASE_SENSITIVE_TERMS, DEFAULT_SKILL_TAXONOMY
+
+# Words and single punctuation characters, so "C++", "node.js" and "CI/CD" tokenize consistently
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+|[^\sa-z0-9]")
+
+def skill_id(name: str) -> str:
+    """Canonical ID for a skill name, e.g. "Machine Learning" -> "machine-learning" """
+    slug = name.lower().replace("++", "pp").replace("#", "sharp")
+    slug = re.sub(r"^\.", "dot", slug)
+    return re.sub(r"[^a-z0-9]+", "-", slug).strip("-")
+
+class SkillMatcher:
+    """Single-pass skill extractor backed by a token-level Aho-Corasick automaton.
+    
+    Every skill name and alias in the taxonomy is compiled into one automaton
+    over word tokens, so a document is tokenized and scanned exactly once no
+    matter how many skills the taxonomy holds. Overlapping matches resolve to
+    the leftmost-longest skill ("machine learning" wins over "learning").
+    Surface forms listed in `case_sensitive` only match with the same casing.
+    """
+    
+    def __init__(self, taxonomy: Optional[Dict[str, Dict[str, List[str]]]] = None,
+                 case_sensitive: Optional[Iterable[str]] = None):
+        self.taxonomy = taxonomy if taxonomy is not None else DEFAULT_SKILL_TAXONOMY
+        self.case_sensitive = frozenset(case_sensitive if case_sensitive is not None else CASE_SENSITIVE_TERMS)
+        self.skills: List[Dict[str, str]] = []
+        self._token_ids: Dict[str, int] = {}
+        self._goto: List[Dict[int, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[List[tuple]] = [[]]
+        self._compile()
+    
+    @classmethod
+    def from_file(cls, path: str) -> "SkillMatcher":
+        """Build a matcher from a JSON taxonomy with the same shape as DEFAULT_SKILL_TAXONOMY"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+    
+    def _compile(self):
+        for category, skills in self.taxonomy.items():
+            for name, aliases in skills.items():
+                index = len(self.skills)
+                self.skills.append({"skill_id": skill_id(name), "skill": name, "category": category})
+                # Lowercased surface -> required casing, or None when any casing matches
+                surfaces: Dict[str, Optional[str]] = {}
+                for surface in [name] + aliases:
+                    if surface in self.case_sensitive:
+                        surfaces.setdefault(surface.lower(), surface)
+                    else:
+                        surfaces[surface.lower()] = None
+                for surface, cased in surfaces.items():
+                    self._add_pattern(surface, index, cased)
+        self._build_failure_links()
+    
+    def _add_pattern(self, surface: str, skill_index: int, cased: Optional[str] = None):
+        spans = [match.span() for match in TOKEN_PATTERN.finditer(surface)]
+        if not spans:
+            return
+        tokens = [surface[start:end] for start, end in spans]
+        if cased is not None:
+            # Compared against the matched tokens of the original text, ignoring what lies between them
+            cased = "".join(cased[start:end] for start, end in spans)
+        state = 0
+        for token in tokens:
+            token_id = self._token_ids.setdefault(token, len(self._token_ids))
+            next_state = self._goto[state].get(token_id)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+                self._goto[state][token_id] = next_state
+            state = next_state
+        output = (skill_index, len(tokens), cased)
+        if output not in self._outputs[state]:
+            self._outputs[state].append(output)
+    
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token_id, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and token_id not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(token_id, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                # Inherit matches that end here via the failure chain
+                self._outputs[next_state] = self._outputs[next_state] + self._outputs[self._fail[next_state]]
+    
+    def find(self, text: str) -> List[Dict[str, Any]]:
+        """Return every skill mention with its canonical ID and character offsets"""
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # A few characters change length when lowercased; keep offsets aligned
+            lowered = "".join(char.lower() if len(char.lower()) == 1 else char for char in text)
+        
+        spans = [match.span() for match in TOKEN_PATTERN.finditer(lowered)]
+        token_ids = self._token_ids
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        
+        candidates = []
+        state = 0
+        for position, (start, end) in enumerate(spans):
+            token_id = token_ids.get(lowered[start:end])
+            if token_id is None:
+                state = 0
+                continue
+            while state and token_id not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token_id, 0)
+            for skill_index, length, cased in outputs[state]:
+                first = position - length + 1
+                if cased is not None and "".join(text[s:e] for s, e in spans[first:position + 1]) != cased:
+                    continue
+                candidates.append((first, -length, skill_index))
+        
+        # Leftmost-longest, non-overlapping selection
+        matches = []
+        next_free = 0
+        for first, neg_length, skill_index in sorted(candidates):
+            if first < next_free:
+                continue
+            last = first - neg_length - 1
+            next_free = last + 1
+            start, end = spans[first][0], spans[last][1]
+            matches.append(dict(self.skills[skill_index], text=text[start:end], start=start, end=end))
+        return matches
+    
+    def extract(self, text: str) -> Dict[str, List[str]]:
+        """Group the distinct skills found in text by category"""
+        by_category = {category: [] for category in self.taxonomy}
+        for match in self.find(text):
+            skills = by_category[match["category"]]
+            if match["skill"] not in skills:
+                skills.append(match["skill"])
+        return by_category
+    
+    def skill_names(self, text: str) -> List[str]:
+        """Distinct canonical skill names in order of first mention"""
+        return list(dict.fromkeys(match["skill"] for match in self.find(text)))
+
+@lru_cache(maxsize=1)
+def get_default_matcher() -> SkillMatcher:
+    """Shared matcher compiled once from the default taxonomy"""
+    return SkillMatcher()
\ No newline at end of file
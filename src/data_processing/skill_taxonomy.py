@@ -0,0 +1,423 @@
+"""
+Default skill taxonomy: category -> {canonical skill name: [aliases]}.
+The canonical name itself is always matched; aliases are extra surface forms.
+"""
+
+# Names and aliases that are also everyday words or short letter pairs. They only match
+# when written exactly like this ("Rust", "AI"), so prose such as "excel at" or "rust" is not a skill
+CASE_SENSITIVE_TERMS = frozenset({
+    "Swift", "Rust", "Ruby", "Dart", "Groovy", "Assembly", "Bash", "Lisp", "Elixir", "VB",
+    "React", "Angular", "Svelte", "Flask", "Hibernate", "Struts", "Flutter", "Ionic", "Electron",
+    "Bootstrap", "Babel", "Apollo", "Unreal",
+    "AI", "ML", "DL", "RL", "RAG", "NER", "Transformers",
+    "Spark", "Hive", "Prefect", "Snowflake", "Looker", "Excel", "BI",
+    "Helm", "Puppet", "ELK", "Oracle", "Mongoose",
+    "Slack", "SOAP", "Yarn", "Confluence", "Asana", "Postman", "Swagger", "Celery", "Selenium",
+    "Cypress", "Playwright", "Jest", "Mocha", "Maven", "Illustrator", "SAP", "Workday",
+    "Agile", "Waterfall", "UX", "UI",
+})
+
+DEFAULT_SKILL_TAXONOMY = {
+    "programming": {
+        "Python": ["python3", "python 3", "python2"],
+        "Java": ["java 8", "java 11", "java 17"],
+        "JavaScript": ["js", "ecmascript", "es6", "es2015"],
+        "TypeScript": [],
+        "C Programming": ["ansi c", "c99", "c11", "c language"],
+        "C++": ["cpp", "c plus plus", "c++11", "c++14", "c++17", "c++20"],
+        "C#": ["csharp", "c sharp"],
+        "Golang": ["go lang", "go language"],
+        "Rust": ["rustlang"],
+        "Ruby": [],
+        "PHP": ["php7", "php8"],
+        "Kotlin": [],
+        "Swift": [],
+        "Objective-C": ["objective c", "objc"],
+        "Scala": [],
+        "R Programming": ["r language", "rstudio"],
+        "MATLAB": [],
+        "Perl": [],
+        "Haskell": [],
+        "Elixir": [],
+        "Erlang": [],
+        "Clojure": [],
+        "F#": ["fsharp"],
+        "Dart": [],
+        "Lua": [],
+        "Groovy": [],
+        "Fortran": [],
+        "COBOL": [],
+        "Visual Basic": ["vb.net", "vba", "VB"],
+        "Assembly": ["asm", "x86 assembly"],
+        "Bash": ["shell scripting", "shell script", "bash scripting", "zsh"],
+        "PowerShell": ["powershell scripting"],
+        "SQL": ["t-sql", "tsql", "pl/sql", "plsql", "ansi sql"],
+        "HTML": ["html5"],
+        "CSS": ["css3"],
+        "Sass": ["scss"],
+        "Solidity": [],
+        "VHDL": [],
+        "Verilog": ["systemverilog"],
+        "ABAP": [],
+        "OCaml": [],
+        "Zig": [],
+        "Prolog": [],
+        "Lisp": ["common lisp"],
+        "Delphi": ["object pascal"],
+        "GraphQL": [],
+        "WebAssembly": ["wasm"],
+        "CUDA": [],
+        "OpenCL": [],
+    },
+    "frameworks": {
+        "React": ["react.js", "reactjs", "react js"],
+        "React Native": [],
+        "Angular": ["angularjs", "angular.js"],
+        "Vue": ["vue.js", "vuejs", "vue 3"],
+        "Svelte": ["sveltekit"],
+        "Next.js": ["nextjs"],
+        "Nuxt": ["nuxt.js", "nuxtjs"],
+        "Ember.js": ["emberjs"],
+        "jQuery": [],
+        "Redux": [],
+        "Node.js": ["nodejs", "node js"],
+        "Express.js": ["expressjs"],
+        "NestJS": ["nest.js"],
+        "Deno": [],
+        "Django": ["django rest framework", "drf"],
+        "Flask": [],
+        "FastAPI": [],
+        "Tornado": [],
+        "Spring Framework": ["spring mvc"],
+        "Spring Boot": ["springboot"],
+        "Hibernate": [],
+        "Struts": [],
+        "Quarkus": [],
+        "Micronaut": [],
+        "Ruby on Rails": ["rails", "ror"],
+        "Sinatra": [],
+        "Laravel": [],
+        "Symfony": [],
+        "CodeIgniter": [],
+        ".NET": ["dotnet", "dot net", ".net core", ".net framework"],
+        "ASP.NET": ["asp.net core", "asp.net mvc"],
+        "Entity Framework": [],
+        "Blazor": [],
+        "Xamarin": [],
+        "Flutter": [],
+        "Ionic": [],
+        "Electron": [],
+        "Qt": [],
+        "SwiftUI": [],
+        "UIKit": [],
+        "Jetpack Compose": [],
+        "Android SDK": ["android"],
+        "iOS SDK": ["ios"],
+        "Bootstrap": [],
+        "Tailwind CSS": ["tailwind", "tailwindcss"],
+        "Material UI": ["mui"],
+        "Webpack": [],
+        "Vite": [],
+        "Babel": [],
+        "Gatsby": [],
+        "Play Framework": [],
+        "Akka": [],
+        "gRPC": [],
+        "Apollo": ["apollo graphql"],
+        "Three.js": ["threejs"],
+        "D3.js": ["d3", "d3js"],
+        "Unity3D": ["unity engine"],
+        "Unreal Engine": ["Unreal", "ue4", "ue5"],
+    },
+    "ai": {
+        "Machine Learning": ["ML", "machine-learning"],
+        "Deep Learning": ["DL", "deep-learning"],
+        "Artificial Intelligence": ["AI"],
+        "Natural Language Processing": ["nlp"],
+        "Computer Vision": ["image recognition"],
+        "Reinforcement Learning": ["RL"],
+        "Generative AI": ["genai", "gen ai"],
+        "Large Language Models": ["llm", "llms", "large language model"],
+        "Prompt Engineering": [],
+        "Retrieval-Augmented Generation": ["RAG", "retrieval augmented generation"],
+        "Neural Networks": ["neural network"],
+        "Convolutional Neural Networks": ["cnn", "cnns"],
+        "Recurrent Neural Networks": ["rnn", "rnns", "lstm"],
+        "Transformers": ["transformer models", "hugging face transformers"],
+        "TensorFlow": ["tensorflow 2", "tf2"],
+        "PyTorch": ["torch"],
+        "Keras": [],
+        "JAX": [],
+        "scikit-learn": ["sklearn", "scikit learn"],
+        "XGBoost": [],
+        "LightGBM": [],
+        "CatBoost": [],
+        "Hugging Face": ["huggingface"],
+        "spaCy": ["spacy"],
+        "NLTK": [],
+        "Gensim": [],
+        "OpenCV": [],
+        "LangChain": [],
+        "LangGraph": [],
+        "LlamaIndex": [],
+        "OpenAI API": ["openai", "gpt-4", "gpt-3.5", "chatgpt"],
+        "MLOps": ["ml ops"],
+        "MLflow": [],
+        "Kubeflow": [],
+        "SageMaker": ["aws sagemaker", "amazon sagemaker"],
+        "Vertex AI": [],
+        "ONNX": [],
+        "TensorRT": [],
+        "Feature Engineering": [],
+        "Model Deployment": [],
+        "Time Series Analysis": ["time series", "time series forecasting"],
+        "Recommender Systems": ["recommendation systems", "recommendation engine"],
+        "Anomaly Detection": [],
+        "Speech Recognition": ["asr"],
+        "Object Detection": ["yolo"],
+        "Sentiment Analysis": [],
+        "Named Entity Recognition": ["NER"],
+        "Embeddings": ["vector embeddings", "sentence embeddings"],
+        "Vector Databases": ["vector database", "pinecone", "faiss", "milvus", "weaviate"],
+    },
+    "data": {
+        "Data Analysis": ["data analytics"],
+        "Data Science": [],
+        "Data Engineering": [],
+        "Data Visualization": ["data viz"],
+        "Statistics": ["statistical analysis", "statistical modeling"],
+        "A/B Testing": ["ab testing", "split testing", "experimentation"],
+        "pandas": [],
+        "NumPy": [],
+        "SciPy": [],
+        "Matplotlib": [],
+        "Seaborn": [],
+        "Plotly": [],
+        "Jupyter": ["jupyter notebook", "jupyterlab"],
+        "Apache Spark": ["Spark", "pyspark", "spark sql"],
+        "Hadoop": ["hdfs", "mapreduce"],
+        "Hive": [],
+        "Apache Kafka": ["kafka"],
+        "Apache Flink": ["flink"],
+        "Apache Beam": [],
+        "Apache Airflow": ["airflow"],
+        "Prefect": [],
+        "Dagster": [],
+        "dbt": ["data build tool"],
+        "ETL": ["elt", "etl pipelines"],
+        "Data Warehousing": ["data warehouse"],
+        "Data Modeling": [],
+        "Data Lakes": ["data lake", "lakehouse"],
+        "Snowflake": [],
+        "BigQuery": ["google bigquery"],
+        "Redshift": ["amazon redshift"],
+        "Databricks": [],
+        "Tableau": [],
+        "Power BI": ["powerbi"],
+        "Looker": [],
+        "Qlik": ["qlikview", "qlik sense"],
+        "Excel": ["microsoft excel", "advanced excel", "vlookup", "pivot tables"],
+        "SAS": [],
+        "SPSS": [],
+        "Stata": [],
+        "Big Data": [],
+        "Business Intelligence": ["BI"],
+    },
+    "cloud": {
+        "AWS": ["amazon web services"],
+        "Azure": ["microsoft azure"],
+        "GCP": ["google cloud", "google cloud platform"],
+        "EC2": ["amazon ec2"],
+        "S3": ["amazon s3"],
+        "AWS Lambda": ["aws lambda functions"],
+        "DynamoDB": [],
+        "CloudFormation": [],
+        "Amazon ECS": ["ecs"],
+        "Amazon EKS": ["eks"],
+        "AWS Fargate": ["fargate"],
+        "API Gateway": [],
+        "CloudWatch": [],
+        "IAM": ["aws iam"],
+        "Azure Functions": [],
+        "Azure DevOps": [],
+        "AKS": ["azure kubernetes service"],
+        "GKE": ["google kubernetes engine"],
+        "Cloud Functions": ["google cloud functions"],
+        "Cloud Run": [],
+        "Firebase": [],
+        "Heroku": [],
+        "DigitalOcean": [],
+        "Vercel": [],
+        "Netlify": [],
+        "Cloudflare": [],
+        "OpenStack": [],
+        "Serverless": ["serverless framework"],
+        "Cloud Architecture": ["cloud computing"],
+        "Multi-Cloud": ["multicloud", "hybrid cloud"],
+    },
+    "devops": {
+        "Docker": ["containerization"],
+        "Kubernetes": ["k8s"],
+        "Helm": [],
+        "Terraform": [],
+        "Ansible": [],
+        "Puppet": [],
+        "Pulumi": [],
+        "Vagrant": [],
+        "Jenkins": [],
+        "GitHub Actions": [],
+        "GitLab CI": ["gitlab ci/cd"],
+        "CircleCI": [],
+        "Travis CI": [],
+        "Argo CD": ["argocd"],
+        "CI/CD": ["continuous integration", "continuous delivery", "continuous deployment", "ci cd"],
+        "Infrastructure as Code": ["iac"],
+        "Prometheus": [],
+        "Grafana": [],
+        "Datadog": [],
+        "New Relic": [],
+        "Splunk": [],
+        "ELK Stack": ["ELK", "logstash", "kibana"],
+        "Nginx": [],
+        "Apache HTTP Server": ["apache httpd"],
+        "Linux": ["unix", "ubuntu", "centos", "rhel", "debian"],
+        "Site Reliability Engineering": ["sre"],
+        "Istio": ["service mesh"],
+        "OpenShift": [],
+        "Microservices": ["microservice", "microservices architecture"],
+        "Networking": ["tcp/ip", "dns", "load balancing"],
+        "Monitoring": ["observability"],
+    },
+    "databases": {
+        "MySQL": [],
+        "PostgreSQL": ["postgres", "psql"],
+        "SQLite": [],
+        "Oracle Database": ["oracle db", "Oracle"],
+        "Microsoft SQL Server": ["sql server", "mssql"],
+        "MariaDB": [],
+        "MongoDB": ["mongo"],
+        "Redis": [],
+        "Cassandra": ["apache cassandra"],
+        "Couchbase": [],
+        "CouchDB": [],
+        "Elasticsearch": ["elastic search", "opensearch"],
+        "Neo4j": [],
+        "Memcached": [],
+        "InfluxDB": [],
+        "TimescaleDB": [],
+        "ClickHouse": [],
+        "CockroachDB": [],
+        "HBase": [],
+        "Firestore": [],
+        "Cosmos DB": ["cosmosdb", "azure cosmos db"],
+        "NoSQL": [],
+        "Relational Databases": ["rdbms", "relational database"],
+        "Database Design": ["schema design"],
+        "Query Optimization": ["sql tuning", "query tuning"],
+        "SQLAlchemy": [],
+        "Prisma": [],
+        "Sequelize": [],
+        "Mongoose": [],
+    },
+    "tools": {
+        "Git": ["github", "gitlab", "bitbucket", "version control"],
+        "Jira": [],
+        "Confluence": [],
+        "Trello": [],
+        "Asana": [],
+        "Slack": [],
+        "Postman": [],
+        "Swagger": ["openapi"],
+        "REST APIs": ["restful", "rest api", "restful apis"],
+        "SOAP": [],
+        "WebSockets": ["websocket"],
+        "RabbitMQ": [],
+        "ActiveMQ": [],
+        "Celery": [],
+        "Selenium": [],
+        "Cypress": [],
+        "Playwright": [],
+        "Jest": [],
+        "Mocha": [],
+        "pytest": [],
+        "JUnit": [],
+        "TestNG": [],
+        "Unit Testing": ["unit tests"],
+        "Test-Driven Development": ["tdd"],
+        "Behavior-Driven Development": ["bdd", "cucumber"],
+        "Maven": [],
+        "Gradle": [],
+        "npm": [],
+        "Yarn": [],
+        "Figma": [],
+        "Adobe XD": [],
+        "Photoshop": ["adobe photoshop"],
+        "Illustrator": ["adobe illustrator"],
+        "Visual Studio Code": ["vs code", "vscode"],
+        "IntelliJ IDEA": ["intellij"],
+        "Salesforce": ["sfdc"],
+        "SAP": [],
+        "ServiceNow": [],
+        "Workday": [],
+        "HubSpot": [],
+        "Google Analytics": [],
+        "SEO": ["search engine optimization"],
+        "WordPress": [],
+        "Shopify": [],
+        "OAuth": ["oauth2", "oauth 2.0"],
+        "JWT": ["json web tokens"],
+        "Cybersecurity": ["information security", "infosec"],
+        "Penetration Testing": ["pentesting", "pen testing"],
+        "OWASP": [],
+        "Blockchain": [],
+        "Embedded Systems": ["embedded software"],
+        "IoT": ["internet of things"],
+        "Computer Networking": ["cisco", "ccna"],
+        "System Design": ["distributed systems"],
+        "Object-Oriented Programming": ["oop", "object oriented programming"],
+        "Functional Programming": [],
+        "Design Patterns": [],
+        "Data Structures": ["algorithms", "data structures and algorithms", "dsa"],
+    },
+    "methodologies": {
+        "Agile": ["agile methodologies", "agile development"],
+        "Scrum": ["scrum master"],
+        "Kanban": [],
+        "Lean Six Sigma": [],
+        "Six Sigma": [],
+        "Waterfall": [],
+        "DevOps": ["devsecops"],
+        "ITIL": [],
+        "PMP": ["project management professional"],
+        "Project Management": [],
+        "Product Management": [],
+        "Program Management": [],
+        "SAFe": ["scaled agile"],
+        "Design Thinking": [],
+        "User Research": ["ux research"],
+        "UX Design": ["UX", "user experience"],
+        "UI Design": ["UI", "user interface design"],
+        "Code Review": ["code reviews"],
+        "Pair Programming": [],
+    },
+    "soft skills": {
+        "Communication": ["communication skills", "verbal communication", "written communication"],
+        "Leadership": ["team leadership", "people management"],
+        "Teamwork": ["team player", "cross-functional collaboration"],
+        "Problem Solving": ["problem-solving"],
+        "Critical Thinking": ["analytical thinking", "analytical skills"],
+        "Time Management": [],
+        "Mentoring": ["coaching", "mentorship"],
+        "Stakeholder Management": [],
+        "Presentation Skills": ["public speaking"],
+        "Negotiation": [],
+        "Adaptability": [],
+        "Attention to Detail": ["detail-oriented", "detail oriented"],
+        "Customer Service": ["customer support"],
+        "Conflict Resolution": [],
+        "Strategic Planning": [],
+        "Decision Making": ["decision-making"],
+        "Creativity": [],
+        "Emotional Intelligence": [],
+    },
+}
\ No newline at end of file
@@ -1,6 +1,10 @@
 from .ner_model import NERModel
 from .embedding_model import EmbeddingModel
+from .embedding_cache import EmbeddingCache
 from .ranking_model import RankingModel
+from .bm25_model import BM25Model
 from .knowledge_graph import KnowledgeGraph
+from .ann_index import IVFIndex
+from .model_registry import ModelRegistry, registry
 
-__all__ = ['NERModel', 'EmbeddingModel', 'RankingModel', 'KnowledgeGraph']
\ No newline at end of file
+__all__ = ['NERModel', 'EmbeddingModel', 'EmbeddingCache', 'RankingModel', 'BM25Model', 'KnowledgeGraph', 'IVFIndex', 'ModelRegistry', 'registry']
\ No newline at end of file
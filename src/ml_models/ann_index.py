@@ -0,0 +1,243 @@
+import os
+import numpy as np
+from typing import Any, Dict, Iterable, List, Optional
+from .embedding_model import normalize_embeddings, _select_top_k
+
+class IVFIndex:
+    """Inverted-file approximate nearest-neighbour index over unit-length embeddings.
+    
+    Vectors are assigned to the nearest of n_lists k-means centroids; a query
+    only scores the vectors in its n_probe closest lists. Until the index is
+    trained, explicitly or automatically once it holds min_train_size vectors,
+    searches are exact scans. Deleted rows are compacted away once they make up
+    compact_ratio of the storage.
+    """
+    
+    def __init__(self, dim: int, n_lists: int = 1024, n_probe: int = 16, seed: int = 0,
+                 min_train_size: Optional[int] = None, compact_ratio: float = 0.25):
+        self.dim = dim
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.seed = seed
+        self.min_train_size = min_train_size if min_train_size is not None else n_lists
+        self.compact_ratio = compact_ratio
+        self.centroids = None
+        
+        self._vectors = np.empty((0, dim), dtype=np.float32)
+        self._ids: List[str] = []
+        self._alive = np.empty(0, dtype=bool)
+        self._assignments = np.empty(0, dtype=np.int32)
+        self._size = 0
+        self._deleted = 0
+        self._row_of: Dict[str, int] = {}
+        self._lists: List[List[int]] = []
+        self._list_cache: Dict[int, np.ndarray] = {}
+    
+    def __len__(self):
+        return len(self._row_of)
+    
+    def __contains__(self, item_id):
+        return str(item_id) in self._row_of
+    
+    @property
+    def is_trained(self) -> bool:
+        return self.centroids is not None
+    
+    def train(self, vectors: np.ndarray, n_iter: int = 10, sample_size: int = 100000):
+        """Fit the coarse quantizer with spherical k-means on a sample of vectors"""
+        vectors = normalize_embeddings(vectors)
+        rng = np.random.default_rng(self.seed)
+        if len(vectors) > sample_size:
+            vectors = vectors[rng.choice(len(vectors), sample_size, replace=False)]
+        
+        n_lists = min(self.n_lists, len(vectors))
+        centroids = vectors[rng.choice(len(vectors), n_lists, replace=False)].copy()
+        
+        for _ in range(n_iter):
+            assignments = self._nearest_centroids(vectors, centroids)
+            counts = np.bincount(assignments, minlength=n_lists)
+            order = np.argsort(assignments, kind="stable")
+            starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+            nonempty = counts > 0
+            sums = np.zeros_like(centroids)
+            sums[nonempty] = np.add.reduceat(vectors[order], starts[nonempty], axis=0)
+            
+            # Re-seed empty lists so every centroid stays useful
+            empty = np.flatnonzero(counts == 0)
+            if len(empty):
+                sums[empty] = vectors[rng.choice(len(vectors), len(empty), replace=False)]
+            centroids = normalize_embeddings(sums)
+        
+        self.n_lists = n_lists
+        self.centroids = centroids
+        self._lists = [[] for _ in range(n_lists)]
+        self._list_cache = {}
+        
+        # Re-assign anything that was already indexed
+        rows = np.flatnonzero(self._alive[:self._size])
+        for row, list_id in zip(rows, self._nearest_centroids(self._vectors[rows], centroids)):
+            self._assign(int(row), int(list_id))
+    
+    @staticmethod
+    def _nearest_centroids(vectors: np.ndarray, centroids: np.ndarray, chunk_size: int = 65536) -> np.ndarray:
+        assignments = np.empty(len(vectors), dtype=np.int32)
+        for start in range(0, len(vectors), chunk_size):
+            scores = vectors[start:start + chunk_size] @ centroids.T
+            assignments[start:start + chunk_size] = scores.argmax(axis=1)
+        return assignments
+    
+    def _assign(self, row: int, list_id: int):
+        self._assignments[row] = list_id
+        self._lists[list_id].append(row)
+        self._list_cache.pop(list_id, None)
+    
+    def _reserve(self, n_new: int):
+        """Grow row storage geometrically so inserts are amortized O(1)"""
+        needed = self._size + n_new
+        if needed <= len(self._vectors):
+            return
+        capacity = max(needed, 2 * len(self._vectors), 1024)
+        vectors = np.empty((capacity, self.dim), dtype=np.float32)
+        vectors[:self._size] = self._vectors[:self._size]
+        alive = np.zeros(capacity, dtype=bool)
+        alive[:self._size] = self._alive[:self._size]
+        assignments = np.zeros(capacity, dtype=np.int32)
+        assignments[:self._size] = self._assignments[:self._size]
+        self._vectors, self._alive, self._assignments = vectors, alive, assignments
+    
+    def add(self, ids: List[Any], vectors: np.ndarray):
+        """Insert vectors, replacing any existing entries with the same ids"""
+        vectors = normalize_embeddings(np.atleast_2d(vectors))
+        ids = [str(item_id) for item_id in ids]
+        if len(ids) != len(vectors):
+            raise ValueError("ids and vectors must have the same length")
+        
+        self.delete([item_id for item_id in ids if item_id in self._row_of])
+        self._reserve(len(ids))
+        
+        start = self._size
+        self._vectors[start:start + len(ids)] = vectors
+        self._alive[start:start + len(ids)] = True
+        self._size += len(ids)
+        for offset, item_id in enumerate(ids):
+            self._ids.append(item_id)
+            self._row_of[item_id] = start + offset
+        
+        if self.is_trained:
+            assignments = self._nearest_centroids(vectors, self.centroids)
+            for offset, list_id in enumerate(assignments):
+                self._assign(start + offset, int(list_id))
+        elif len(self._row_of) >= self.min_train_size:
+            # Train on everything collected so far; train() assigns the existing rows
+            self.train(self._vectors[np.flatnonzero(self._alive[:self._size])])
+    
+    def delete(self, ids: List[Any]) -> int:
+        """Remove entries by id, returning how many were found"""
+        removed = 0
+        for item_id in ids:
+            row = self._row_of.pop(str(item_id), None)
+            if row is None:
+                continue
+            self._alive[row] = False
+            self._list_cache.pop(int(self._assignments[row]), None)
+            removed += 1
+        self._deleted += removed
+        if self._deleted > self.compact_ratio * self._size:
+            self._compact()
+        return removed
+    
+    def _compact(self):
+        """Drop deleted rows from storage and renumber the live ones"""
+        rows = np.flatnonzero(self._alive[:self._size])
+        ids = [self._ids[row] for row in rows]
+        assignments = self._assignments[rows]
+        self._vectors = self._vectors[rows]
+        self._alive = np.ones(len(rows), dtype=bool)
+        self._assignments = assignments.copy()
+        self._size = len(rows)
+        self._deleted = 0
+        self._ids = ids
+        self._row_of = {item_id: row for row, item_id in enumerate(ids)}
+        self._list_cache = {}
+        if self.is_trained:
+            self._lists = [[] for _ in range(self.n_lists)]
+            for row, list_id in enumerate(assignments):
+                self._lists[int(list_id)].append(row)
+    
+    def _list_rows(self, list_id: int) -> np.ndarray:
+        rows = self._list_cache.get(list_id)
+        if rows is None:
+            # Drop deleted rows from the list while rebuilding its array
+            live = [row for row in self._lists[list_id] if self._alive[row]]
+            self._lists[list_id] = live
+            rows = np.array(live, dtype=np.int64)
+            self._list_cache[list_id] = rows
+        return rows
+    
+    def search(self, query_embedding: np.ndarray, top_k: int = 10, n_probe: Optional[int] = None,
+               ids: Optional[Iterable[Any]] = None) -> List[Dict[str, Any]]:
+        """Return approximate top_k matches as {"id", "similarity"} dicts.
+        
+        With `ids`, only those entries are scored, exactly; meant for filters
+        that leave few candidates, which probing would mostly miss.
+        """
+        if not self._row_of:
+            return []
+        
+        query = normalize_embeddings(np.asarray(query_embedding).reshape(-1))
+        if ids is not None:
+            rows = np.array([self._row_of[item_id] for item_id in map(str, ids) if item_id in self._row_of],
+                            dtype=np.int64)
+        elif self.is_trained:
+            n_probe = min(n_probe or self.n_probe, self.n_lists)
+            probe, _ = _select_top_k(self.centroids @ query, n_probe)
+            rows = np.concatenate([self._list_rows(int(list_id)) for list_id in probe])
+        else:
+            rows = np.flatnonzero(self._alive[:self._size])
+        if len(rows) == 0:
+            return []
+        
+        indices, scores = _select_top_k(self._vectors[rows] @ query, min(top_k, len(rows)))
+        return [
+            {"id": self._ids[rows[index]], "similarity": float(score)}
+            for index, score in zip(indices, scores)
+        ]
+    
+    def save(self, path: str):
+        """Write the index (live entries only) to a single .npz file"""
+        rows = np.flatnonzero(self._alive[:self._size])
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.savez(
+                f,
+                params=np.array([self.dim, self.n_lists, self.n_probe, self.seed]),
+                centroids=self.centroids if self.is_trained else np.empty((0, self.dim), dtype=np.float32),
+                vectors=self._vectors[rows],
+                ids=np.array([self._ids[row] for row in rows], dtype=str),
+                assignments=self._assignments[rows]
+            )
+        os.replace(tmp_path, path)
+    
+    @classmethod
+    def load(cls, path: str) -> "IVFIndex":
+        """Load an index written by save()"""
+        with np.load(path, allow_pickle=False) as data:
+            dim, n_lists, n_probe, seed = (int(value) for value in data["params"])
+            index = cls(dim, n_lists=n_lists, n_probe=n_probe, seed=seed)
+            vectors = data["vectors"]
+            ids = data["ids"].tolist()
+            assignments = data["assignments"]
+            if len(data["centroids"]):
+                index.centroids = data["centroids"]
+                index._lists = [[] for _ in range(n_lists)]
+        
+        index._reserve(len(ids))
+        index._vectors[:len(ids)] = vectors
+        index._alive[:len(ids)] = True
+        index._size = len(ids)
+        index._ids = ids
+        for row, (item_id, list_id) in enumerate(zip(ids, assignments)):
+            index._row_of[item_id] = row
+            if index.is_trained:
+                index._assign(row, int(list_id))
+        return index
\ No newline at end of file
@@ -0,0 +1,111 @@
+from sklearn.feature_extraction.text import CountVectorizer
+from collections import Counter
+import numpy as np
+from typing import List, Dict, Any
+
+class BM25Model:
+    """Okapi BM25 ranking over array-backed postings lists.
+    
+    Postings are stored CSC-style in three flat arrays (term offsets, document
+    ids, precomputed BM25 impacts), so a query only reads the slices of its own
+    terms. Top-k retrieval uses MaxScore-style early termination: once the
+    current k-th best score exceeds what the remaining terms could add, unseen
+    documents are skipped and only surviving candidates are probed.
+    """
+    
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.vectorizer = CountVectorizer()
+        self.documents: List[str] = []
+        self.doc_lengths = np.empty(0, dtype=np.float32)
+        self.avg_doc_length = 0.0
+        self.idf = np.empty(0, dtype=np.float32)
+        self._indptr = np.zeros(1, dtype=np.int64)
+        self._doc_ids = np.empty(0, dtype=np.int32)
+        self._impacts = np.empty(0, dtype=np.float32)
+        self._max_impacts = np.empty(0, dtype=np.float32)
+    
+    def index_documents(self, documents: List[str]):
+        """Tokenize documents once and precompute lengths and postings"""
+        self.documents = list(documents)
+        counts = self.vectorizer.fit_transform(self.documents).tocsc()
+        counts.sort_indices()
+        
+        n_docs = len(self.documents)
+        self.doc_lengths = np.asarray(counts.sum(axis=1), dtype=np.float32).ravel()
+        self.avg_doc_length = float(self.doc_lengths.mean()) if n_docs else 0.0
+        
+        doc_freq = np.diff(counts.indptr)
+        self.idf = np.log(1 + (n_docs - doc_freq + 0.5) / (doc_freq + 0.5)).astype(np.float32)
+        
+        # Precompute each posting's BM25 contribution so scoring is a gather + add
+        self._indptr = counts.indptr.astype(np.int64)
+        self._doc_ids = counts.indices.astype(np.int32)
+        tf = counts.data.astype(np.float32)
+        length_norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[self._doc_ids] / max(self.avg_doc_length, 1e-9))
+        term_of_posting = np.repeat(np.arange(len(doc_freq)), doc_freq)
+        self._impacts = (self.idf[term_of_posting] * tf * (self.k1 + 1) / (tf + length_norm)).astype(np.float32)
+        
+        self._max_impacts = np.zeros(len(doc_freq), dtype=np.float32)
+        nonempty = doc_freq > 0
+        self._max_impacts[nonempty] = np.maximum.reduceat(self._impacts, self._indptr[:-1][nonempty])
+    
+    def _query_terms(self, query: str) -> List[tuple]:
+        """Map query tokens to (term id, query term frequency)"""
+        analyzer = self.vectorizer.build_analyzer()
+        vocabulary = self.vectorizer.vocabulary_
+        counts = Counter(vocabulary[token] for token in analyzer(query) if token in vocabulary)
+        return list(counts.items())
+    
+    def search(self, query: str, top_k: int = 10, early_termination: bool = True) -> List[Dict[str, Any]]:
+        """Return the top_k documents by BM25 score"""
+        if not self.documents or top_k <= 0:
+            return []
+        terms = self._query_terms(query)
+        if not terms:
+            return []
+        
+        # Process terms with the highest possible contribution first
+        terms.sort(key=lambda term: self._max_impacts[term[0]] * term[1], reverse=True)
+        upper_bounds = np.array([self._max_impacts[term] * qtf for term, qtf in terms], dtype=np.float32)
+        remaining = np.cumsum(upper_bounds[::-1])[::-1]
+        
+        cand_ids = np.empty(0, dtype=np.int32)
+        cand_scores = np.empty(0, dtype=np.float32)
+        
+        for i, (term, qtf) in enumerate(terms):
+            start, end = self._indptr[term], self._indptr[term + 1]
+            doc_ids = self._doc_ids[start:end]
+            impacts = self._impacts[start:end] * qtf
+            
+            threshold = 0.0
+            if len(cand_scores) >= top_k:
+                threshold = np.partition(cand_scores, len(cand_scores) - top_k)[len(cand_scores) - top_k]
+            
+            if early_termination and len(cand_scores) >= top_k and threshold > remaining[i]:
+                # No unseen document can reach the top-k any more: drop hopeless
+                # candidates and probe this postings list only for the survivors
+                keep = cand_scores + remaining[i] >= threshold
+                cand_ids, cand_scores = cand_ids[keep], cand_scores[keep]
+                positions = np.minimum(np.searchsorted(doc_ids, cand_ids), len(doc_ids) - 1)
+                hits = doc_ids[positions] == cand_ids
+                cand_scores[hits] += impacts[positions[hits]]
+            else:
+                all_ids = np.concatenate([cand_ids, doc_ids])
+                cand_ids, inverse = np.unique(all_ids, return_inverse=True)
+                cand_scores = np.bincount(inverse, weights=np.concatenate([cand_scores, impacts])).astype(np.float32)
+        
+        top_k = min(top_k, len(cand_ids))
+        best = np.argpartition(-cand_scores, top_k - 1)[:top_k] if top_k < len(cand_ids) else np.arange(len(cand_ids))
+        best = best[np.lexsort((cand_ids[best], -cand_scores[best]))]
+        
+        return [
+            {
+                "rank": rank,
+                "index": int(cand_ids[i]),
+                "document": self.documents[cand_ids[i]],
+                "score": float(cand_scores[i])
+            }
+            for rank, i in enumerate(best, 1)
+        ]
\ No newline at end of file
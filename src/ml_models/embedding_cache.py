@@ -0,0 +1,147 @@
+import hashlib
+import json
+import os
+import re
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional
+import numpy as np
+
+class EmbeddingCache:
+    """Content-addressed embedding cache with an in-memory LRU tier and a memory-mapped disk tier.
+    
+    Entries are keyed by the SHA-256 of the model name plus the whitespace-normalized
+    text. The disk tier is a single append-only file of fixed-size records
+    (hex key + float32 vector) that is memory-mapped for reads, so a cache
+    of millions of embeddings is never loaded into RAM as a whole.
+    """
+    
+    def __init__(self, model_name: str, cache_dir: Optional[str] = None, memory_size: int = 10000):
+        self.model_name = model_name
+        self.memory_size = memory_size
+        self.memory = OrderedDict()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        
+        self.dim = None
+        self.vectors_path = None
+        self.meta_path = None
+        self._vectors = None
+        self._rows: Dict[bytes, int] = {}
+        
+        if cache_dir:
+            safe_name = re.sub(r'[^\w.-]', '_', model_name)
+            Path(cache_dir).mkdir(parents=True, exist_ok=True)
+            self.vectors_path = Path(cache_dir) / f"{safe_name}.emb"
+            self.meta_path = Path(cache_dir) / f"{safe_name}.json"
+            if self.meta_path.exists():
+                with open(self.meta_path, 'r') as f:
+                    self.dim = json.load(f)["dim"]
+                self._refresh_disk_index()
+    
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """Collapse whitespace so formatting-only differences share a cache entry"""
+        return " ".join(text.split())
+    
+    def make_key(self, text: str) -> bytes:
+        """Hash the model name and normalized text into a cache key"""
+        payload = f"{self.model_name}\n{self.normalize_text(text)}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest().encode("ascii")
+    
+    def _record_dtype(self) -> np.dtype:
+        return np.dtype([("key", "S64"), ("vector", "<f4", (self.dim,))])
+    
+    def _refresh_disk_index(self):
+        """Map any records appended to the disk tier since the last refresh"""
+        if self.vectors_path is None or self.dim is None or not self.vectors_path.exists():
+            return
+        
+        record_dtype = self._record_dtype()
+        # Ignore a trailing partial record left behind by an interrupted write
+        n_rows = os.path.getsize(self.vectors_path) // record_dtype.itemsize
+        if n_rows == 0 or (self._vectors is not None and n_rows == len(self._vectors)):
+            return
+        
+        start = len(self._vectors) if self._vectors is not None else 0
+        self._vectors = np.memmap(self.vectors_path, dtype=record_dtype, mode="r", shape=(n_rows,))
+        for row, key in enumerate(self._vectors["key"][start:].tolist(), start):
+            self._rows.setdefault(key, row)
+    
+    def _remember(self, key: bytes, vector: np.ndarray):
+        self.memory[key] = vector
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_size:
+            self.memory.popitem(last=False)
+    
+    def get_many(self, keys: List[bytes]) -> List[Optional[np.ndarray]]:
+        """Look up keys, returning None for each miss"""
+        results = []
+        refreshed = False
+        
+        for key in keys:
+            vector = self.memory.get(key)
+            if vector is not None:
+                self.memory.move_to_end(key)
+                self.memory_hits += 1
+                results.append(vector)
+                continue
+            
+            row = self._rows.get(key)
+            if row is None and not refreshed:
+                # Another process may have appended to the disk tier
+                self._refresh_disk_index()
+                refreshed = True
+                row = self._rows.get(key)
+            
+            if row is not None:
+                vector = np.array(self._vectors["vector"][row])
+                self._remember(key, vector)
+                self.disk_hits += 1
+            else:
+                self.misses += 1
+            results.append(vector)
+        
+        return results
+    
+    def put_many(self, keys: List[bytes], vectors: np.ndarray):
+        """Store vectors in both tiers"""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        for key, vector in zip(keys, vectors):
+            self._remember(key, vector)
+        
+        if self.vectors_path is None:
+            return
+        
+        if self.dim is None:
+            self.dim = vectors.shape[1]
+            with open(self.meta_path, 'w') as f:
+                json.dump({"model_name": self.model_name, "dim": self.dim}, f)
+        
+        new_keys = [key for key in dict.fromkeys(keys) if key not in self._rows]
+        if not new_keys:
+            return
+        
+        lookup = dict(zip(keys, vectors))
+        records = np.empty(len(new_keys), dtype=self._record_dtype())
+        records["key"] = new_keys
+        records["vector"] = [lookup[key] for key in new_keys]
+        
+        # A single O_APPEND write keeps concurrent writers from interleaving records
+        with open(self.vectors_path, 'ab') as f:
+            f.write(records.tobytes())
+        self._refresh_disk_index()
+    
+    def stats(self) -> Dict[str, float]:
+        """Hit rate and size of each tier"""
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+            "memory_entries": len(self.memory),
+            "disk_entries": len(self._rows),
+            "disk_bytes": os.path.getsize(self.vectors_path) if self.vectors_path and self.vectors_path.exists() else 0
+        }
\ No newline at end of file
@@ -1,14 +1,102 @@
-from sentence_transformers import SentenceTransformer
 import numpy as np
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
+from .embedding_cache import EmbeddingCache
+from .model_registry import get_sentence_transformer
+
+def normalize_embeddings(embeddings: np.ndarray) -> np.ndarray:
+    """L2-normalize embeddings row-wise (zero vectors stay zero)"""
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(embeddings, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return embeddings / norms
+
+def _select_top_k(scores: np.ndarray, top_k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return indices and scores of the top_k largest scores, best first"""
+    if top_k < len(scores):
+        candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+    else:
+        candidates = np.arange(len(scores))
+    order = np.argsort(-scores[candidates], kind="stable")
+    indices = candidates[order]
+    return indices, scores[indices]
+
+def top_k_similarity(query_embedding: np.ndarray, target_embeddings: np.ndarray,
+                     top_k: int = 10, chunk_size: Optional[int] = None,
+                     normalized: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """Find the top_k targets most cosine-similar to the query.
+    
+    The query is normalized once and scored against the targets with a single
+    matrix product. With chunk_size set, targets are read chunk_size rows at a
+    time (works with np.memmap) and only a running top_k is kept in memory.
+    Pass normalized=True when the targets are already unit length.
+    """
+    query = normalize_embeddings(np.asarray(query_embedding).reshape(-1))
+    n_targets = len(target_embeddings)
+    top_k = min(top_k, n_targets)
+    if top_k <= 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+    
+    chunk_size = chunk_size or n_targets
+    best_indices = np.empty(0, dtype=np.int64)
+    best_scores = np.empty(0, dtype=np.float32)
+    
+    for start in range(0, n_targets, chunk_size):
+        chunk = np.asarray(target_embeddings[start:start + chunk_size], dtype=np.float32)
+        scores = chunk @ query
+        if not normalized:
+            # Divide the scores instead of materializing a normalized copy of the chunk
+            norms = np.sqrt(np.einsum("ij,ij->i", chunk, chunk))
+            norms[norms == 0] = 1.0
+            scores /= norms
+        
+        indices, scores = _select_top_k(scores, top_k)
+        best_indices = np.concatenate([best_indices, indices + start])
+        best_scores = np.concatenate([best_scores, scores])
+        
+        if len(best_scores) > top_k:
+            keep, best_scores = _select_top_k(best_scores, top_k)
+            best_indices = best_indices[keep]
+    
+    return best_indices, best_scores
 
 class EmbeddingModel:
-    def __init__(self, model_name="all-MiniLM-L6-v2"):
-        self.model = SentenceTransformer(model_name)
+    def __init__(self, model_name="all-MiniLM-L6-v2", cache_dir: Optional[str] = None, cache_size: int = 10000):
+        self.model_name = model_name
+        self.cache = EmbeddingCache(model_name, cache_dir=cache_dir, memory_size=cache_size)
+    
+    @property
+    def model(self):
+        """SentenceTransformer, loaded on first use and shared across the process"""
+        return get_sentence_transformer(self.model_name)
     
     def encode(self, texts: List[str]) -> np.ndarray:
-        """Encode texts into embeddings"""
-        return self.model.encode(texts)
+        """Encode texts into embeddings, only sending cache misses to the model"""
+        if isinstance(texts, str):
+            return self.encode([texts])[0]
+        if len(texts) == 0:
+            return self.model.encode(texts)
+        
+        keys = [self.cache.make_key(text) for text in texts]
+        embeddings = self.cache.get_many(keys)
+        
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            # Encode each distinct missing text once, even if repeated in the batch
+            pending = {}
+            for i in missing:
+                pending.setdefault(keys[i], texts[i])
+            encoded = np.asarray(self.model.encode(list(pending.values())), dtype=np.float32)
+            self.cache.put_many(list(pending), encoded)
+            
+            by_key = dict(zip(pending, encoded))
+            for i in missing:
+                embeddings[i] = by_key[keys[i]]
+        
+        return np.vstack(embeddings)
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit rate and size of the embedding cache"""
+        return self.cache.stats()
     
     def similarity(self, embedding1: np.ndarray, embedding2: np.ndarray) -> float:
         """Calculate cosine similarity between two embeddings"""
@@ -16,7 +104,14 @@ class EmbeddingModel:
     
     def batch_similarity(self, query_embedding: np.ndarray, target_embeddings: np.ndarray) -> List[float]:
         """Calculate similarities between query and multiple targets"""
-        similarities = []
-        for target in target_embeddings:
-            similarities.append(self.similarity(query_embedding, target))
-        return similarities
\ No newline at end of file
+        query = normalize_embeddings(np.asarray(query_embedding).reshape(-1))
+        return (normalize_embeddings(target_embeddings) @ query).tolist()
+    
+    def search(self, query_embedding: np.ndarray, target_embeddings: np.ndarray,
+               top_k: int = 10, chunk_size: Optional[int] = None) -> List[dict]:
+        """Return the top_k most similar targets as {"index", "similarity"} dicts"""
+        indices, scores = top_k_similarity(query_embedding, target_embeddings, top_k, chunk_size)
+        return [
+            {"index": int(index), "similarity": float(score)}
+            for index, score in zip(indices, scores)
+        ]
\ No newline at end of file
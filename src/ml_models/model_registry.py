@@ -0,0 +1,173 @@
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SPACY_MODEL = "en_core_web_lg"
+DEFAULT_SENTENCE_TRANSFORMER = "all-MiniLM-L6-v2"
+DEFAULT_RANKING_MODEL_PATH = "models/ranking_model.joblib"
+
+class ModelRegistry:
+    """Process-wide registry that loads each model lazily, once, on first use.
+    
+    Loaders are plain callables, so heavy libraries are only imported when a
+    model is actually requested. Different models can load concurrently; callers
+    asking for a model that is already loading wait for that single load.
+    Models built from a file (see get_file) are reloaded when the file changes.
+    """
+    
+    def __init__(self):
+        self._loaders: Dict[str, Callable[[], Any]] = {}
+        self._instances: Dict[str, Any] = {}
+        self._load_times: Dict[str, float] = {}
+        self._errors: Dict[str, str] = {}
+        self._paths: Dict[str, str] = {}
+        self._mtimes: Dict[str, int] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+    
+    def register(self, name: str, loader: Callable[[], Any]):
+        """Register a loader; an existing registration is kept"""
+        with self._lock:
+            self._loaders.setdefault(name, loader)
+            self._locks.setdefault(name, threading.Lock())
+    
+    def get(self, name: str, loader: Optional[Callable[[], Any]] = None) -> Any:
+        """Return the shared instance, loading it on first use"""
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+        
+        if loader is not None:
+            self.register(name, loader)
+        if name not in self._loaders:
+            raise KeyError(f"Model {name} is not registered")
+        
+        with self._locks[name]:
+            if name not in self._instances:
+                start = time.perf_counter()
+                try:
+                    self._instances[name] = self._loaders[name]()
+                except Exception as e:
+                    self._errors[name] = str(e)
+                    raise
+                self._load_times[name] = time.perf_counter() - start
+                self._errors.pop(name, None)
+        return self._instances[name]
+    
+    def get_file(self, name: str, path: Optional[str] = None,
+                 loader: Optional[Callable[[str], Any]] = None) -> Optional[Any]:
+        """Return the instance loaded from `path`, reloading it when the file's mtime changes.
+        
+        Returns None while the file does not exist, so nothing is cached for a
+        file that a later build step will create.
+        """
+        if path is not None and loader is not None:
+            with self._lock:
+                if name not in self._paths:
+                    self._paths[name] = path
+                    self._loaders[name] = lambda: loader(path)
+                    self._locks.setdefault(name, threading.Lock())
+        if name not in self._paths:
+            raise KeyError(f"Model {name} is not registered")
+        
+        try:
+            mtime = os.stat(self._paths[name]).st_mtime_ns
+        except FileNotFoundError:
+            return None
+        if self._mtimes.get(name) == mtime:
+            return self._instances[name]
+        
+        with self._locks[name]:
+            if self._mtimes.get(name) != mtime:
+                start = time.perf_counter()
+                try:
+                    self._instances[name] = self._loaders[name]()
+                except Exception as e:
+                    self._errors[name] = str(e)
+                    raise
+                self._mtimes[name] = mtime
+                self._load_times[name] = time.perf_counter() - start
+                self._errors.pop(name, None)
+        return self._instances[name]
+    
+    def file_version(self, name: str) -> Optional[int]:
+        """mtime (ns) of the file the loaded instance was built from"""
+        return self._mtimes.get(name)
+    
+    def is_loaded(self, name: str) -> bool:
+        """Check whether a model has finished loading"""
+        return name in self._instances
+    
+    def warm(self, names: Optional[List[str]] = None, background: bool = True) -> Optional[threading.Thread]:
+        """Load models ahead of first use, optionally in a daemon thread"""
+        names = list(self._loaders) if names is None else names
+        
+        def load_all():
+            for name in names:
+                try:
+                    if name in self._paths:
+                        self.get_file(name)
+                    else:
+                        self.get(name)
+                except Exception as e:
+                    logger.warning("Failed to warm model %s: %s", name, e)
+        
+        if not background:
+            load_all()
+            return None
+        thread = threading.Thread(target=load_all, name="model-warmup", daemon=True)
+        thread.start()
+        return thread
+    
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Load state and load time (seconds) of every registered model"""
+        return {
+            name: {
+                "loaded": name in self._instances,
+                "load_seconds": round(self._load_times[name], 3) if name in self._load_times else None,
+                "error": self._errors.get(name)
+            }
+            for name in self._loaders
+        }
+
+registry = ModelRegistry()
+
+def _spacy_loader(model_name: str) -> Callable[[], Any]:
+    def load():
+        import spacy
+        return spacy.load(model_name)
+    return load
+
+def _sentence_transformer_loader(model_name: str) -> Callable[[], Any]:
+    def load():
+        from sentence_transformers import SentenceTransformer
+        return SentenceTransformer(model_name)
+    return load
+
+def _ranking_model_loader(path: str) -> Callable[[], Any]:
+    def load():
+        import os
+        from .ranking_model import RankingModel
+        return RankingModel.load(path) if os.path.exists(path) else RankingModel()
+    return load
+
+def get_spacy_model(model_name: str = DEFAULT_SPACY_MODEL):
+    """Shared spaCy pipeline"""
+    return registry.get(f"spacy:{model_name}", _spacy_loader(model_name))
+
+def get_sentence_transformer(model_name: str = DEFAULT_SENTENCE_TRANSFORMER):
+    """Shared SentenceTransformer"""
+    return registry.get(f"sentence_transformer:{model_name}", _sentence_transformer_loader(model_name))
+
+def get_ranking_model(path: str = DEFAULT_RANKING_MODEL_PATH):
+    """Shared TF-IDF ranking model, restored from disk when a saved index exists"""
+    return registry.get(f"tfidf:{path}", _ranking_model_loader(path))
+
+# Default models, so warm() without arguments covers the usual stack
+registry.register(f"spacy:{DEFAULT_SPACY_MODEL}", _spacy_loader(DEFAULT_SPACY_MODEL))
+registry.register(f"sentence_transformer:{DEFAULT_SENTENCE_TRANSFORMER}", _sentence_transformer_loader(DEFAULT_SENTENCE_TRANSFORMER))
+registry.register(f"tfidf:{DEFAULT_RANKING_MODEL_PATH}", _ranking_model_loader(DEFAULT_RANKING_MODEL_PATH))
\ No newline at end of file
@@ -1,13 +1,20 @@
-import spacy
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Optional
+from src.data_processing.skill_matcher import get_default_matcher
+from .model_registry import get_spacy_model
+
+# Pipeline components the entity recognizer depends on; everything else can be skipped
+NER_COMPONENTS = {"tok2vec", "transformer", "ner", "entity_ruler"}
 
 class NERModel:
     def __init__(self, model_name="en_core_web_lg"):
-        self.nlp = spacy.load(model_name)
+        self.model_name = model_name
     
-    def extract_entities(self, text: str) -> List[Dict[str, Any]]:
-        """Extract named entities from text"""
-        doc = self.nlp(text)
+    @property
+    def nlp(self):
+        """spaCy pipeline, loaded on first use and shared across the process"""
+        return get_spacy_model(self.model_name)
+    
+    def _doc_entities(self, doc) -> List[Dict[str, Any]]:
         entities = []
         
         for ent in doc.ents:
@@ -20,18 +27,29 @@ class NERModel:
         
         return entities
     
-    def extract_skills(self, text: str) -> List[str]:
-        """Extract skills from text using pattern matching"""
-        skills = []
-        skill_patterns = [
-            r'\b(?:python|java|javascript|typescript|react|angular|vue)\b',
-            r'\b(?:machine learning|deep learning|ai|nlp|computer vision)\b',
-            r'\b(?:aws|azure|gcp|docker|kubernetes|terraform)\b',
-            r'\b(?:sql|mysql|postgresql|mongodb|redis)\b'
-        ]
+    def unused_components(self) -> List[str]:
+        """Pipeline components that entity extraction does not need"""
+        return [name for name in self.nlp.pipe_names if name not in NER_COMPONENTS]
+    
+    def extract_entities(self, text: str) -> List[Dict[str, Any]]:
+        """Extract named entities from text"""
+        with self.nlp.select_pipes(disable=self.unused_components()):
+            doc = self.nlp(text)
+        return self._doc_entities(doc)
+    
+    def extract_entities_batch(self, texts: Iterable[str], batch_size: int = 64, n_process: int = 1,
+                               disable: Optional[List[str]] = None) -> Iterator[List[Dict[str, Any]]]:
+        """Lazily extract entities from a stream of texts with nlp.pipe.
         
-        for pattern in skill_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            skills.extend(matches)
+        Results are yielded in input order as batches complete, so memory stays
+        bounded by batch_size * n_process documents. n_process=-1 uses all cores.
+        """
+        if disable is None:
+            disable = self.unused_components()
         
-        return list(set(skills))
\ No newline at end of file
+        for doc in self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process, disable=disable):
+            yield self._doc_entities(doc)
+    
+    def extract_skills(self, text: str) -> List[str]:
+        """Extract canonical skill names from text in a single taxonomy scan"""
+        return get_default_matcher().skill_names(text)
\ No newline at end of file
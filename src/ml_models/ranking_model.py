@@ -1,11 +1,19 @@
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.utils.validation import check_is_fitted
+from sklearn.exceptions import NotFittedError
+from scipy import sparse
+import heapq
+import joblib
 import numpy as np
 from typing import List, Dict, Any
 
 class RankingModel:
     def __init__(self):
         self.vectorizer = TfidfVectorizer(max_features=5000)
+        self.documents: List[str] = []
+        # Term-major CSR blocks (terms x documents): row t holds the postings of term t
+        self._postings: List[sparse.csr_matrix] = []
+        self._offsets: List[int] = []
     
     def fit(self, documents: List[str]):
         """Fit the vectorizer on documents"""
@@ -15,17 +23,92 @@ class RankingModel:
         """Transform texts to TF-IDF vectors"""
         return self.vectorizer.transform(texts).toarray()
     
-    def rank_documents(self, query: str, documents: List[str]) -> List[Dict[str, Any]]:
-        """Rank documents by relevance to query"""
-        # Add query to documents for transformation
-        all_texts = [query] + documents
-        vectors = self.transform(all_texts)
+    def is_fitted(self) -> bool:
+        """Check whether the vectorizer has been fitted"""
+        try:
+            check_is_fitted(self.vectorizer)
+            return True
+        except NotFittedError:
+            return False
+    
+    def index_documents(self, documents: List[str]):
+        """Build the ranking index, fitting the vectorizer first if needed"""
+        if not self.is_fitted():
+            self.fit(documents)
+        self.documents = []
+        self._postings = []
+        self._offsets = []
+        self.add_documents(documents)
+    
+    def add_documents(self, documents: List[str]):
+        """Vectorize and index new documents without refitting the vocabulary"""
+        if not documents:
+            return
+        if not self.is_fitted():
+            self.index_documents(documents)
+            return
+        
+        self._postings.append(self.vectorizer.transform(documents).T.tocsr())
+        self._offsets.append(len(self.documents))
+        self.documents.extend(documents)
+        
+        # Merge blocks of similar size (log-structured) so a query only touches O(log n) matrices
+        while len(self._postings) > 1 and 2 * self._postings[-1].shape[1] >= self._postings[-2].shape[1]:
+            merged = sparse.hstack(self._postings[-2:], format="csr")
+            self._postings[-2:] = [merged]
+            self._offsets.pop()
+    
+    def search(self, query: str, top_k: int = 10) -> List[Dict[str, Any]]:
+        """Rank indexed documents against the query using their postings"""
+        if not self.documents:
+            return []
+        
+        query_vector = self.vectorizer.transform([query])
+        if query_vector.nnz == 0:
+            return []
         
-        # Calculate similarities
-        query_vector = vectors[0]
-        doc_vectors = vectors[1:]
+        candidates = []
+        for offset, postings in zip(self._offsets, self._postings):
+            # Sparse (1 x terms) @ (terms x docs) only visits the query terms' postings
+            scores = (query_vector @ postings).tocsr()
+            candidates.extend(zip(scores.data.tolist(), (-(scores.indices + offset)).tolist()))
         
-        similarities = cosine_similarity([query_vector], doc_vectors)[0]
+        # Negated indices break score ties in favour of earlier documents
+        top = heapq.nlargest(top_k, candidates)
+        return [
+            {
+                "rank": rank,
+                "index": -neg_index,
+                "document": self.documents[-neg_index],
+                "similarity": float(similarity),
+                "score": float(similarity * 100)
+            }
+            for rank, (similarity, neg_index) in enumerate(top, 1)
+        ]
+    
+    def save(self, path: str):
+        """Persist the vectorizer and index to a single file"""
+        postings = sparse.hstack(self._postings, format="csr") if self._postings else None
+        joblib.dump({"vectorizer": self.vectorizer, "documents": self.documents, "postings": postings}, path)
+    
+    @classmethod
+    def load(cls, path: str) -> "RankingModel":
+        """Load a model written by save()"""
+        data = joblib.load(path)
+        model = cls()
+        model.vectorizer = data["vectorizer"]
+        model.documents = data["documents"]
+        if data["postings"] is not None:
+            model._postings = [data["postings"]]
+            model._offsets = [0]
+        return model
+    
+    def rank_documents(self, query: str, documents: List[str]) -> List[Dict[str, Any]]:
+        """Rank documents by relevance to query"""
+        # TF-IDF rows are L2-normalized, so a sparse dot product is the cosine similarity
+        query_vector = self.vectorizer.transform([query])
+        doc_vectors = self.vectorizer.transform(documents)
+        similarities = (doc_vectors @ query_vector.T).toarray().ravel()
         
         # Create ranked results
         results = []
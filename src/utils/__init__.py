@@ -1,5 +1,11 @@
 from .config import load_config
 from .logger import setup_logging
-from .aws_utils import AWSUtils
 
-__all__ = ['load_config', 'setup_logging', 'AWSUtils']
\ No newline at end of file
+__all__ = ['load_config', 'setup_logging', 'AWSUtils']
+
+def __getattr__(name):
+    # boto3 is only imported when AWS helpers are actually used
+    if name == 'AWSUtils':
+        from .aws_utils import AWSUtils
+        return AWSUtils
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
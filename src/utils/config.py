@@ -0,0 +1,14 @@
+from pathlib import Path
+from typing import Any, Dict, Optional
+import yaml
+
+# config.yaml at the repository root
+DEFAULT_CONFIG_PATH = Path(__file__).resolve().parents[2] / "config.yaml"
+
+def load_config(path: Optional[str] = None) -> Dict[str, Any]:
+    """Read config.yaml; an absent or empty file gives an empty config"""
+    config_path = Path(path) if path is not None else DEFAULT_CONFIG_PATH
+    if not config_path.exists():
+        return {}
+    with open(config_path, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f) or {}
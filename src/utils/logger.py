@@ -0,0 +1,16 @@
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+def setup_logging(config: Optional[Dict[str, Any]] = None):
+    """Configure the root logger from the `logging` section of config.yaml"""
+    logging_config = (config or {}).get('logging', {})
+    handlers = [logging.StreamHandler()]
+    if logging_config.get('file'):
+        Path(logging_config['file']).parent.mkdir(parents=True, exist_ok=True)
+        handlers.append(logging.FileHandler(logging_config['file']))
+    logging.basicConfig(
+        level=logging_config.get('level', "INFO"),
+        format=logging_config.get('format', "%(asctime)s - %(name)s - %(levelname)s - %(message)s"),
+        handlers=handlers
+    )
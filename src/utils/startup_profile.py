@@ -0,0 +1,89 @@
+import importlib
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+# Modules each run.py subcommand needs before it can serve its first request
+ENTRY_POINT_IMPORTS = {
+    "cli": ["langchain_core.messages", "stateclass", "graph.stategraph"],
+    "api": ["uvicorn", "src.api.main"],
+    "web": ["streamlit", "streamlit_app.candidate_portal", "streamlit_app.job_application_tracker"],
+    "train": ["scripts.train_models"]
+}
+
+def profile_imports(modules: List[str]) -> List[Dict[str, Any]]:
+    """Import modules in order, timing each and counting the modules it pulled in.
+    
+    Times are cumulative for whatever was not already imported, so a module
+    listed after its dependencies only reports its own cost.
+    """
+    results = []
+    for name in modules:
+        loaded_before = len(sys.modules)
+        start = time.perf_counter()
+        error = None
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            error = str(e)
+        results.append({
+            "module": name,
+            "seconds": time.perf_counter() - start,
+            "new_modules": len(sys.modules) - loaded_before,
+            "error": error
+        })
+    return results
+
+def profile_model_loads(names: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+    """Load registry models synchronously and return their load stats"""
+    from src.ml_models.model_registry import registry
+    
+    registry.warm(names, background=False)
+    stats = registry.stats()
+    return {name: stats[name] for name in (names or stats) if name in stats}
+
+def profile_startup(mode: str, models: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Profile the import stack of a run.py subcommand and, optionally, its model loads"""
+    if mode not in ENTRY_POINT_IMPORTS:
+        raise ValueError(f"Unknown entry point: {mode}")
+    
+    start = time.perf_counter()
+    imports = profile_imports(ENTRY_POINT_IMPORTS[mode])
+    import_seconds = time.perf_counter() - start
+    
+    model_stats = {}
+    model_seconds = 0.0
+    if models:
+        start = time.perf_counter()
+        model_stats = profile_model_loads(models)
+        model_seconds = time.perf_counter() - start
+    
+    return {
+        "mode": mode,
+        "imports": imports,
+        "models": model_stats,
+        "import_seconds": import_seconds,
+        "model_seconds": model_seconds,
+        "total_seconds": import_seconds + model_seconds
+    }
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Render a startup profile as a plain-text table"""
+    lines = [f"Startup profile ({report['mode']})", "  Imports:"]
+    for entry in report["imports"]:
+        status = f"  FAILED: {entry['error']}" if entry["error"] else ""
+        lines.append(f"    {entry['module']:<45} {entry['seconds'] * 1000:9.1f} ms  +{entry['new_modules']} modules{status}")
+    
+    if report["models"]:
+        lines.append("  Models:")
+        for name, stats in report["models"].items():
+            if stats["error"]:
+                lines.append(f"    {name:<45} FAILED: {stats['error']}")
+            else:
+                lines.append(f"    {name:<45} {stats['load_seconds'] * 1000:9.1f} ms")
+    
+    lines.append(f"  Imports total: {report['import_seconds']:.2f} s")
+    if report["models"]:
+        lines.append(f"  Models total:  {report['model_seconds']:.2f} s")
+    lines.append(f"  Startup total: {report['total_seconds']:.2f} s")
+    return "\n".join(lines)
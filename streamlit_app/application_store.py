@@ -0,0 +1,619 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: stores fall back to in-process locking only
+    fcntl = None
+
+# Application fields stored as real columns; anything else goes to the extra JSON column
+APPLICATION_COLUMNS = [
+    "id", "user_id", "job_id", "job_title", "company", "location", "job_type",
+    "application_date", "status", "resume_match", "next_followup", "salary_range", "notes", "version"
+]
+HISTORY_COLUMNS = ["date", "status", "notes", "action"]
+
+class VersionConflictError(Exception):
+    """Raised when an application changed since the version the caller read"""
+
+def _file_signature(path: Path):
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+class JSONApplicationStore:
+    """Legacy storage: the whole application list in one JSON file, rewritten on every change.
+    
+    Writers from several processes are serialized with an exclusive lock on
+    `<path>.lock`; every write re-reads the file first if another writer changed
+    it, so concurrent sessions no longer overwrite each other's changes.
+    """
+    
+    indent = 2
+    
+    def __init__(self, path: str = "data/user_data/applications.json"):
+        self.path = Path(path)
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+        self.seq_path = self.path.with_name(self.path.name + ".seq")
+        self._records: Dict[int, Dict] = {}
+        self._max_id = 0
+        self._snapshot_signature = None
+        # Bumped whenever data written by another process is read in
+        self._external_revision = 0
+        self._thread_lock = threading.Lock()
+    
+    @contextmanager
+    def _locked(self):
+        with self._thread_lock:
+            if fcntl is None:
+                yield
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.lock_path, 'a') as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+    
+    def _load_snapshot(self):
+        applications = []
+        self._external_revision += 1
+        self._snapshot_signature = _file_signature(self.path)
+        if self._snapshot_signature is not None:
+            try:
+                with open(self.path, 'r') as f:
+                    applications = self._read_snapshot(json.load(f))
+            except (json.JSONDecodeError, FileNotFoundError):
+                applications = []
+        self._records = {app["id"]: app for app in applications}
+        self._max_id = max(self._records, default=0)
+    
+    def _read_snapshot(self, data) -> List[Dict]:
+        # A journaled snapshot wraps the list together with its log sequence number
+        return data["applications"] if isinstance(data, dict) else data
+    
+    def _snapshot_payload(self) -> Any:
+        return list(self._records.values())
+    
+    def _refresh(self):
+        """Pick up changes written by other processes since the last read"""
+        if _file_signature(self.path) != self._snapshot_signature:
+            self._load_snapshot()
+    
+    def revision(self) -> int:
+        """Changes whenever another process has written since the last check; this store's own writes keep it"""
+        with self._locked():
+            self._refresh()
+            return self._external_revision
+    
+    def load_all(self) -> List[Dict]:
+        """Load every application"""
+        with self._locked():
+            self._refresh()
+            return list(self._records.values())
+    
+    def get(self, application_id: int) -> Optional[Dict]:
+        """Return the latest stored copy of an application"""
+        with self._locked():
+            self._refresh()
+            application = self._records.get(application_id)
+        return json.loads(json.dumps(application)) if application is not None else None
+    
+    def allocate_id(self) -> int:
+        """Reserve the next application ID; IDs are never handed out twice"""
+        with self._locked():
+            self._refresh()
+            try:
+                last_id = int(self.seq_path.read_text())
+            except (FileNotFoundError, ValueError):
+                last_id = 0
+            next_id = max(last_id, self._max_id) + 1
+            self.seq_path.write_text(str(next_id))
+            return next_id
+    
+    def save_all(self, applications: List[Dict]):
+        """Replace the stored applications"""
+        with self._locked():
+            self._records = {app["id"]: app for app in applications}
+            self._max_id = max(self._records, default=0)
+            self._write()
+    
+    def insert(self, application: Dict):
+        application.setdefault("version", 1)
+        with self._locked():
+            self._refresh()
+            self._records[application["id"]] = application
+            self._max_id = max(self._max_id, application["id"])
+            self._commit_insert(application)
+    
+    def update(self, application: Dict, history_entry: Optional[Dict] = None, expected_version: Optional[int] = None):
+        """Store a changed application and bump its version.
+        
+        With `expected_version`, the write only succeeds if the stored version
+        still matches (compare-and-swap); otherwise VersionConflictError is raised.
+        """
+        with self._locked():
+            self._refresh()
+            current = self._records.get(application["id"])
+            current_version = current.get("version", 1) if current is not None else 0
+            if expected_version is not None and current_version != expected_version:
+                raise VersionConflictError(
+                    f"Application {application['id']} is at version {current_version}, expected {expected_version}"
+                )
+            application["version"] = current_version + 1
+            self._records[application["id"]] = application
+            self._commit_update(application, history_entry)
+    
+    def update_many(self, updates: List[Tuple[Dict, Optional[int]]]) -> List[int]:
+        """Apply several (application, expected_version) updates in one write.
+        
+        Updates whose version no longer matches are skipped; their IDs are returned.
+        """
+        conflicts, applied = [], []
+        with self._locked():
+            self._refresh()
+            for application, expected_version in updates:
+                current = self._records.get(application["id"])
+                current_version = current.get("version", 1) if current is not None else 0
+                if expected_version is not None and current_version != expected_version:
+                    conflicts.append(application["id"])
+                    continue
+                application["version"] = current_version + 1
+                self._records[application["id"]] = application
+                applied.append(application)
+            if applied:
+                self._commit_batch(applied)
+        return conflicts
+    
+    def close(self):
+        pass
+    
+    def _commit_insert(self, application: Dict):
+        self._write()
+    
+    def _commit_update(self, application: Dict, history_entry: Optional[Dict]):
+        self._write()
+    
+    def _commit_batch(self, applications: List[Dict]):
+        self._write()
+    
+    def _write(self):
+        # Write to a temporary file and rename so a crash never leaves a partial snapshot
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(self._snapshot_payload(), f, indent=self.indent)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self._snapshot_signature = _file_signature(self.path)
+
+class JournaledApplicationStore(JSONApplicationStore):
+    """JSON snapshot plus an append-only log of mutations.
+    
+    Each insert or update appends one compact JSON line to `<path>.log`, so write
+    cost follows the size of the change. The log is fsynced in batches (every
+    `fsync_every` records, or at most `fsync_interval` seconds after a write,
+    on a timer when no further write arrives) and folded into a new
+    snapshot every `compact_every` records. On load, the snapshot is read and the
+    log replayed on top; a torn last line from a crash is ignored. Other
+    processes' appends are picked up by reading only the new tail of the log.
+    
+    Log records carry increasing sequence numbers and the snapshot stores the
+    last one it includes, so records already folded into the snapshot are
+    skipped on replay, e.g. after a crash between writing the snapshot and
+    removing the old log.
+    """
+    
+    indent = None
+    
+    def __init__(self, path: str = "data/user_data/applications.json", fsync_every: int = 32,
+                 fsync_interval: float = 1.0, compact_every: int = 1000):
+        super().__init__(path)
+        self.log_path = self.path.with_name(self.path.name + ".log")
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.compact_every = compact_every
+        self._log = None
+        self._log_inode = None
+        self._log_offset = 0
+        self._log_records = 0
+        self._seq = 0
+        self._snapshot_seq = 0
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._sync_timer: Optional[threading.Timer] = None
+    
+    def _read_snapshot(self, data) -> List[Dict]:
+        self._snapshot_seq = data.get("seq", 0) if isinstance(data, dict) else 0
+        self._seq = self._snapshot_seq
+        return super()._read_snapshot(data)
+    
+    def _snapshot_payload(self) -> Any:
+        return {"seq": self._seq, "applications": list(self._records.values())}
+    
+    def _load_snapshot(self):
+        """Load the snapshot and replay the whole log on top of it"""
+        self._snapshot_seq = 0
+        self._seq = 0
+        super()._load_snapshot()
+        self._close_log()
+        self._log_inode = None
+        self._log_offset = 0
+        self._log_records = 0
+        self._replay_log()
+    
+    def _replay_log(self):
+        if not self.log_path.exists():
+            return
+        with open(self.log_path, 'rb') as f:
+            self._log_inode = os.fstat(f.fileno()).st_ino
+            f.seek(self._log_offset)
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    break
+                seq = record.get("seq")
+                if seq is None or seq > self._snapshot_seq:
+                    self._apply(record)
+                    self._external_revision += 1
+                    self._seq = max(self._seq, seq or 0)
+                self._log_records += 1
+                self._log_offset += len(line)
+        # Drop a torn tail so later appends start on a clean line
+        if self._log_offset < self.log_path.stat().st_size:
+            os.truncate(self.log_path, self._log_offset)
+    
+    def _refresh(self):
+        if _file_signature(self.path) != self._snapshot_signature:
+            self._load_snapshot()
+            return
+        
+        try:
+            stat = self.log_path.stat()
+        except FileNotFoundError:
+            if self._log_inode is not None:
+                self._load_snapshot()
+            return
+        if (self._log_inode is not None and stat.st_ino != self._log_inode) or stat.st_size < self._log_offset:
+            self._load_snapshot()
+        elif stat.st_size > self._log_offset or self._log_inode is None:
+            self._replay_log()
+    
+    def _apply(self, record: Dict):
+        application = record["application"]
+        if record["op"] == "insert":
+            self._records[application["id"]] = application
+            self._max_id = max(self._max_id, application["id"])
+            return
+        
+        current = self._records.get(application["id"])
+        if current is None:
+            return
+        history = current.get("history", [])
+        current.update(application)
+        current["history"] = history + ([record["history"]] if record.get("history") else [])
+    
+    def _append(self, record: Dict):
+        if self._log is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._log = open(self.log_path, 'ab')
+            self._log_inode = os.fstat(self._log.fileno()).st_ino
+        self._seq += 1
+        record["seq"] = self._seq
+        line = (json.dumps(record, separators=(',', ':')) + "\n").encode()
+        self._log.write(line)
+        self._log.flush()
+        self._log_offset += len(line)
+        self._log_records += 1
+        self._unsynced += 1
+        
+        if self._unsynced >= self.fsync_every or time.monotonic() - self._last_sync >= self.fsync_interval:
+            self._sync()
+        elif self._sync_timer is None:
+            # Bounds how long the last writes before an idle period stay unsynced
+            self._sync_timer = threading.Timer(self.fsync_interval, self._timed_sync)
+            self._sync_timer.daemon = True
+            self._sync_timer.start()
+        if self._log_records >= self.compact_every:
+            self._compact()
+    
+    def _timed_sync(self):
+        with self._thread_lock:
+            self._sync_timer = None
+            self._sync()
+    
+    def _sync(self):
+        if self._log is not None and self._unsynced:
+            os.fsync(self._log.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+    
+    def _close_log(self):
+        if self._log is not None:
+            self._sync()
+            self._log.close()
+            self._log = None
+    
+    def _compact(self):
+        """Write a new snapshot, then start an empty log"""
+        self._write()
+        self._close_log()
+        self.log_path.unlink(missing_ok=True)
+        self._log_inode = None
+        self._log_offset = 0
+        self._log_records = 0
+    
+    def _commit_insert(self, application: Dict):
+        self._append({"op": "insert", "application": application})
+    
+    def _commit_update(self, application: Dict, history_entry: Optional[Dict]):
+        """Log the changed fields and the new history entry, not the full history"""
+        fields = {k: v for k, v in application.items() if k != "history"}
+        self._append({"op": "update", "application": fields, "history": history_entry})
+    
+    def _commit_batch(self, applications: List[Dict]):
+        for application in applications:
+            self._commit_update(application, None)
+        self._sync()
+    
+    def save_all(self, applications: List[Dict]):
+        with self._locked():
+            self._records = {app["id"]: app for app in applications}
+            self._max_id = max(self._records, default=0)
+            self._compact()
+    
+    def compact(self):
+        """Fold the log into a new snapshot"""
+        with self._locked():
+            self._refresh()
+            self._compact()
+    
+    def close(self):
+        with self._locked():
+            if self._sync_timer is not None:
+                self._sync_timer.cancel()
+                self._sync_timer = None
+            self._close_log()
+
+class SQLiteApplicationStore:
+    """Row-level storage on SQLite, so each change only touches the affected rows.
+    
+    Applications live in one table with indexed user_id, status and next_followup
+    columns; status history is kept in a separate table. The database runs in
+    WAL mode so Streamlit sessions can read while another one writes.
+    """
+    
+    def __init__(self, db_path: str = "data/hr_assistant.db"):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        self._create_schema()
+    
+    def _create_schema(self):
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS applications (
+                    id INTEGER PRIMARY KEY,
+                    user_id TEXT NOT NULL,
+                    job_id TEXT,
+                    job_title TEXT,
+                    company TEXT,
+                    location TEXT,
+                    job_type TEXT,
+                    application_date TEXT,
+                    status TEXT,
+                    resume_match REAL,
+                    next_followup TEXT,
+                    salary_range TEXT,
+                    notes TEXT,
+                    version INTEGER NOT NULL DEFAULT 1,
+                    extra TEXT
+                )
+            """)
+            columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(applications)")}
+            if "version" not in columns:
+                self._conn.execute("ALTER TABLE applications ADD COLUMN version INTEGER NOT NULL DEFAULT 1")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS application_history (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    application_id INTEGER NOT NULL REFERENCES applications(id),
+                    date TEXT,
+                    status TEXT,
+                    notes TEXT,
+                    action TEXT
+                )
+            """)
+            self._conn.execute("CREATE TABLE IF NOT EXISTS id_sequence (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_applications_user ON applications(user_id)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_applications_status ON applications(status)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_applications_followup ON applications(next_followup)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_history_application ON application_history(application_id)")
+    
+    def _row_values(self, application: Dict) -> List[Any]:
+        extra = {k: v for k, v in application.items() if k not in APPLICATION_COLUMNS and k != "history"}
+        return [application.get(column) for column in APPLICATION_COLUMNS] + [json.dumps(extra) if extra else None]
+    
+    def _row_to_application(self, row: sqlite3.Row) -> Dict:
+        application = {column: row[column] for column in APPLICATION_COLUMNS}
+        if row["extra"]:
+            application.update(json.loads(row["extra"]))
+        application["history"] = []
+        return application
+    
+    def _insert_history(self, application_id: int, entries: List[Dict]):
+        self._conn.executemany(
+            "INSERT INTO application_history (application_id, date, status, notes, action) VALUES (?, ?, ?, ?, ?)",
+            [[application_id] + [entry.get(column) for column in HISTORY_COLUMNS] for entry in entries]
+        )
+    
+    def _query(self, where: str = "", params: tuple = ()) -> List[Dict]:
+        with self._lock:
+            rows = self._conn.execute(f"SELECT * FROM applications {where} ORDER BY id", params).fetchall()
+            applications = {row["id"]: self._row_to_application(row) for row in rows}
+            if not applications:
+                return []
+            
+            history = self._conn.execute(
+                f"SELECT * FROM application_history WHERE application_id IN (SELECT id FROM applications {where}) ORDER BY seq",
+                params
+            ).fetchall()
+        
+        for row in history:
+            application = applications.get(row["application_id"])
+            if application is not None:
+                application["history"].append({column: row[column] for column in HISTORY_COLUMNS})
+        return list(applications.values())
+    
+    def load_all(self) -> List[Dict]:
+        """Load every application with its history"""
+        return self._query()
+    
+    def get(self, application_id: int) -> Optional[Dict]:
+        """Return the latest stored copy of an application"""
+        applications = self._query("WHERE id = ?", (application_id,))
+        return applications[0] if applications else None
+    
+    def allocate_id(self) -> int:
+        """Reserve the next application ID from a sequence shared by all connections"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO id_sequence (name, value) "
+                "SELECT 'applications', COALESCE(MAX(id), 0) FROM applications"
+            )
+            self._conn.execute("UPDATE id_sequence SET value = value + 1 WHERE name = 'applications'")
+            return self._conn.execute("SELECT value FROM id_sequence WHERE name = 'applications'").fetchone()[0]
+    
+    def load_user(self, user_id: str) -> List[Dict]:
+        """Load one user's applications through the user_id index"""
+        return self._query("WHERE user_id = ?", (user_id,))
+    
+    def load_due(self, before: str) -> List[Dict]:
+        """Load applications whose follow-up is due on or before an ISO timestamp"""
+        return self._query("WHERE next_followup IS NOT NULL AND next_followup <= ?", (before,))
+    
+    def revision(self) -> int:
+        """Changes whenever another connection has committed since the last check"""
+        with self._lock:
+            return self._conn.execute("PRAGMA data_version").fetchone()[0]
+    
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM applications").fetchone()[0]
+    
+    def save_all(self, applications: List[Dict]):
+        """Replace the stored applications"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM application_history")
+            self._conn.execute("DELETE FROM applications")
+            for application in applications:
+                self._insert_row(application)
+    
+    def _insert_row(self, application: Dict):
+        application.setdefault("version", 1)
+        placeholders = ",".join("?" * (len(APPLICATION_COLUMNS) + 1))
+        self._conn.execute(
+            f"INSERT INTO applications ({','.join(APPLICATION_COLUMNS)}, extra) VALUES ({placeholders})",
+            self._row_values(application)
+        )
+        self._insert_history(application["id"], application.get("history", []))
+    
+    def insert(self, application: Dict):
+        with self._lock, self._conn:
+            self._insert_row(application)
+    
+    def update(self, application: Dict, history_entry: Optional[Dict] = None, expected_version: Optional[int] = None):
+        """Update an application's row, bump its version and append a single history entry.
+        
+        With `expected_version`, the row is only updated if its version still
+        matches (compare-and-swap); otherwise VersionConflictError is raised.
+        """
+        with self._lock, self._conn:
+            if not self._update_row(application, expected_version):
+                raise VersionConflictError(f"Application {application['id']} changed since version {expected_version}")
+            if history_entry is not None:
+                self._insert_history(application["id"], [history_entry])
+    
+    def update_many(self, updates: List[Tuple[Dict, Optional[int]]]) -> List[int]:
+        """Apply several (application, expected_version) updates in one transaction.
+        
+        Updates whose version no longer matches are skipped; their IDs are returned.
+        """
+        conflicts = []
+        with self._lock, self._conn:
+            for application, expected_version in updates:
+                if not self._update_row(application, expected_version):
+                    conflicts.append(application["id"])
+        return conflicts
+    
+    def _update_row(self, application: Dict, expected_version: Optional[int]) -> bool:
+        assignments = ",".join(f"{column} = ?" for column in APPLICATION_COLUMNS[1:-1])
+        values = self._row_values(application)
+        if expected_version is None:
+            cursor = self._conn.execute(
+                f"UPDATE applications SET {assignments}, version = version + 1, extra = ? WHERE id = ?",
+                values[1:-2] + [values[-1], application["id"]]
+            )
+        else:
+            cursor = self._conn.execute(
+                f"UPDATE applications SET {assignments}, version = version + 1, extra = ? WHERE id = ? AND version = ?",
+                values[1:-2] + [values[-1], application["id"], expected_version]
+            )
+        if cursor.rowcount == 0:
+            return False
+        application["version"] = self._conn.execute(
+            "SELECT version FROM applications WHERE id = ?", (application["id"],)
+        ).fetchone()[0]
+        return True
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+def migrate_json_to_sqlite(json_path: str, store: SQLiteApplicationStore) -> int:
+    """Copy applications from the legacy JSON file into an empty SQLite store.
+    
+    Returns the number of migrated applications. The migration runs once: it is
+    skipped when the database already holds applications, and the JSON file is
+    renamed to *.migrated afterwards so it is not imported again.
+    """
+    json_file = Path(json_path)
+    if not json_file.exists() or store.count() > 0:
+        return 0
+    
+    applications = JSONApplicationStore(json_path).load_all()
+    store.save_all(applications)
+    json_file.rename(json_file.with_name(json_file.name + ".migrated"))
+    return len(applications)
+
+def create_application_store(config: Optional[Dict] = None):
+    """Build the application store configured under `tracker`, migrating legacy JSON data"""
+    config = config or {}
+    tracker_config = config.get('tracker', {})
+    json_path = tracker_config.get('json_path', "data/user_data/applications.json")
+    
+    if tracker_config.get('backend', 'json') == 'sqlite':
+        store = SQLiteApplicationStore(config.get('database', {}).get('path', "data/hr_assistant.db"))
+        migrate_json_to_sqlite(json_path, store)
+        return store
+    if tracker_config.get('backend') == 'journal':
+        return JournaledApplicationStore(
+            json_path,
+            fsync_every=tracker_config.get('fsync_every', 32),
+            compact_every=tracker_config.get('compact_every', 1000)
+        )
+    return JSONApplicationStore(json_path)
@@ -0,0 +1,116 @@
+import logging
+import os
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+import pandas as pd
+import streamlit as st
+from src.utils.config import load_config
+
+logger = logging.getLogger(__name__)
+
+# Reruns kept per page for the timing readout
+RERUN_HISTORY = 50
+
+@st.cache_resource(show_spinner=False)
+def get_config() -> Dict:
+    """config.yaml, read once per server process"""
+    return load_config()
+
+@st.cache_resource(show_spinner=False)
+def get_application_store():
+    """One application store (SQLite connection or JSON file handle) per server process"""
+    from streamlit_app.application_store import create_application_store
+    return create_application_store(get_config())
+
+@st.cache_resource(show_spinner=False)
+def get_application_tracker():
+    """Tracker shared by every session, so reruns never re-read the applications.
+    
+    Writes go through the tracker itself, which keeps its indexes current and
+    bumps `revision`; views cached with st.cache_data take the revision as an
+    argument and are recomputed after each write. Pages call tracker.refresh()
+    on each rerun, which also moves `revision` when another process wrote to
+    the store.
+    """
+    from streamlit_app.job_application_tracker import JobApplicationTracker
+    return JobApplicationTracker(store=get_application_store())
+
+@st.cache_resource(show_spinner=False)
+def get_candidate_portal():
+    """Candidate portal with its parser, embedding model and job index loaded once"""
+    from streamlit_app.candidate_portal import CandidatePortal
+    return CandidatePortal()
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def applications_table(_tracker, user_id: str, revision: int) -> pd.DataFrame:
+    """Display table of a user's applications, cached until the tracker's next write"""
+    frame = _tracker.get_applications_frame(user_id)
+    return pd.DataFrame({
+        "ID": frame["id"],
+        "Position": frame["job_title"].fillna("Unknown"),
+        "Company": frame["company"].fillna("Unknown"),
+        "Status": frame["status"].fillna("Unknown"),
+        "Match %": (frame["resume_match"] * 100).round(1),
+        "Applied": frame["application_date"].dt.strftime("%Y-%m-%d").fillna("Unknown"),
+        "Location": frame["location"].fillna("Not specified"),
+        "Type": frame["job_type"].fillna("Full-time")
+    })
+
+@st.cache_resource(show_spinner=False)
+def get_resume_cache():
+    """Content-hash parse cache shared with the API, or None when disabled in config"""
+    from src.data_processing.resume_cache import ResumeCache
+    from src.data_processing.resume_parser import EnhancedResumeParser
+    return ResumeCache.from_config(get_config(), parser_version=EnhancedResumeParser.VERSION)
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def parse_uploaded_resume(content: bytes, filename: str, upload_dir: str = "data/raw_resumes") -> Dict:
+    """Save and parse an uploaded resume once per distinct file content.
+    
+    The file uploader keeps its file across reruns, so without this every widget
+    interaction on the page would write and re-parse the same resume. Across
+    sessions and restarts, the resume cache stores each distinct file once and
+    returns its earlier parse result.
+    """
+    portal = get_candidate_portal()
+    cache = get_resume_cache()
+    if cache is not None:
+        sha, file_path = cache.add_bytes(content, filename)
+        return cache.get_or_parse(file_path, portal.resume_parser.parse_resume, sha)
+    
+    os.makedirs(upload_dir, exist_ok=True)
+    file_path = os.path.join(upload_dir, os.path.basename(filename))
+    with open(file_path, "wb") as f:
+        f.write(content)
+    return portal.resume_parser.parse_resume(file_path)
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def match_jobs(profile: str, top_k: int, index_version: int, job_ids: Optional[Tuple[str, ...]] = None) -> List[Dict]:
+    """Job matches for a profile, among `job_ids` only when given.
+    
+    `index_version` (the index file's mtime) keys the cache to the loaded index.
+    """
+    portal = get_candidate_portal()
+    query_embedding = portal.embedding_model.encode([profile])[0]
+    return portal.job_index.search(query_embedding, top_k=top_k, ids=job_ids)
+
+@contextmanager
+def rerun_timer(page: str):
+    """Record how long a page took to render in this rerun"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        timings = st.session_state.setdefault("rerun_timings", {})
+        timings.setdefault(page, deque(maxlen=RERUN_HISTORY)).append(elapsed)
+        logger.debug("Rendered %s in %.1f ms", page, elapsed * 1000)
+        
+        if get_config().get('streamlit', {}).get('show_rerun_timings', False):
+            history = timings[page]
+            st.caption(
+                f"⏱️ {page}: {elapsed * 1000:.0f} ms this rerun, "
+                f"{sum(history) / len(history) * 1000:.0f} ms average over {len(history)} reruns"
+            )
@@ -1,12 +1,56 @@
 import streamlit as st
 from datetime import datetime
+from typing import Dict, List, Optional, Set
 from src.data_processing.resume_parser import EnhancedResumeParser
+from src.data_processing.salary import LocationIndex, SalaryIndex
 from src.ml_models.embedding_model import EmbeddingModel
+from src.ml_models.ann_index import IVFIndex
+from src.ml_models.model_registry import registry
+from streamlit_app.caching import get_candidate_portal, match_jobs, parse_uploaded_resume, rerun_timer
+
+JOB_INDEX_PATH = "models/job_index.npz"
+SALARY_INDEX_PATH = "models/salary_index.json"
+JOB_LOCATIONS_PATH = "models/job_locations.json"
+# Filters leaving at most this many postings per requested match are ranked exactly;
+# otherwise this many nearest neighbours per match are fetched, widening until enough pass
+FILTER_OVERFETCH = 10
+
+def filtered_matches(profile: str, top_k: int, allowed: Set[str], index_size: int, index_version: int) -> List[Dict]:
+    """Best top_k matches among the `allowed` job ids"""
+    if len(allowed) <= top_k * FILTER_OVERFETCH:
+        return match_jobs(profile, top_k, index_version, tuple(sorted(allowed)))
+    
+    fetch = top_k * FILTER_OVERFETCH
+    while True:
+        matches = [match for match in match_jobs(profile, fetch, index_version) if match['id'] in allowed]
+        if len(matches) >= top_k:
+            return matches[:top_k]
+        if fetch >= index_size:
+            # The probed lists held too few of them; rank the allowed postings exactly
+            return match_jobs(profile, top_k, index_version, tuple(sorted(allowed)))
+        fetch = min(fetch * 4, index_size)
 
 class CandidatePortal:
     def __init__(self):
-        self.resume_parser = EnhancedResumeParser()
-        self.embedding_model = EmbeddingModel()
+        self.resume_parser = registry.get("resume_parser", EnhancedResumeParser)
+        self.embedding_model = registry.get(
+            "embedding_model:portal",
+            lambda: EmbeddingModel(cache_dir="models/embedding_cache")
+        )
+    
+    @property
+    def job_index(self) -> Optional[IVFIndex]:
+        """Job index from disk, picked up again whenever train_models rebuilds it; None until built"""
+        return registry.get_file("job_index", JOB_INDEX_PATH, IVFIndex.load)
+    
+    @property
+    def salary_index(self) -> SalaryIndex:
+        return registry.get_file("salary_index", SALARY_INDEX_PATH, SalaryIndex.load) or SalaryIndex()
+    
+    @property
+    def location_index(self) -> LocationIndex:
+        """Location tokens of every indexed posting, including those without a salary"""
+        return registry.get_file("job_locations", JOB_LOCATIONS_PATH, LocationIndex.load) or LocationIndex()
     
     def render_portal(self):
         st.title("🎯 Candidate Portal")
@@ -26,22 +70,17 @@ class CandidatePortal:
         st.header("📄 Upload Your Resume")
         
         uploaded_file = st.file_uploader(
-            "Choose a resume file", 
+            "Choose a resume file",
             type=["pdf", "docx", "txt"],
             help="Supported formats: PDF, DOCX, TXT"
         )
         
         if uploaded_file is not None:
-            file_path = f"data/raw_resumes/{uploaded_file.name}"
-            os.makedirs("data/raw_resumes", exist_ok=True)
-            
-            with open(file_path, "wb") as f:
-                f.write(uploaded_file.getbuffer())
-            
             with st.spinner("Analyzing your resume..."):
-                result = self.resume_parser.parse_resume(file_path)
+                result = parse_uploaded_resume(uploaded_file.getvalue(), uploaded_file.name)
             
             st.success("Resume uploaded and analyzed successfully!")
+            st.session_state.resume_profile = self.build_profile_text(result)
             
             col1, col2 = st.columns(2)
             
@@ -66,13 +105,70 @@ class CandidatePortal:
         st.header("🔍 Profile Analysis")
         st.info("Profile analysis features will be implemented here")
     
+    def build_profile_text(self, result):
+        """Flatten a parsed resume into the text used for job matching"""
+        parts = []
+        for skills in result.get("skills", {}).values():
+            parts.extend(skills)
+        parts.extend(result.get("education", []))
+        return ", ".join(str(part) for part in parts)
+    
     def render_job_matching(self):
         st.header("🤝 Job Matching")
-        st.info("Job matching features will be implemented here")
+        
+        job_index = self.job_index
+        if job_index is None or len(job_index) == 0:
+            st.info("No job index found. Build one with `python scripts/train_models.py --job-index`.")
+            return
+        
+        profile = st.text_area(
+            "Profile used for matching",
+            value=st.session_state.get("resume_profile", ""),
+            help="Filled in from your uploaded resume; edit it to explore other matches"
+        )
+        top_k = st.slider("Number of matches", 1, 50, 10)
+        
+        salary_index = self.salary_index
+        currencies = salary_index.currencies() or ["USD"]
+        col1, col2, col3 = st.columns([2, 1, 2])
+        with col1:
+            min_salary = st.number_input("Minimum yearly salary", min_value=0, value=0, step=5000)
+        with col2:
+            # Salaries are not converted, so the minimum applies to postings in one currency
+            currency = st.selectbox("Currency", currencies,
+                                    index=currencies.index("USD") if "USD" in currencies else 0)
+        with col3:
+            location = st.text_input("Location", placeholder="e.g., Austin, TX or Remote")
+        
+        if profile.strip():
+            allowed = None
+            if min_salary:
+                # A minimum salary only covers postings that state one
+                allowed = set(salary_index.search(min_salary=min_salary, currency=currency))
+            if location.strip():
+                location_index = self.location_index
+                if len(location_index) == 0:
+                    st.warning("No job locations found; rebuild the job index to filter by location.")
+                else:
+                    located = location_index.search(location)
+                    allowed = located if allowed is None else allowed & located
+            
+            index_version = registry.file_version("job_index")
+            if allowed is None:
+                matches = match_jobs(profile, top_k, index_version)
+            else:
+                matches = filtered_matches(profile, top_k, allowed, len(job_index), index_version)
+            
+            st.caption(f"Searched {len(job_index)} job postings")
+            for match in matches:
+                salary = salary_index.get(match['id'])
+                pay = (f" — {salary['currency'] or ''} {salary['annual_min']:,.0f}–{salary['annual_max']:,.0f}/yr"
+                       if salary else "")
+                st.write(f"- **{match['id']}** — {match['similarity'] * 100:.1f}% match{pay}")
 
 def main():
-    portal = CandidatePortal()
-    portal.render_portal()
+    with rerun_timer("candidate_portal"):
+        get_candidate_portal().render_portal()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,181 @@
+import queue
+import smtplib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.message import Message
+from typing import Any, Dict, Hashable, List, Tuple
+
+# Errors after which the connection is dropped and the message retried on a fresh one
+TRANSIENT_ERRORS = (smtplib.SMTPServerDisconnected, OSError)
+
+class SMTPConnectionPool:
+    """Bounded pool of logged-in SMTP connections.
+    
+    Connections are opened on demand (STARTTLS and login happen once per
+    connection, not per message), handed out to one worker at a time and
+    recycled after `max_messages_per_connection` messages.
+    """
+    
+    def __init__(self, settings: Dict[str, Any], size: int = 4, max_messages_per_connection: int = 500,
+                 timeout: float = 30):
+        self.settings = settings
+        self.size = size
+        self.max_messages_per_connection = max_messages_per_connection
+        self.timeout = timeout
+        self._idle: "queue.LifoQueue" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._sent: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+    
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.settings.get('smtp_server'), self.settings.get('smtp_port'), timeout=self.timeout)
+        if self.settings.get('use_tls', True):
+            server.starttls()
+        if self.settings.get('username'):
+            server.login(self.settings.get('username'), self.settings.get('password'))
+        with self._lock:
+            self.connections_opened += 1
+        return server
+    
+    def acquire(self) -> smtplib.SMTP:
+        """Take an idle connection, or open one if the pool is not full"""
+        self._slots.acquire()
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            return self._connect()
+        except Exception:
+            self._slots.release()
+            raise
+    
+    def release(self, server: smtplib.SMTP, sent: int = 0, broken: bool = False):
+        """Return a connection; broken or worn-out connections are closed instead"""
+        total = self._sent.pop(id(server), 0) + sent
+        if broken or total >= self.max_messages_per_connection:
+            self._close(server)
+        else:
+            self._sent[id(server)] = total
+            self._idle.put(server)
+        self._slots.release()
+    
+    def _close(self, server: smtplib.SMTP):
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+    
+    def close(self):
+        """Close every idle connection"""
+        while True:
+            try:
+                server = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._sent.pop(id(server), None)
+            self._close(server)
+
+class EmailDeliveryPipeline:
+    """Sends many messages over pooled connections from a bounded worker pool.
+    
+    Messages are split into batches of `batch_size`; each worker sends a whole
+    batch over one connection. A message that fails with a transient error is
+    retried on a fresh connection with exponential backoff, up to `max_retries`
+    times; permanent SMTP rejections are not retried.
+    """
+    
+    def __init__(self, settings: Dict[str, Any], workers: int = 4, batch_size: int = 50,
+                 max_retries: int = 3, backoff: float = 0.5, pool: SMTPConnectionPool = None):
+        self.settings = settings
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.pool = pool or SMTPConnectionPool(settings, size=workers)
+        self._metrics = {"sent": 0, "failed": 0, "retries": 0, "batches": 0, "seconds": 0.0}
+        self._metrics_lock = threading.Lock()
+    
+    def _count(self, **increments):
+        with self._metrics_lock:
+            for name, value in increments.items():
+                self._metrics[name] += value
+    
+    def _send_batch(self, batch: List[Tuple[Hashable, Message]]) -> Dict[Hashable, bool]:
+        results = {}
+        pending = list(batch)
+        attempt = 0
+        while pending:
+            try:
+                server = self.pool.acquire()
+            except Exception as e:
+                print(f"Failed to connect to SMTP server: {e}")
+                server = None
+            
+            sent = 0
+            broken = server is None
+            while pending and not broken:
+                key, message = pending[0]
+                try:
+                    server.send_message(message)
+                    results[key] = True
+                    sent += 1
+                except smtplib.SMTPRecipientsRefused as e:
+                    print(f"Failed to send email: {e}")
+                    results[key] = False
+                except smtplib.SMTPResponseException as e:
+                    if 400 <= e.smtp_code < 500:
+                        broken = True
+                        continue
+                    print(f"Failed to send email: {e}")
+                    results[key] = False
+                except TRANSIENT_ERRORS:
+                    broken = True
+                    continue
+                pending.pop(0)
+            
+            if server is not None:
+                self.pool.release(server, sent=sent, broken=broken)
+            if not pending:
+                break
+            
+            attempt += 1
+            if attempt > self.max_retries:
+                for key, _ in pending:
+                    results[key] = False
+                break
+            self._count(retries=len(pending))
+            time.sleep(self.backoff * 2 ** (attempt - 1))
+        
+        succeeded = sum(results.values())
+        self._count(sent=succeeded, failed=len(results) - succeeded, batches=1)
+        return results
+    
+    def send_many(self, messages: List[Tuple[Hashable, Message]]) -> Dict[Hashable, bool]:
+        """Send (key, message) pairs; returns whether each key was delivered"""
+        if not messages:
+            return {}
+        start = time.perf_counter()
+        batches = [messages[i:i + self.batch_size] for i in range(0, len(messages), self.batch_size)]
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(batches))) as executor:
+            for batch_results in executor.map(self._send_batch, batches):
+                results.update(batch_results)
+        self._count(seconds=time.perf_counter() - start)
+        return results
+    
+    def send(self, message: Message) -> bool:
+        return self.send_many([(0, message)])[0]
+    
+    def stats(self) -> Dict[str, Any]:
+        """Delivery counters plus connection reuse"""
+        with self._metrics_lock:
+            stats = dict(self._metrics)
+        stats["connections_opened"] = self.pool.connections_opened
+        stats["messages_per_second"] = round(stats["sent"] / stats["seconds"], 1) if stats["seconds"] else 0.0
+        return stats
+    
+    def close(self):
+        self.pool.close()
@@ -1,40 +1,179 @@
 import streamlit as st
-import json
+import bisect
+import functools
+import threading
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Callable, Optional
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+from streamlit_app.application_store import JSONApplicationStore, VersionConflictError
+from streamlit_app.caching import applications_table, get_application_tracker, rerun_timer
+
+def synchronized(method):
+    """Run a tracker method under the tracker's lock; one tracker is shared by all sessions"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
 
 class JobApplicationTracker:
-    def __init__(self, data_path: str = "data/user_data/applications.json"):
+    # Compare-and-swap attempts before a mutation gives up on a contended application
+    MAX_UPDATE_RETRIES = 5
+    
+    def __init__(self, data_path: str = "data/user_data/applications.json", store=None):
         self.data_path = Path(data_path)
-        self.applications = self.load_applications()
+        self.store = store if store is not None else JSONApplicationStore(data_path)
+        self._lock = threading.RLock()
+        # Bumped on every change so cached views can be keyed on it
+        self.revision = 0
+        # Applications are read per user on first access; JSON stores can only be read whole
+        self.applications: List[Dict] = []
+        self._loaded_users = set()
+        self._all_loaded = False
+        self._store_revision = self.store.revision()
+        self._build_indexes()
     
     def load_applications(self) -> List[Dict]:
-        """Load applications from JSON file"""
-        if self.data_path.exists():
-            try:
-                with open(self.data_path, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                return []
-        return []
-    
+        """Load applications from the store"""
+        return self.store.load_all()
+    
+    def _load_all(self):
+        if not self._all_loaded:
+            self.applications = self.load_applications()
+            self._build_indexes()
+            self._all_loaded = True
+    
+    def _ensure_user(self, user_id: str):
+        """Read a user's applications through the store's user index the first time they are needed"""
+        if self._all_loaded or user_id in self._loaded_users:
+            return
+        if not hasattr(self.store, "load_user"):
+            self._load_all()
+            return
+        for app in self.store.load_user(user_id):
+            if app.get("id") not in self._by_id:
+                self.applications.append(app)
+                self._index_application(app)
+        self._loaded_users.add(user_id)
+    
+    @synchronized
+    def refresh(self) -> bool:
+        """Drop what was read from the store if another process wrote to it since; returns whether it did.
+        
+        The applications are read again lazily, and `revision` moves on so cached
+        views are rebuilt.
+        """
+        store_revision = self.store.revision()
+        if store_revision == self._store_revision:
+            return False
+        self._store_revision = store_revision
+        self.applications = []
+        self._loaded_users = set()
+        self._all_loaded = False
+        self._build_indexes()
+        self.revision += 1
+        return True
+    
+    @synchronized
     def save_applications(self):
-        """Save applications to JSON file"""
-        self.data_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.data_path, 'w') as f:
-            json.dump(self.applications, f, indent=2)
-    
+        """Write every application back to the store"""
+        self._load_all()
+        self._build_indexes()
+        self.store.save_all(self.applications)
+    
+    def _build_indexes(self):
+        """Rebuild the id, user, status and follow-up indexes from self.applications"""
+        self._by_id: Dict[int, Dict] = {}
+        self._by_user: Dict[str, Dict[int, Dict]] = {}
+        self._by_status: Dict[str, Dict[str, Dict[int, Dict]]] = {}
+        # Per user, sorted (follow-up date, id) pairs plus the key each application is filed under
+        self._followups: Dict[str, List[tuple]] = {}
+        self._followup_keys: Dict[int, tuple] = {}
+        # Per user running match-score sum/count and applications per application date
+        self._aggregates: Dict[str, Dict[str, Any]] = {}
+        self._activity_keys: Dict[int, str] = {}
+        # Per user DataFrame view, dropped whenever one of the user's applications changes
+        self._frames: Dict[str, pd.DataFrame] = {}
+        for app in self.applications:
+            self._index_application(app)
+    
+    def _index_application(self, app: Dict, keep_membership: bool = False):
+        """Add an application to every index; with keep_membership, only to the derived ones"""
+        self.revision += 1
+        app_id = app.get("id")
+        user_id = app.get("user_id")
+        if not keep_membership:
+            self._by_id[app_id] = app
+            self._by_user.setdefault(user_id, {})[app_id] = app
+            self._by_status.setdefault(user_id, {}).setdefault(app.get("status", "Unknown"), {})[app_id] = app
+        self._frames.pop(user_id, None)
+        
+        aggregates = self._aggregates.setdefault(user_id, {"match_sum": 0.0, "match_count": 0, "activity": {}})
+        if app.get("resume_match"):
+            aggregates["match_sum"] += app["resume_match"]
+            aggregates["match_count"] += 1
+        try:
+            activity_key = datetime.fromisoformat(app["application_date"]).date().isoformat()
+            aggregates["activity"][activity_key] = aggregates["activity"].get(activity_key, 0) + 1
+            self._activity_keys[app_id] = activity_key
+        except (KeyError, ValueError, TypeError):
+            pass
+        
+        try:
+            key = (datetime.fromisoformat(app["next_followup"]).date().isoformat(), app_id)
+        except (KeyError, ValueError, TypeError):
+            return
+        bisect.insort(self._followups.setdefault(user_id, []), key)
+        self._followup_keys[app_id] = key
+    
+    def _unindex_application(self, app: Dict, keep_membership: bool = False):
+        app_id = app.get("id")
+        user_id = app.get("user_id")
+        if not keep_membership:
+            self._by_id.pop(app_id, None)
+            self._by_user.get(user_id, {}).pop(app_id, None)
+            self._remove_from_status_group(app)
+        self._frames.pop(user_id, None)
+        
+        aggregates = self._aggregates.get(user_id)
+        if aggregates is not None:
+            if app.get("resume_match"):
+                aggregates["match_sum"] -= app["resume_match"]
+                aggregates["match_count"] -= 1
+            activity_key = self._activity_keys.pop(app_id, None)
+            if activity_key is not None:
+                aggregates["activity"][activity_key] -= 1
+                if not aggregates["activity"][activity_key]:
+                    del aggregates["activity"][activity_key]
+        
+        key = self._followup_keys.pop(app_id, None)
+        if key is not None:
+            followups = self._followups[user_id]
+            position = bisect.bisect_left(followups, key)
+            if position < len(followups) and followups[position] == key:
+                del followups[position]
+    
+    def _remove_from_status_group(self, app: Dict):
+        status_groups = self._by_status.get(app.get("user_id"), {})
+        status = app.get("status", "Unknown")
+        status_groups.get(status, {}).pop(app.get("id"), None)
+        if status in status_groups and not status_groups[status]:
+            del status_groups[status]
+    
+    @synchronized
     def add_application(self, user_id: str, job_data: Dict, resume_match: float) -> Dict:
         """Add a new job application"""
+        self._ensure_user(user_id)
+        application_id = self.store.allocate_id()
         application = {
-            "id": len(self.applications) + 1,
+            "id": application_id,
             "user_id": user_id,
-            "job_id": job_data.get("id", f"job_{len(self.applications) + 1}"),
+            "job_id": job_data.get("id", f"job_{application_id}"),
             "job_title": job_data.get("title", "Unknown Position"),
             "company": job_data.get("company", "Unknown Company"),
             "location": job_data.get("location", "Not specified"),
@@ -52,104 +191,171 @@ class JobApplicationTracker:
                     "notes": "Application submitted",
                     "action": "submitted"
                 }
-            ]
+            ],
+            "version": 1
         }
         
         self.applications.append(application)
-        self.save_applications()
+        self._index_application(application)
+        self.store.insert(application)
         return application
     
+    @synchronized
     def get_user_applications(self, user_id: str) -> List[Dict]:
         """Get all applications for a specific user"""
-        return [app for app in self.applications if app.get("user_id") == user_id]
+        self._ensure_user(user_id)
+        return list(self._by_user.get(user_id, {}).values())
     
+    @synchronized
     def get_application(self, application_id: int) -> Optional[Dict]:
-        """Get a specific application by ID"""
-        for app in self.applications:
-            if app.get("id") == application_id:
-                return app
-        return None
+        """Get a specific application by ID, reading the store when it is not loaded yet.
+        
+        That covers applications another process added for a user already loaded here.
+        """
+        if application_id not in self._by_id:
+            stored = self.store.get(application_id)
+            if stored is None:
+                return None
+            user_id = stored.get("user_id")
+            if self._all_loaded or user_id in self._loaded_users:
+                self.applications.append(stored)
+                self._index_application(stored)
+                self.revision += 1
+            else:
+                self._ensure_user(user_id)
+        return self._by_id.get(application_id)
+    
+    def _replace_application(self, app: Dict, new_values: Dict):
+        """Swap in new field values, keeping the same dict referenced by self.applications.
+        
+        The id and user indexes hold that same dict, so they are left alone and a
+        user's applications keep their order; only a status change moves it between groups.
+        """
+        old_status = app.get("status", "Unknown")
+        self._unindex_application(app, keep_membership=True)
+        if new_values.get("status", "Unknown") != old_status:
+            self._remove_from_status_group(app)
+        app.clear()
+        app.update(new_values)
+        self._index_application(app, keep_membership=True)
+        status_group = self._by_status.setdefault(app.get("user_id"), {}).setdefault(app.get("status", "Unknown"), {})
+        status_group[app.get("id")] = app
+    
+    def _refresh_application(self, application_id: int):
+        """Reload one application from the store after another writer changed it"""
+        latest = self.store.get(application_id)
+        app = self.get_application(application_id)
+        if latest is None or app is None:
+            return
+        self._replace_application(app, latest)
+    
+    @synchronized
+    def _apply_change(self, application_id: int, change: Callable[[Dict], Optional[Dict]]) -> bool:
+        """Apply `change` to a copy of an application and store it with compare-and-swap.
+        
+        `change` edits the copy in place and returns the history entry to record
+        (or None). If another writer updated the application first, it is reloaded
+        and the change re-applied on top of the newer version.
+        """
+        for _ in range(self.MAX_UPDATE_RETRIES):
+            app = self.get_application(application_id)
+            if app is None:
+                return False
+            
+            updated = dict(app)
+            updated["history"] = list(app.get("history", []))
+            history_entry = change(updated)
+            try:
+                self.store.update(updated, history_entry, expected_version=app.get("version", 1))
+            except VersionConflictError:
+                self._refresh_application(application_id)
+                continue
+            
+            self._replace_application(app, updated)
+            return True
+        raise VersionConflictError(f"Application {application_id} kept changing; gave up after {self.MAX_UPDATE_RETRIES} attempts")
     
     def update_application_status(self, application_id: int, status: str, notes: str = "", action: str = "updated"):
         """Update application status and add to history"""
-        for app in self.applications:
-            if app.get("id") == application_id:
-                app["status"] = status
-                if notes:
-                    app["notes"] = notes
-                
-                app["history"].append({
-                    "date": datetime.now().isoformat(),
-                    "status": status,
-                    "notes": notes,
-                    "action": action
-                })
-                
-                # Update next follow-up date based on status
-                if status == "Interviewing":
-                    app["next_followup"] = (datetime.now() + timedelta(days=3)).isoformat()
-                elif status == "Applied":
-                    app["next_followup"] = (datetime.now() + timedelta(days=7)).isoformat()
-                
-                self.save_applications()
-                return True
-        return False
+        def change(app: Dict) -> Dict:
+            app["status"] = status
+            if notes:
+                app["notes"] = notes
+            
+            history_entry = {
+                "date": datetime.now().isoformat(),
+                "status": status,
+                "notes": notes,
+                "action": action
+            }
+            app["history"].append(history_entry)
+            
+            # Update next follow-up date based on status
+            if status == "Interviewing":
+                app["next_followup"] = (datetime.now() + timedelta(days=3)).isoformat()
+            elif status == "Applied":
+                app["next_followup"] = (datetime.now() + timedelta(days=7)).isoformat()
+            return history_entry
+        
+        return self._apply_change(application_id, change)
     
     def add_note(self, application_id: int, note: str):
         """Add a note to an application"""
-        for app in self.applications:
-            if app.get("id") == application_id:
-                app["notes"] = note
-                app["history"].append({
-                    "date": datetime.now().isoformat(),
-                    "status": app["status"],
-                    "notes": note,
-                    "action": "note_added"
-                })
-                self.save_applications()
-                return True
-        return False
+        def change(app: Dict) -> Dict:
+            app["notes"] = note
+            history_entry = {
+                "date": datetime.now().isoformat(),
+                "status": app["status"],
+                "notes": note,
+                "action": "note_added"
+            }
+            app["history"].append(history_entry)
+            return history_entry
+        
+        return self._apply_change(application_id, change)
+    
+    def set_next_followup(self, application_id: int, followup_date: str):
+        """Reschedule the next follow-up of an application"""
+        def change(app: Dict) -> None:
+            app["next_followup"] = followup_date
+        
+        return self._apply_change(application_id, change)
     
+    @synchronized
     def get_upcoming_followups(self, user_id: str, days_ahead: int = 7) -> List[Dict]:
-        """Get applications with upcoming follow-ups"""
-        user_apps = self.get_user_applications(user_id)
+        """Get applications with upcoming follow-ups, read from the sorted follow-up index"""
+        self._ensure_user(user_id)
+        followups = self._followups.get(user_id, [])
         today = datetime.now().date()
+        start = bisect.bisect_left(followups, (today.isoformat(),))
+        end = bisect.bisect_left(followups, ((today + timedelta(days=days_ahead + 1)).isoformat(),))
         
         upcoming = []
-        for app in user_apps:
-            if "next_followup" in app:
-                try:
-                    followup_date = datetime.fromisoformat(app["next_followup"]).date()
-                    days_until = (followup_date - today).days
-                    
-                    if 0 <= days_until <= days_ahead:
-                        app_copy = app.copy()
-                        app_copy["days_until_followup"] = days_until
-                        app_copy["followup_date"] = followup_date.strftime("%Y-%m-%d")
-                        upcoming.append(app_copy)
-                except (ValueError, TypeError):
-                    continue
+        for followup_key, app_id in followups[start:end]:
+            followup_date = datetime.fromisoformat(followup_key).date()
+            app_copy = self._by_id[app_id].copy()
+            app_copy["days_until_followup"] = (followup_date - today).days
+            app_copy["followup_date"] = followup_date.strftime("%Y-%m-%d")
+            upcoming.append(app_copy)
         
-        return sorted(upcoming, key=lambda x: x.get("days_until_followup", 999))
+        return upcoming
     
+    @synchronized
     def get_applications_by_status(self, user_id: str) -> Dict[str, List[Dict]]:
         """Get applications grouped by status"""
-        user_apps = self.get_user_applications(user_id)
-        status_groups = {}
-        
-        for app in user_apps:
-            status = app.get("status", "Unknown")
-            if status not in status_groups:
-                status_groups[status] = []
-            status_groups[status].append(app)
-        
-        return status_groups
+        self._ensure_user(user_id)
+        return {
+            status: list(apps.values())
+            for status, apps in self._by_status.get(user_id, {}).items()
+        }
     
+    @synchronized
     def get_application_stats(self, user_id: str) -> Dict[str, Any]:
-        """Get statistics about applications"""
-        user_apps = self.get_user_applications(user_id)
+        """Get statistics about applications from the maintained per-user aggregates"""
+        self._ensure_user(user_id)
+        total = len(self._by_user.get(user_id, {}))
         
-        if not user_apps:
+        if not total:
             return {
                 "total": 0,
                 "by_status": {},
@@ -157,33 +363,44 @@ class JobApplicationTracker:
                 "recent_activity": 0
             }
         
-        # Count by status
-        status_counts = {}
-        for app in user_apps:
-            status = app.get("status", "Unknown")
-            status_counts[status] = status_counts.get(status, 0) + 1
-        
-        # Calculate average match score
-        match_scores = [app.get("resume_match", 0) for app in user_apps if app.get("resume_match")]
-        avg_match = sum(match_scores) / len(match_scores) if match_scores else 0
+        aggregates = self._aggregates[user_id]
+        status_counts = {status: len(apps) for status, apps in self._by_status.get(user_id, {}).items()}
+        avg_match = aggregates["match_sum"] / aggregates["match_count"] if aggregates["match_count"] else 0
         
-        # Count applications from last 30 days
-        recent_count = 0
-        thirty_days_ago = datetime.now() - timedelta(days=30)
-        for app in user_apps:
-            try:
-                app_date = datetime.fromisoformat(app.get("application_date", ""))
-                if app_date >= thirty_days_ago:
-                    recent_count += 1
-            except (ValueError, TypeError):
-                continue
+        # Applications from the last 30 days, summed over at most 31 daily buckets
+        today = datetime.now().date()
+        activity = aggregates["activity"]
+        recent_count = sum(activity.get((today - timedelta(days=offset)).isoformat(), 0) for offset in range(31))
         
         return {
-            "total": len(user_apps),
+            "total": total,
             "by_status": status_counts,
             "avg_match_score": round(avg_match * 100, 1),
             "recent_activity": recent_count
         }
+    
+    @synchronized
+    def get_applications_frame(self, user_id: str) -> pd.DataFrame:
+        """Columnar view of a user's applications with pre-parsed datetime64 date columns.
+        
+        Built once per user and reused until one of the user's applications changes.
+        """
+        self._ensure_user(user_id)
+        frame = self._frames.get(user_id)
+        if frame is not None:
+            return frame
+        
+        columns = ["id", "job_title", "company", "status", "resume_match", "application_date",
+                   "next_followup", "location", "job_type"]
+        frame = pd.DataFrame.from_records(
+            [{column: app.get(column) for column in columns} for app in self.get_user_applications(user_id)],
+            columns=columns
+        )
+        frame["resume_match"] = frame["resume_match"].astype(np.float64).fillna(0.0)
+        frame["application_date"] = pd.to_datetime(frame["application_date"], errors="coerce")
+        frame["next_followup"] = pd.to_datetime(frame["next_followup"], errors="coerce")
+        self._frames[user_id] = frame
+        return frame
 
 def render_application_tracker():
     """Render the job application tracker interface"""
@@ -195,8 +412,14 @@ def render_application_tracker():
         return
     
     user_id = st.session_state.get("user_id")
-    tracker = JobApplicationTracker()
-    
+    with rerun_timer("application_tracker"):
+        tracker = get_application_tracker()
+        # Pick up writes from the reminder worker, the API or other server processes
+        tracker.refresh()
+        render_tracker_dashboard(tracker, user_id)
+
+def render_tracker_dashboard(tracker: JobApplicationTracker, user_id: str):
+    """Render statistics and tabs for one user"""
     # Display application statistics
     stats = tracker.get_application_stats(user_id)
     
@@ -247,26 +470,8 @@ def render_all_applications(tracker: JobApplicationTracker, user_id: str):
         st.info("No applications found. Start by adding your first job application!")
         return
     
-    # Create DataFrame for display
-    app_data = []
-    for app in applications:
-        try:
-            app_date = datetime.fromisoformat(app.get("application_date", "")).strftime("%Y-%m-%d")
-        except (ValueError, TypeError):
-            app_date = "Unknown"
-        
-        app_data.append({
-            "ID": app.get("id"),
-            "Position": app.get("job_title", "Unknown"),
-            "Company": app.get("company", "Unknown"),
-            "Status": app.get("status", "Unknown"),
-            "Match %": f"{app.get('resume_match', 0) * 100:.1f}%",
-            "Applied": app_date,
-            "Location": app.get("location", "Not specified"),
-            "Type": app.get("job_type", "Full-time")
-        })
-    
-    df = pd.DataFrame(app_data)
+    # Display table, cached until the tracker's next write
+    df = applications_table(tracker, user_id, tracker.revision)
     
     # Add filtering options
     col1, col2, col3 = st.columns(3)
@@ -292,7 +497,7 @@ def render_all_applications(tracker: JobApplicationTracker, user_id: str):
     filtered_df = df[
         (df["Status"].isin(status_filter)) &
         (df["Company"].isin(company_filter)) &
-        (df["Match %"].str.replace('%', '').astype(float) >= match_threshold)
+        (df["Match %"] >= match_threshold)
     ]
     
     st.dataframe(
@@ -303,7 +508,7 @@ def render_all_applications(tracker: JobApplicationTracker, user_id: str):
             "ID": st.column_config.NumberColumn("ID", width="small"),
             "Match %": st.column_config.ProgressColumn(
                 "Match %",
-                format="%f%%",
+                format="%.1f%%",
                 min_value=0,
                 max_value=100,
             )
@@ -395,10 +600,7 @@ def render_upcoming_followups(tracker: JobApplicationTracker, user_id: str):
                         key=f"date_{app.get('id')}"
                     )
                     if st.button("Confirm", key=f"confirm_{app.get('id')}"):
-                        app_obj = tracker.get_application(app.get('id'))
-                        if app_obj:
-                            app_obj["next_followup"] = new_date.isoformat()
-                            tracker.save_applications()
+                        if tracker.set_next_followup(app.get('id'), new_date.isoformat()):
                             st.rerun()
 
 def render_add_application(tracker: JobApplicationTracker, user_id: str):
@@ -0,0 +1,181 @@
+import json
+import logging
+import sqlite3
+import threading
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class ReminderOutbox:
+    """Durable queue of reminder emails between "due" and "sent".
+    
+    Due reminders are enqueued under a dedup key (application id + follow-up
+    time), so enqueueing the same follow-up twice is a no-op. Workers claim
+    pending rows with a time-limited lease, send them, and mark them sent or
+    schedule a retry. A worker that dies mid-send leaves its lease to expire,
+    after which another worker picks the rows up again (at-least-once delivery).
+    Several workers can drain the same outbox; each claim takes disjoint rows.
+    Rows that fail max_attempts times are marked failed and logged; retry_failed
+    puts them back in the queue.
+    """
+    
+    def __init__(self, db_path: str = "data/hr_assistant.db", lease_seconds: float = 300,
+                 max_attempts: int = 5, retry_delay: timedelta = timedelta(hours=1)):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        self._create_schema()
+    
+    def _create_schema(self):
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS reminder_outbox (
+                    dedup_key TEXT PRIMARY KEY,
+                    application_id INTEGER NOT NULL,
+                    user_email TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    available_at TEXT NOT NULL,
+                    lease_owner TEXT,
+                    lease_expires TEXT,
+                    created_at TEXT NOT NULL,
+                    sent_at TEXT,
+                    last_error TEXT
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_outbox_ready ON reminder_outbox(status, available_at)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_outbox_lease ON reminder_outbox(lease_owner)")
+    
+    def enqueue(self, entries: List[Tuple[str, Dict, str]], now: Optional[datetime] = None,
+                available_at: Optional[datetime] = None) -> int:
+        """Add (dedup_key, application, user_email) entries; returns how many were new.
+        
+        With `available_at`, the rows are held until then unless release() makes
+        them claimable earlier.
+        """
+        now = now or datetime.now()
+        available = (available_at or now).isoformat()
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO reminder_outbox "
+                "(dedup_key, application_id, user_email, payload, available_at, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                [(key, application["id"], email, json.dumps(application), available, now.isoformat())
+                 for key, application, email in entries]
+            )
+            return self._conn.total_changes - before
+    
+    def release(self, keys: List[str], now: Optional[datetime] = None):
+        """Make held pending rows claimable now"""
+        now = (now or datetime.now()).isoformat()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE reminder_outbox SET available_at = ? WHERE dedup_key = ? AND status = 'pending'",
+                [(now, key) for key in keys]
+            )
+    
+    def discard(self, keys: List[str]):
+        """Drop pending rows that should not be sent after all"""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM reminder_outbox WHERE dedup_key = ? AND status = 'pending'", [(key,) for key in keys]
+            )
+    
+    def claim(self, worker_id: str, limit: int = 100, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Lease up to `limit` ready rows (pending, or sending with an expired lease) to one worker"""
+        now = now or datetime.now()
+        token = f"{worker_id}:{uuid.uuid4().hex}"
+        lease_expires = (now + timedelta(seconds=self.lease_seconds)).isoformat()
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                UPDATE reminder_outbox SET status = 'sending', lease_owner = ?, lease_expires = ?
+                WHERE dedup_key IN (
+                    SELECT dedup_key FROM reminder_outbox
+                    WHERE (status = 'pending' AND available_at <= ?) OR (status = 'sending' AND lease_expires <= ?)
+                    ORDER BY available_at LIMIT ?
+                )
+                """,
+                (token, lease_expires, now.isoformat(), now.isoformat(), limit)
+            )
+            rows = self._conn.execute(
+                "SELECT dedup_key, user_email, payload, attempts FROM reminder_outbox WHERE lease_owner = ?", (token,)
+            ).fetchall()
+        return [
+            {
+                "key": row["dedup_key"],
+                "user_email": row["user_email"],
+                "application": json.loads(row["payload"]),
+                "attempts": row["attempts"]
+            }
+            for row in rows
+        ]
+    
+    def mark_sent(self, keys: List[str], now: Optional[datetime] = None):
+        now = (now or datetime.now()).isoformat()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE reminder_outbox SET status = 'sent', sent_at = ?, lease_owner = NULL, lease_expires = NULL "
+                "WHERE dedup_key = ?",
+                [(now, key) for key in keys]
+            )
+    
+    def mark_failed(self, keys: List[str], error: str = "", now: Optional[datetime] = None):
+        """Schedule a retry with linear backoff, or give up after max_attempts"""
+        now = now or datetime.now()
+        with self._lock, self._conn:
+            for key in keys:
+                row = self._conn.execute("SELECT attempts FROM reminder_outbox WHERE dedup_key = ?", (key,)).fetchone()
+                if row is None:
+                    continue
+                attempts = row["attempts"] + 1
+                status = "failed" if attempts >= self.max_attempts else "pending"
+                if status == "failed":
+                    logger.error("Giving up on reminder %s after %d attempts: %s", key, attempts, error)
+                self._conn.execute(
+                    "UPDATE reminder_outbox SET status = ?, attempts = ?, available_at = ?, last_error = ?, "
+                    "lease_owner = NULL, lease_expires = NULL WHERE dedup_key = ?",
+                    (status, attempts, (now + self.retry_delay * attempts).isoformat(), error, key)
+                )
+    
+    def retry_failed(self, now: Optional[datetime] = None) -> int:
+        """Put rows that ran out of attempts back in the queue; returns how many"""
+        now = (now or datetime.now()).isoformat()
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE reminder_outbox SET status = 'pending', attempts = 0, available_at = ? WHERE status = 'failed'",
+                (now,)
+            )
+            return cursor.rowcount
+    
+    def next_available_time(self) -> Optional[datetime]:
+        """When the earliest pending row (or expired lease) becomes claimable"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MIN(ready_at) FROM ("
+                "SELECT available_at AS ready_at FROM reminder_outbox WHERE status = 'pending' "
+                "UNION ALL SELECT lease_expires FROM reminder_outbox WHERE status = 'sending')"
+            ).fetchone()
+        return datetime.fromisoformat(row[0]) if row[0] else None
+    
+    def stats(self) -> Dict[str, int]:
+        """Row count per status"""
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM reminder_outbox GROUP BY status").fetchall()
+        return {row[0]: row[1] for row in rows}
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -1,18 +1,62 @@
-import schedule
+import heapq
+import socket
+import threading
 import time
 import json
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Any
-import smtplib
+from typing import List, Dict, Any, Optional, Tuple
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import os
+from src.utils.config import load_config
+from streamlit_app.application_store import create_application_store
+from streamlit_app.email_delivery import EmailDeliveryPipeline
+from streamlit_app.reminder_outbox import ReminderOutbox
 
 class ReminderSystem:
-    def __init__(self, applications_path: str = "data/user_data/applications.json"):
+    """Sends follow-up reminders from a min-heap of (follow-up time, application id).
+    
+    Only follow-ups due within `resync_interval` seconds are kept in the heap; it
+    is rebuilt from the store at that interval to pick up changes made by other
+    processes. Entries whose application was rescheduled meanwhile are dropped
+    lazily when they reach the top of the heap.
+    
+    Due reminders are first written to a persistent outbox, held for one lease
+    period, and their follow-up moved forward; rows whose follow-up was changed
+    concurrently are then discarded and the rest released for sending. A crash
+    at any point leaves either an un-enqueued reminder that is still due, or an
+    outbox row that a restarted (or another) worker sends once its hold runs
+    out, so nothing is lost or rescanned. Without SMTP settings the outbox is
+    not drained, so reminders wait there instead of using up their attempts.
+    """
+    
+    # Rows claimed from the outbox per send round
+    OUTBOX_BATCH = 200
+    
+    def __init__(self, applications_path: str = "data/user_data/applications.json", store=None,
+                 resync_interval: float = 3600, outbox: Optional[ReminderOutbox] = None):
         self.applications_path = Path(applications_path)
+        # By default, the same store the tracker uses: the configured backend, not always the JSON file
+        self.store = store if store is not None else create_application_store(load_config())
+        if outbox is None:
+            # Keep the outbox next to the applications: in the same database, or beside the JSON file
+            db_path = getattr(self.store, "db_path", None) or self.applications_path.with_suffix(".outbox.db")
+            outbox = ReminderOutbox(str(db_path))
+        self.outbox = outbox
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
         self.smtp_settings = self.load_smtp_settings()
+        self.resync_interval = resync_interval
+        self._heap: List[tuple] = []
+        self._pending: Dict[int, Dict] = {}
+        self._due_at: Dict[int, datetime] = {}
+        self._horizon: Optional[datetime] = None
+        self._lock = threading.RLock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._next_resync: Optional[float] = None
+        self._smtp_warned = False
+        self._delivery: Optional[EmailDeliveryPipeline] = None
     
     def load_smtp_settings(self) -> Dict:
         settings_path = Path("config/smtp_settings.json")
@@ -22,94 +66,259 @@ class ReminderSystem:
         return {}
     
     def load_applications(self) -> List[Dict]:
-        if self.applications_path.exists():
-            with open(self.applications_path, 'r') as f:
-                return json.load(f)
-        return []
+        return self.store.load_all()
+    
+    @staticmethod
+    def _followup_time(application: Dict) -> Optional[datetime]:
+        try:
+            return datetime.fromisoformat(application["next_followup"])
+        except (KeyError, ValueError, TypeError):
+            return None
     
-    def get_due_reminders(self) -> List[Dict]:
-        applications = self.load_applications()
-        today = datetime.now().date()
+    def rebuild_schedule(self, now: Optional[datetime] = None):
+        """Load follow-ups due before the next resync into the heap"""
+        now = now or datetime.now()
+        horizon = now + timedelta(seconds=self.resync_interval)
+        if hasattr(self.store, "load_due"):
+            applications = self.store.load_due(horizon.isoformat())
+        else:
+            applications = self.load_applications()
         
-        due_reminders = []
-        for app in applications:
-            if "next_followup" in app:
-                followup_date = datetime.fromisoformat(app["next_followup"]).date()
-                if followup_date <= today:
-                    due_reminders.append(app)
+        with self._lock:
+            self._horizon = horizon
+            self._pending = {}
+            self._due_at = {}
+            self._heap = []
+            for app in applications:
+                due_at = self._followup_time(app)
+                if due_at is not None and due_at <= horizon:
+                    self._pending[app["id"]] = app
+                    self._due_at[app["id"]] = due_at
+                    self._heap.append((due_at, app["id"]))
+            heapq.heapify(self._heap)
+    
+    def schedule_followup(self, application: Dict, due_at: Optional[datetime] = None):
+        """Add or move an application's reminder and wake the scheduler if it is now first"""
+        due_at = due_at or self._followup_time(application)
+        with self._lock:
+            if due_at is None or self._horizon is None or due_at > self._horizon:
+                self._pending.pop(application["id"], None)
+                self._due_at.pop(application["id"], None)
+                return
+            self._pending[application["id"]] = application
+            self._due_at[application["id"]] = due_at
+            heapq.heappush(self._heap, (due_at, application["id"]))
+            if self._heap[0][1] == application["id"]:
+                self._wakeup.set()
+    
+    def _is_current(self, due_at: datetime, application_id: int) -> bool:
+        # Heap entries are never removed in place; an entry is stale once its application moved
+        return self._due_at.get(application_id) == due_at
+    
+    def next_due_time(self) -> Optional[datetime]:
+        """When the earliest scheduled reminder falls due"""
+        with self._lock:
+            while self._heap and not self._is_current(*self._heap[0]):
+                heapq.heappop(self._heap)
+            return self._heap[0][0] if self._heap else None
+    
+    def get_due_reminders(self, now: Optional[datetime] = None) -> List[Dict]:
+        """Pop every reminder due at `now` off the heap.
+        
+        The heap is only resynced every `resync_interval`, so each popped
+        application is read again from the store: one deleted since is dropped,
+        and one rescheduled to a later time goes back on the heap instead.
+        """
+        now = now or datetime.now()
+        if self._horizon is None:
+            self.rebuild_schedule(now)
         
+        popped = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                due_at, application_id = heapq.heappop(self._heap)
+                if self._is_current(due_at, application_id):
+                    del self._due_at[application_id]
+                    del self._pending[application_id]
+                    popped.append(application_id)
+        
+        due_reminders = []
+        for application_id in popped:
+            latest = self.store.get(application_id)
+            if latest is None:
+                continue
+            due_at = self._followup_time(latest)
+            if due_at is not None and due_at <= now:
+                due_reminders.append(latest)
+            else:
+                self.schedule_followup(latest, due_at)
         return due_reminders
     
+    @property
+    def delivery(self) -> EmailDeliveryPipeline:
+        """SMTP delivery pipeline, created on first use and reused across rounds"""
+        if self._delivery is None:
+            self._delivery = EmailDeliveryPipeline(
+                self.smtp_settings,
+                workers=self.smtp_settings.get('workers', 4),
+                batch_size=self.smtp_settings.get('batch_size', 50),
+                max_retries=self.smtp_settings.get('max_retries', 3)
+            )
+        return self._delivery
+    
+    @staticmethod
+    def reminder_key(application: Dict) -> str:
+        """Dedup key of one follow-up of one application"""
+        return f"{application['id']}:{application.get('next_followup')}"
+    
+    def build_reminder_message(self, application: Dict, user_email: str, message_id: Optional[str] = None) -> MIMEMultipart:
+        msg = MIMEMultipart()
+        msg['From'] = self.smtp_settings.get('from_email')
+        msg['To'] = user_email
+        msg['Subject'] = f"Follow-up Reminder: {application['job_title']} at {application['company']}"
+        if message_id:
+            # Stable across redeliveries, so a resend after a crash can be recognised downstream
+            msg['Message-ID'] = f"<{message_id}@hr-assistant>"
+        
+        body = f"""
+        Hello,
+        
+        This is a reminder to follow up on your job application for {application['job_title']} at {application['company']}.
+        
+        Application Details:
+        - Position: {application['job_title']}
+        - Company: {application['company']}
+        - Applied on: {application['application_date']}
+        - Current Status: {application['status']}
+        
+        Suggested follow-up actions:
+        1. Send a polite email to the hiring manager
+        2. Connect with company employees on LinkedIn
+        3. Prepare for a potential interview
+        
+        Best of luck!
+        
+        Sincerely,
+        Your AI HR Assistant
+        """
+        
+        msg.attach(MIMEText(body, 'plain'))
+        return msg
+    
     def send_email_reminder(self, application: Dict, user_email: str):
         if not self.smtp_settings:
             print("SMTP settings not configured. Cannot send email.")
             return False
         
-        try:
-            msg = MIMEMultipart()
-            msg['From'] = self.smtp_settings.get('from_email')
-            msg['To'] = user_email
-            msg['Subject'] = f"Follow-up Reminder: {application['job_title']} at {application['company']}"
-            
-            body = f"""
-            Hello,
-            
-            This is a reminder to follow up on your job application for {application['job_title']} at {application['company']}.
-            
-            Application Details:
-            - Position: {application['job_title']}
-            - Company: {application['company']}
-            - Applied on: {application['application_date']}
-            - Current Status: {application['status']}
-            
-            Suggested follow-up actions:
-            1. Send a polite email to the hiring manager
-            2. Connect with company employees on LinkedIn
-            3. Prepare for a potential interview
-            
-            Best of luck!
-            
-            Sincerely,
-            Your AI HR Assistant
-            """
-            
-            msg.attach(MIMEText(body, 'plain'))
-            
-            server = smtplib.SMTP(self.smtp_settings.get('smtp_server'), self.smtp_settings.get('smtp_port'))
-            server.starttls()
-            server.login(self.smtp_settings.get('username'), self.smtp_settings.get('password'))
-            server.send_message(msg)
-            server.quit()
-            
-            return True
-            
-        except Exception as e:
-            print(f"Failed to send email: {e}")
-            return False
+        return self.delivery.send(self.build_reminder_message(application, user_email))
+    
+    def send_reminders(self, reminders: List[Tuple[str, Dict, str]]) -> Dict[str, bool]:
+        """Send (outbox key, application, email) reminders through the pooled pipeline; returns success per key"""
+        if not self.smtp_settings:
+            print("SMTP settings not configured. Cannot send email.")
+            return {key: False for key, _, _ in reminders}
+        
+        messages = [
+            (key, self.build_reminder_message(application, user_email, message_id=key))
+            for key, application, user_email in reminders
+        ]
+        return self.delivery.send_many(messages)
     
-    def process_due_reminders(self):
-        due_reminders = self.get_due_reminders()
+    def enqueue_due_reminders(self, now: Optional[datetime] = None) -> int:
+        """Move due reminders into the outbox and push their follow-ups a week out.
+        
+        Returns how many reminders were released for sending. Reminders whose
+        application changed before its follow-up could be moved are not sent.
+        """
+        now = now or datetime.now()
+        due_reminders = self.get_due_reminders(now)
+        if not due_reminders:
+            return 0
+        
+        # Held for a lease period: if we crash before the follow-ups are moved, they are sent after that
+        keys = {r['id']: self.reminder_key(r) for r in due_reminders}
+        self.outbox.enqueue(
+            [(keys[r['id']], r, f"{r['user_id']}@example.com") for r in due_reminders], now,
+            available_at=now + timedelta(seconds=self.outbox.lease_seconds)
+        )
         
-        for reminder in due_reminders:
-            user_email = f"{reminder['user_id']}@example.com"
+        # One batched write for every follow-up date moved in this round
+        next_date = now + timedelta(days=7)
+        updates = [(dict(r, next_followup=next_date.isoformat()), r.get('version', 1)) for r in due_reminders]
+        conflicts = set(self.store.update_many(updates))
+        released = []
+        for updated, _ in updates:
+            if updated['id'] in conflicts:
+                # Changed by the tracker meanwhile; its follow-up date wins and this reminder is dropped
+                print(f"Skipped reminder for application {updated['id']}: modified concurrently")
+            else:
+                released.append(keys[updated['id']])
+                self.schedule_followup(updated)
+        self.outbox.discard([keys[application_id] for application_id in conflicts])
+        self.outbox.release(released, now)
+        return len(released)
+    
+    def drain_outbox(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Send everything claimable in the outbox; returns sent and failed counts"""
+        now = now or datetime.now()
+        counts = {"sent": 0, "failed": 0}
+        if not self.smtp_settings:
+            # Claiming would only burn retry attempts; the reminders stay queued until SMTP is configured
+            if not self._smtp_warned:
+                print("SMTP settings not configured. Reminders stay in the outbox.")
+                self._smtp_warned = True
+            return counts
+        while True:
+            claimed = self.outbox.claim(self.worker_id, self.OUTBOX_BATCH, now)
+            if not claimed:
+                return counts
             
-            if self.send_email_reminder(reminder, user_email):
-                print(f"Sent reminder to {user_email} for {reminder['job_title']}")
-                
-                applications = self.load_applications()
-                for app in applications:
-                    if app['id'] == reminder['id']:
-                        next_date = datetime.now() + timedelta(days=7)
-                        app['next_followup'] = next_date.isoformat()
-                
-                with open(self.applications_path, 'w') as f:
-                    json.dump(applications, f, indent=2)
+            results = self.send_reminders([(c["key"], c["application"], c["user_email"]) for c in claimed])
+            sent = [key for key, ok in results.items() if ok]
+            failed = [c["key"] for c in claimed if not results.get(c["key"])]
+            self.outbox.mark_sent(sent, now)
+            self.outbox.mark_failed(failed, "delivery failed", now)
+            for entry in claimed:
+                if results.get(entry["key"]):
+                    print(f"Sent reminder to {entry['user_email']} for {entry['application']['job_title']}")
+            counts["sent"] += len(sent)
+            counts["failed"] += len(failed)
+    
+    def process_due_reminders(self, now: Optional[datetime] = None):
+        now = now or datetime.now()
+        self.enqueue_due_reminders(now)
+        self.drain_outbox(now)
+    
+    def run_once(self) -> float:
+        """One scheduler pass: resync if due, then send; returns seconds until the next pass is needed"""
+        if self._next_resync is None or time.monotonic() >= self._next_resync:
+            self.rebuild_schedule()
+            self._next_resync = time.monotonic() + self.resync_interval
+        
+        self.process_due_reminders()
+        
+        timeout = self._next_resync - time.monotonic()
+        wake_times = [self.next_due_time()]
+        if self.smtp_settings:
+            # Without SMTP the outbox is not drained, so its waiting rows must not wake the loop
+            wake_times.append(self.outbox.next_available_time())
+        for next_due in wake_times:
+            if next_due is not None:
+                timeout = min(timeout, (next_due - datetime.now()).total_seconds())
+        return max(timeout, 0)
     
     def start_scheduler(self):
-        schedule.every().day.at("09:00").do(self.process_due_reminders)
+        """Sleep until the next reminder is due (or the next resync), send, repeat"""
+        print("Reminder system started. Waking at each follow-up's due time.")
         
-        print("Reminder system started. Checking for due reminders daily at 9:00 AM.")
+        # Resume whatever a previous run left in the outbox before looking for new work
+        self.drain_outbox()
         
-        while True:
-            schedule.run_pending()
-            time.sleep(60)
\ No newline at end of file
+        while not self._stop.is_set():
+            self._wakeup.wait(self.run_once())
+            self._wakeup.clear()
+    
+    def stop(self):
+        """Stop a running start_scheduler loop"""
+        self._stop.set()
+        self._wakeup.set()
\ No newline at end of file
@@ -1,5 +1,14 @@
+import asyncio
+import io
+import json
+import tempfile
 import unittest
+import zipfile
+from pathlib import Path
+from fastapi import HTTPException, UploadFile
 from fastapi.testclient import TestClient
+from src.api.batch import collect_batch, stream_parse_results
+from src.api.executor import ConcurrencyLane
 from src.api.main import app
 
 class TestAPI(unittest.TestCase):
@@ -15,6 +24,70 @@ class TestAPI(unittest.TestCase):
         response = self.client.get("/health")
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json()["status"], "healthy")
+    
+    def test_parse_resume_rejects_oversized_upload(self):
+        limit = app.state.upload_limits["max_bytes"]
+        response = self.client.post(
+            "/api/v1/parse-resume",
+            files={"file": ("resume.txt", b"x" * (limit + 1), "text/plain")}
+        )
+        self.assertEqual(response.status_code, 413)
+
+class TestExecutionLayer(unittest.TestCase):
+    def test_lane_limits_concurrency_and_rejects_when_queue_full(self):
+        lane = ConcurrencyLane("cpu", limit=2, max_queue=3)
+        running = []
+        
+        async def job():
+            running.append(lane.active)
+            await asyncio.sleep(0.01)
+        
+        async def submit():
+            return await asyncio.gather(*[lane.run(job) for _ in range(6)], return_exceptions=True)
+        
+        results = asyncio.run(submit())
+        self.assertEqual(max(running), 2)
+        self.assertIsInstance(results[-1], HTTPException)
+        self.assertEqual(results[-1].status_code, 503)
+        stats = lane.stats()
+        self.assertEqual((stats["completed"], stats["rejected"], stats["max_queue_depth"]), (5, 1, 3))
+
+class InlineExecutor:
+    """Stands in for the process pool: 'parses' a file into its size"""
+    
+    def __init__(self):
+        self.cpu = ConcurrencyLane("cpu", limit=2, max_queue=8)
+    
+    async def run_cpu(self, func, path):
+        return await self.cpu.run(lambda: asyncio.sleep(0, {"size": Path(path).stat().st_size}))
+
+class TestBatchParsing(unittest.TestCase):
+    def test_batch_streams_one_line_per_resume_then_summary(self):
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("a.txt", "resume a")
+            zf.writestr("../escape.pdf", "resume b")
+            zf.writestr("notes.exe", "not a resume")
+        files = [
+            UploadFile(io.BytesIO(archive.getvalue()), filename="batch.zip"),
+            UploadFile(io.BytesIO(b"resume c"), filename="c.docx"),
+            UploadFile(io.BytesIO(b"x" * 100), filename="big.txt")
+        ]
+        directory = tempfile.mkdtemp()
+        
+        async def run():
+            items = await collect_batch(files, directory, max_files=10, max_bytes=50, chunk_size=4)
+            return [json.loads(line) async for line in stream_parse_results(InlineExecutor(), items, directory)]
+        
+        lines = asyncio.run(run())
+        results = {line["id"]: line for line in lines[:-1]}
+        self.assertEqual(sorted(results), [0, 1, 2, 3, 4])
+        self.assertEqual(results[1]["filename"], "../escape.pdf")
+        self.assertEqual(results[1]["data"], {"size": 8})
+        self.assertFalse(results[2]["success"])
+        self.assertFalse(results[4]["success"])
+        self.assertEqual(lines[-1]["summary"]["succeeded"], 3)
+        self.assertFalse(Path(directory).exists())
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
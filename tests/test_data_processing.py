@@ -1,6 +1,12 @@
+import tempfile
 import unittest
+from unittest import mock
+from pathlib import Path
+from src.data_processing.resume_cache import ResumeCache
 from src.data_processing.resume_parser import EnhancedResumeParser
+from src.data_processing.salary import LocationIndex, SalaryIndex, normalize_salary
 from src.data_processing.job_parser import JobParser
+from src.data_processing.skill_matcher import SkillMatcher
 
 class TestDataProcessing(unittest.TestCase):
     def setUp(self):
@@ -18,6 +24,184 @@ class TestDataProcessing(unittest.TestCase):
         sample_text = "John Doe\nSoftware Engineer\nPython, Java, AWS"
         skills = self.resume_parser.extract_skills(sample_text)
         self.assertIn("python", [s.lower() for s in skills.get("programming", [])])
+    
+    def test_parse_resume_streams_pages_of_text_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "resume.txt"
+            path.write_text(
+                "Jane Doe\njane@example.com\nExperience\nSenior Engineer, Tech Corp, 2019 - 2023\n"
+                "Built Python services on AWS\f"
+                "Data Analyst\nJan 2015 - Dec 2019\nEducation\nBSc Computer Science, State University\n"
+            )
+            self.assertEqual(len(list(self.resume_parser.iter_pages(str(path)))), 2)
+            result = self.resume_parser.parse_resume(str(path))
+        
+        self.assertEqual((result["name"], result["email"], result["pages"]), ("Jane Doe", "jane@example.com", 2))
+        self.assertIn("Python", result["skills"]["programming"])
+        self.assertEqual(result["education"], ["BSc Computer Science, State University"])
+        self.assertEqual([(e["title"], e["years"]) for e in result["experience"]],
+                         [("Senior Engineer, Tech Corp", 4), ("Data Analyst", 4)])
+        self.assertEqual(result["total_experience_years"], 8)
+    
+    def test_job_parser_attributes_bullets_to_section_headers(self):
+        text = (
+            "Senior Data Engineer\nCompany: Tech Corp\nAustin, TX\n$120,000 - $150,000\n\n"
+            "What you'll do:\n- Build pipelines\n- Own the warehouse\n\n"
+            "Requirements\n* 5 years of Python\n* SQL\n\n"
+            "Benefits:\n- Health insurance\nWe offer a learning budget"
+        )
+        result = self.job_parser.parse_job_description(text)
+        
+        self.assertEqual((result["title"], result["company"]), ("Senior Data Engineer", "Tech Corp"))
+        self.assertEqual(result["location"], "Austin, TX")
+        self.assertEqual(result["salary"], "$120,000 - $150,000")
+        self.assertEqual((result["salary_normalized"]["annual_min"], result["salary_normalized"]["annual_max"]),
+                         (120000, 150000))
+        self.assertEqual(result["responsibilities"], ["Build pipelines", "Own the warehouse"])
+        self.assertEqual(result["requirements"], ["5 years of Python", "SQL"])
+        self.assertEqual(result["benefits"], ["Health insurance", "We offer a learning budget"])
+        self.assertEqual(list(self.job_parser.parse_many([text, text])), [result, result])
+        
+        # The accessors share one line pass per posting and never run the salary parsing
+        with mock.patch("src.data_processing.job_parser.normalize_salary") as normalize:
+            self.assertEqual(self.job_parser.extract_title(text), "Senior Data Engineer")
+            self.assertEqual(self.job_parser.extract_benefits(text), result["benefits"])
+        normalize.assert_not_called()
+        self.assertIs(self.job_parser._scan_lines(text), self.job_parser._scan_lines(text))
+    
+    def test_normalize_salary_annualizes_rates_and_k_suffixes(self):
+        cases = {
+            "$80k - $120k": (80000, 120000, "USD", "year"),
+            "$80-120k": (80000, 120000, "USD", "year"),
+            "$40-50/hr": (83200, 104000, "USD", "hour"),
+            "£4,000 per month": (48000, 48000, "GBP", "month"),
+            "90K–110K EUR": (90000, 110000, "EUR", "year"),
+            "Perks: $300 home office stipend\nSalary: $120,000 - $150,000": (120000, 150000, "USD", "year"),
+            "$40M": (40000000, 40000000, "USD", "year"),
+            "₹12,00,000 per annum": (1200000, 1200000, "INR", "year"),
+            "USD 100,000 - 120,000": (100000, 120000, "USD", "year")
+        }
+        for text, (annual_min, annual_max, currency, period) in cases.items():
+            salary = normalize_salary(text)
+            self.assertEqual((salary["annual_min"], salary["annual_max"], salary["currency"], salary["period"]),
+                             (annual_min, annual_max, currency, period), text)
+        self.assertIsNone(normalize_salary("Experience 2019 - 2024, 401(k) match"))
+    
+    def test_salary_index_range_and_location_queries(self):
+        jobs = [
+            {"id": "a", "location": "Austin, TX", "salary_normalized": normalize_salary("$80k-$100k")},
+            {"id": "b", "location": "austin, tx", "salary_normalized": normalize_salary("$120k-$150k")},
+            {"id": "c", "location": "Remote", "salary_normalized": normalize_salary("$60/hr")},
+            {"id": "d", "location": "Remote", "salary_normalized": None}
+        ]
+        index = SalaryIndex.build(jobs)
+        
+        self.assertEqual(len(index), 3)
+        self.assertEqual(index.search(min_salary=100000), ["b", "c", "a"])
+        self.assertEqual(index.search(min_salary=110000, location="Austin, TX"), ["b"])
+        self.assertEqual(index.search(min_salary=90000, max_salary=110000), ["a"])
+        self.assertEqual(index.search(min_salary=90000, max_salary=130000), ["b", "c", "a"])
+        index.remove("b")
+        index.add({"id": "e", "location": "Austin, TX", "salary_normalized": normalize_salary("$200,000 annually")})
+        self.assertEqual(index.search(min_salary=110000, location="austin, tx"), ["e"])
+        
+        index.add({"id": "f", "location": "Pune", "salary_normalized": normalize_salary("₹12,00,000 per annum")})
+        self.assertEqual(index.currencies(), ["INR", "USD"])
+        self.assertEqual(index.search(min_salary=150000), ["f", "e"])
+        self.assertEqual(index.search(min_salary=150000, currency="USD"), ["e"])
+        self.assertEqual(index.search(min_salary=100000, max_salary=130000, location="Remote", currency="USD"), ["c"])
+        self.assertEqual(index.search(currency="INR", location="Austin, TX"), [])
+    
+    def test_location_index_matches_tokens_of_postings_without_salary(self):
+        jobs = [
+            {"id": "a", "location": "Austin, TX"}, {"id": "b", "location": "Remote"},
+            {"id": "c", "location": "Dallas, TX"}, {"id": "d", "location": "Location not specified"}
+        ]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = str(Path(tmp_dir) / "job_locations.json")
+            LocationIndex.build(jobs).save(path)
+            index = LocationIndex.load(path)
+        
+        self.assertEqual(len(index), 3)
+        self.assertEqual(index.search(" austin "), {"a"})
+        self.assertEqual(index.search("TX"), {"a", "c"})
+        self.assertEqual(index.search("Austin, TX"), {"a"})
+        self.assertEqual(index.search("Austin, CA"), set())
+        self.assertEqual(index.search("location"), set())
+    
+    def test_skill_matcher_offsets_and_aliases(self):
+        matcher = SkillMatcher()
+        text = "Built ML services in C++ and node.js; studied machine learning"
+        matches = matcher.find(text)
+        
+        self.assertEqual([m["skill_id"] for m in matches], ["machine-learning", "cpp", "node-js", "machine-learning"])
+        for match in matches:
+            self.assertEqual(text[match["start"]:match["end"]], match["text"])
+    
+    def test_skill_matcher_respects_word_boundaries(self):
+        matcher = SkillMatcher({"programming": {"Java": [], "JavaScript": ["js"]}})
+        self.assertEqual(matcher.skill_names("JavaScript and js, not Javanese"), ["JavaScript"])
+    
+    def test_skill_matcher_needs_exact_case_for_everyday_words(self):
+        matcher = SkillMatcher()
+        self.assertEqual(matcher.skill_names("Rust, Excel and AI"), ["Rust", "Excel", "Artificial Intelligence"])
+        self.assertEqual(matcher.skill_names("I excel at removing rust; ai is a sloth"), [])
+        self.assertEqual(matcher.skill_names("Built spark sql jobs"), ["Apache Spark"])
+
+class TestResumeCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name)
+    
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+    
+    def test_duplicate_uploads_are_stored_and_parsed_once(self):
+        cache = ResumeCache(root=str(self.root / "raw"), index_path=str(self.root / "cache.db"))
+        parsed = []
+        parse = lambda path: parsed.append(path) or {"name": "Jane"}
+        
+        sha, first_path = cache.add_bytes(b"resume", "jane.pdf")
+        self.assertEqual(cache.get_or_parse(first_path, parse, sha), {"name": "Jane"})
+        sha_again, second_path = cache.add_bytes(b"resume", "copy of jane.pdf")
+        self.assertEqual(cache.get_or_parse(second_path, parse, sha_again), {"name": "Jane"})
+        
+        self.assertEqual((sha_again, second_path), (sha, first_path))
+        self.assertEqual(len(parsed), 1)
+        self.assertEqual(len(list((self.root / "raw").rglob("*.pdf"))), 1)
+        
+        # A new parser version re-parses the same file
+        upgraded = ResumeCache(root=str(self.root / "raw"), index_path=str(self.root / "cache.db"), parser_version="2")
+        self.assertIsNone(upgraded.get(sha))
+        cache.close()
+        upgraded.close()
+    
+    def test_least_recently_used_files_are_evicted(self):
+        cache = ResumeCache(root=str(self.root / "raw"), index_path=str(self.root / "cache.db"), max_bytes=250)
+        shas = [cache.add_bytes(bytes([i]) * 100, f"{i}.txt")[0] for i in range(2)]
+        cache.put(shas[0], {})
+        cache.get(shas[0])
+        cache.add_bytes(b"c" * 100, "c.txt")
+        
+        self.assertIsNotNone(cache.get(shas[0]))
+        self.assertFalse(cache.stored_path(shas[1], ".txt").exists())
+        self.assertLessEqual(cache.stats()["bytes"], 250)
+        cache.close()
+    
+    def test_pinned_files_survive_eviction_until_their_result_is_stored(self):
+        cache = ResumeCache(root=str(self.root / "raw"), index_path=str(self.root / "cache.db"), max_bytes=250)
+        # Added for a parse that runs elsewhere, then pushed out by newer uploads before its result arrives
+        sha, path = cache.add_bytes(b"a" * 100, "a.txt")
+        cache.unpin(sha)
+        cache.add_file(path, sha, pin=True)
+        for name in ("b", "c"):
+            cache.add_bytes(name.encode() * 100, f"{name}.txt")
+        self.assertTrue(Path(path).exists())
+        
+        cache.put(sha, {"name": "A"})
+        cache.add_bytes(b"d" * 100, "d.txt")
+        self.assertFalse(Path(path).exists())
+        cache.close()
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
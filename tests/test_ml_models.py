@@ -1,7 +1,14 @@
+import os
 import unittest
+import tempfile
 import numpy as np
 from src.ml_models.embedding_model import EmbeddingModel
+from src.ml_models.ner_model import NERModel
+from src.ml_models.embedding_cache import EmbeddingCache
 from src.ml_models.ranking_model import RankingModel
+from src.ml_models.bm25_model import BM25Model
+from src.ml_models.ann_index import IVFIndex
+from src.ml_models.model_registry import ModelRegistry
 
 class TestMLModels(unittest.TestCase):
     def setUp(self):
@@ -19,6 +26,138 @@ class TestMLModels(unittest.TestCase):
         vec2 = np.array([0, 1, 0])
         similarity = self.embedding_model.similarity(vec1, vec2)
         self.assertEqual(similarity, 0.0)
+    
+    def test_top_k_search(self):
+        targets = np.array([[1, 0, 0], [0, 1, 0], [1, 1, 0], [-1, 0, 0]], dtype=np.float32)
+        results = self.embedding_model.search(np.array([1, 0, 0]), targets, top_k=2)
+        self.assertEqual([r["index"] for r in results], [0, 2])
+        self.assertAlmostEqual(results[0]["similarity"], 1.0, places=5)
+    
+    def test_chunked_search_matches_full_search(self):
+        rng = np.random.default_rng(0)
+        targets = rng.normal(size=(1000, 16))
+        query = rng.normal(size=16)
+        full = self.embedding_model.search(query, targets, top_k=5)
+        chunked = self.embedding_model.search(query, targets, top_k=5, chunk_size=64)
+        self.assertEqual([r["index"] for r in full], [r["index"] for r in chunked])
+    
+    def test_encode_uses_cache(self):
+        first = self.embedding_model.encode(["cached sentence"])
+        second = self.embedding_model.encode(["cached   sentence"])
+        np.testing.assert_allclose(first, second)
+        self.assertGreater(self.embedding_model.cache_stats()["hit_rate"], 0)
+    
+    def test_embedding_cache_disk_tier(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = EmbeddingCache("test-model", cache_dir=cache_dir)
+            key = cache.make_key("python developer")
+            cache.put_many([key], np.ones((1, 4)))
+            
+            reopened = EmbeddingCache("test-model", cache_dir=cache_dir)
+            vector = reopened.get_many([key])[0]
+            np.testing.assert_allclose(vector, np.ones(4))
+            self.assertEqual(reopened.stats()["disk_hits"], 1)
+    
+    def test_ann_index_insert_delete_and_reload(self):
+        rng = np.random.default_rng(1)
+        vectors = rng.normal(size=(500, 16))
+        index = IVFIndex(16, n_lists=8, n_probe=8)
+        index.add([f"job_{i}" for i in range(500)], vectors)
+        self.assertEqual(index.search(vectors[42], top_k=1)[0]["id"], "job_42")
+        
+        index.delete(["job_42"])
+        self.assertNotIn("job_42", [m["id"] for m in index.search(vectors[42], top_k=5)])
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = f"{tmp_dir}/index.npz"
+            index.save(path)
+            reloaded = IVFIndex.load(path)
+        self.assertEqual(len(reloaded), 499)
+        self.assertEqual(reloaded.search(vectors[7], top_k=1)[0]["id"], "job_7")
+    
+    def test_ann_index_collects_vectors_before_training_and_compacts_deletes(self):
+        rng = np.random.default_rng(2)
+        vectors = rng.normal(size=(40, 16))
+        index = IVFIndex(16, n_lists=8, n_probe=2)
+        index.add(["job_0"], vectors[:1])
+        self.assertFalse(index.is_trained)
+        self.assertEqual(index.search(vectors[0], top_k=1)[0]["id"], "job_0")
+        
+        index.add([f"job_{i}" for i in range(1, 40)], vectors[1:])
+        self.assertTrue(index.is_trained)
+        self.assertEqual(index.n_lists, 8)
+        
+        index.delete([f"job_{i}" for i in range(20)])
+        self.assertEqual(index._size, 20)
+        self.assertEqual(index.search(vectors[30], top_k=1)[0]["id"], "job_30")
+        
+        # An id filter ranks exactly the given entries, whichever lists they are in
+        matches = index.search(vectors[30], top_k=5, ids=["job_25", "job_30", "job_3", "missing"])
+        self.assertEqual([m["id"] for m in matches], ["job_30", "job_25"])
+    
+    def test_ranking_index_search_and_add(self):
+        self.ranking_model.index_documents([
+            "python developer with django experience",
+            "java engineer building spring services",
+            "data scientist using python and machine learning"
+        ])
+        results = self.ranking_model.search("python machine learning", top_k=2)
+        self.assertEqual(results[0]["index"], 2)
+        self.assertEqual(len(results), 2)
+        
+        self.ranking_model.add_documents(["senior java developer"])
+        results = self.ranking_model.search("java developer", top_k=1)
+        self.assertEqual(results[0]["document"], "senior java developer")
+    
+    def test_bm25_early_termination_matches_exhaustive(self):
+        documents = [
+            "python developer remote",
+            "python python data engineer",
+            "java developer onsite",
+            "frontend developer react",
+            "machine learning engineer python"
+        ]
+        bm25 = BM25Model()
+        bm25.index_documents(documents)
+        
+        pruned = bm25.search("python engineer", top_k=2)
+        exhaustive = bm25.search("python engineer", top_k=2, early_termination=False)
+        self.assertEqual([r["index"] for r in pruned], [r["index"] for r in exhaustive])
+        self.assertIn(pruned[0]["index"], [1, 4])
+        self.assertEqual(bm25.search("cobol", top_k=2), [])
+        self.assertEqual(bm25.search("python engineer", top_k=0), [])
+    
+    def test_ner_batch_matches_single(self):
+        ner_model = NERModel()
+        texts = ["Jane Smith worked at Google in London.", "Microsoft hired John Doe in 2020."]
+        batch = list(ner_model.extract_entities_batch(iter(texts), batch_size=1))
+        self.assertEqual(batch, [ner_model.extract_entities(text) for text in texts])
+    
+    def test_model_registry_loads_once(self):
+        registry = ModelRegistry()
+        calls = []
+        registry.register("counter", lambda: calls.append(1) or object())
+        self.assertFalse(registry.is_loaded("counter"))
+        
+        registry.warm(["counter"]).join()
+        self.assertIs(registry.get("counter"), registry.get("counter"))
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(registry.stats()["counter"]["loaded"])
+        self.assertIsNotNone(registry.stats()["counter"]["load_seconds"])
+    
+    def test_model_registry_reloads_changed_files(self):
+        registry = ModelRegistry()
+        read = lambda path: open(path).read()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = f"{tmp_dir}/index.txt"
+            self.assertIsNone(registry.get_file("index", path, read))
+            with open(path, "w") as f:
+                f.write("v1")
+            self.assertEqual(registry.get_file("index", path, read), "v1")
+            with open(path, "w") as f:
+                f.write("v2")
+            os.utime(path, ns=(0, registry.file_version("index") + 1))
+            self.assertEqual(registry.get_file("index"), "v2")
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
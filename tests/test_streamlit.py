@@ -0,0 +1,423 @@
+import contextlib
+import importlib
+import io
+import unittest
+import json
+import socketserver
+import tempfile
+import threading
+import time
+from email.message import EmailMessage
+from pathlib import Path
+from unittest import mock
+from datetime import datetime, timedelta
+from streamlit_app.application_store import (
+    JournaledApplicationStore, JSONApplicationStore, SQLiteApplicationStore, migrate_json_to_sqlite
+)
+from streamlit_app.job_application_tracker import JobApplicationTracker
+from streamlit_app.reminder_system import ReminderSystem
+from streamlit_app.email_delivery import EmailDeliveryPipeline
+
+def make_application(application_id, user_id="user_1", status="Applied"):
+    return {
+        "id": application_id,
+        "user_id": user_id,
+        "job_title": "Engineer",
+        "company": "Tech Corp",
+        "status": status,
+        "resume_match": 0.8,
+        "application_date": "2024-01-01T09:00:00",
+        "next_followup": "2024-01-08T09:00:00",
+        "history": [{"date": "2024-01-01T09:00:00", "status": status, "notes": "", "action": "submitted"}]
+    }
+
+class StandInSMTPHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP to accept messages; counts sessions and delivered messages"""
+    
+    def reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode())
+    
+    def handle(self):
+        self.server.sessions += 1
+        self.reply("220 stand-in ready")
+        while True:
+            line = self.rfile.readline().decode().strip()
+            command = line[:4].upper()
+            if not line or command == "QUIT":
+                self.reply("221 bye")
+                return
+            if command == "EHLO":
+                self.reply("250 stand-in")
+            elif command == "DATA":
+                self.reply("354 go ahead")
+                while self.rfile.readline() not in (b".\r\n", b""):
+                    pass
+                self.server.messages += 1
+                self.reply("250 queued")
+            else:
+                self.reply("250 ok")
+
+class StandInSMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    sessions = 0
+    messages = 0
+
+class TestApplicationStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.store = SQLiteApplicationStore(str(Path(self.tmp_dir.name) / "hr.db"))
+    
+    def tearDown(self):
+        self.store.close()
+        self.tmp_dir.cleanup()
+    
+    def test_sqlite_store_update_appends_history(self):
+        application = make_application(1)
+        self.store.insert(application)
+        self.store.insert(make_application(2, user_id="user_2"))
+        
+        application["status"] = "Interviewing"
+        entry = {"date": "2024-01-02T09:00:00", "status": "Interviewing", "notes": "", "action": "updated"}
+        self.store.update(application, entry)
+        
+        loaded = self.store.load_user("user_1")
+        self.assertEqual(len(loaded), 1)
+        self.assertEqual(loaded[0]["status"], "Interviewing")
+        self.assertEqual([h["action"] for h in loaded[0]["history"]], ["submitted", "updated"])
+    
+    def test_migrate_json_to_sqlite_runs_once(self):
+        json_path = Path(self.tmp_dir.name) / "applications.json"
+        json_path.write_text(json.dumps([make_application(1), make_application(2)]))
+        
+        self.assertEqual(migrate_json_to_sqlite(str(json_path), self.store), 2)
+        self.assertEqual(migrate_json_to_sqlite(str(json_path), self.store), 0)
+        self.assertEqual(len(self.store.load_all()), 2)
+        self.assertFalse(json_path.exists())
+    
+    def test_journal_replays_log_and_ignores_torn_tail(self):
+        path = str(Path(self.tmp_dir.name) / "applications.json")
+        journal = JournaledApplicationStore(path, compact_every=100)
+        journal.load_all()
+        application = make_application(1)
+        journal.insert(application)
+        application["status"] = "Offered"
+        entry = {"date": "2024-01-03T09:00:00", "status": "Offered", "notes": "", "action": "updated"}
+        application["history"].append(entry)
+        journal.update(application, entry)
+        journal.close()
+        
+        with open(journal.log_path, 'a') as f:
+            f.write('{"op": "ins')
+        
+        replayed = JournaledApplicationStore(path).load_all()
+        self.assertEqual(len(replayed), 1)
+        self.assertEqual(replayed[0]["status"], "Offered")
+        self.assertEqual(len(replayed[0]["history"]), 2)
+
+    def test_journal_skips_log_records_already_in_snapshot(self):
+        path = str(Path(self.tmp_dir.name) / "applications.json")
+        journal = JournaledApplicationStore(path, compact_every=100)
+        journal.load_all()
+        application = make_application(1)
+        journal.insert(application)
+        journal.compact()
+        entry = {"date": "2024-01-03T09:00:00", "status": "Offered", "notes": "", "action": "updated"}
+        application["history"].append(entry)
+        journal.update(dict(application, status="Offered"), entry)
+        
+        # Crash after the new snapshot is in place but before the old log is removed
+        with journal._locked():
+            journal._write()
+        journal.close()
+        
+        replayed = JournaledApplicationStore(path).load_all()
+        self.assertEqual(len(replayed[0]["history"]), 2)
+    
+    def test_journal_fsyncs_after_interval_without_further_writes(self):
+        path = str(Path(self.tmp_dir.name) / "applications.json")
+        journal = JournaledApplicationStore(path, fsync_every=100, fsync_interval=0.05)
+        journal.load_all()
+        journal.insert(make_application(1))
+        self.assertEqual(journal._unsynced, 1)
+        
+        time.sleep(0.3)
+        self.assertEqual(journal._unsynced, 0)
+        journal.close()
+
+class TestJobApplicationTracker(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.data_path = str(Path(self.tmp_dir.name) / "applications.json")
+        self.tracker = JobApplicationTracker(self.data_path)
+    
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+    
+    def test_indexes_follow_status_and_followup_changes(self):
+        first = self.tracker.add_application("user_1", {"title": "Engineer"}, 0.8)
+        second = self.tracker.add_application("user_1", {"title": "Analyst"}, 0.6)
+        self.tracker.add_application("user_2", {"title": "Designer"}, 0.9)
+        
+        self.tracker.update_application_status(first["id"], "Interviewing")
+        self.tracker.set_next_followup(second["id"], (datetime.now() + timedelta(days=30)).isoformat())
+        
+        self.assertEqual([app["id"] for app in self.tracker.get_user_applications("user_1")], [first["id"], second["id"]])
+        groups = self.tracker.get_applications_by_status("user_1")
+        self.assertEqual({status: len(apps) for status, apps in groups.items()}, {"Applied": 1, "Interviewing": 1})
+        self.assertEqual([app["id"] for app in self.tracker.get_upcoming_followups("user_1")], [first["id"]])
+        self.assertEqual(self.tracker.get_application(second["id"])["job_title"], "Analyst")
+        
+        reloaded = JobApplicationTracker(self.data_path)
+        self.assertEqual(len(reloaded.get_user_applications("user_1")), 2)
+        self.assertEqual(len(reloaded.get_upcoming_followups("user_1", days_ahead=60)), 2)
+    
+    def test_stats_follow_mutations(self):
+        first = self.tracker.add_application("user_1", {"title": "Engineer"}, 0.8)
+        self.tracker.add_application("user_1", {"title": "Analyst"}, 0.6)
+        self.tracker.update_application_status(first["id"], "Offered")
+        
+        stats = self.tracker.get_application_stats("user_1")
+        self.assertEqual(stats["total"], 2)
+        self.assertEqual(stats["by_status"], {"Applied": 1, "Offered": 1})
+        self.assertEqual(stats["avg_match_score"], 70.0)
+        self.assertEqual(stats["recent_activity"], 2)
+        self.assertEqual(self.tracker.get_application_stats("user_2")["total"], 0)
+    
+    def test_concurrent_trackers_do_not_lose_updates(self):
+        first = self.tracker.add_application("user_1", {"title": "Engineer"}, 0.8)
+        other = JobApplicationTracker(self.data_path)
+        
+        self.assertNotEqual(other.add_application("user_1", {"title": "Analyst"}, 0.6)["id"], first["id"])
+        other.add_note(first["id"], "Recruiter called")
+        # This tracker still holds version 1 and has to retry on top of the other writer's change
+        self.tracker.update_application_status(first["id"], "Interviewing")
+        
+        stored = JobApplicationTracker(self.data_path).get_application(first["id"])
+        self.assertEqual(stored["status"], "Interviewing")
+        self.assertEqual(stored["notes"], "Recruiter called")
+        self.assertEqual(stored["version"], 3)
+        self.assertEqual([h["action"] for h in stored["history"]], ["submitted", "note_added", "updated"])
+
+    def test_sqlite_tracker_reads_only_the_users_it_serves(self):
+        store = SQLiteApplicationStore(str(Path(self.tmp_dir.name) / "hr.db"))
+        store.insert(make_application(1))
+        store.insert(make_application(2, user_id="user_2"))
+        tracker = JobApplicationTracker(store=store)
+        
+        self.assertEqual(tracker.applications, [])
+        self.assertEqual(len(tracker.get_user_applications("user_1")), 1)
+        self.assertEqual([app["id"] for app in tracker.applications], [1])
+        self.assertEqual(tracker.get_application(2)["user_id"], "user_2")
+        store.close()
+
+    def test_refresh_picks_up_other_writers(self):
+        db_path = str(Path(self.tmp_dir.name) / "hr.db")
+        for store_factory in (lambda: SQLiteApplicationStore(db_path), lambda: JSONApplicationStore(self.data_path)):
+            tracker = JobApplicationTracker(store=store_factory())
+            tracker.add_application("user_1", {"title": "Engineer"}, 0.8)
+            self.assertFalse(tracker.refresh())
+            
+            JobApplicationTracker(store=store_factory()).add_application("user_1", {"title": "Analyst"}, 0.6)
+            revision = tracker.revision
+            self.assertTrue(tracker.refresh())
+            self.assertGreater(tracker.revision, revision)
+            self.assertEqual(len(tracker.get_user_applications("user_1")), 2)
+    
+    def test_get_application_reads_store_for_loaded_user(self):
+        db_path = str(Path(self.tmp_dir.name) / "hr.db")
+        for store_factory in (lambda: SQLiteApplicationStore(db_path), lambda: JSONApplicationStore(self.data_path)):
+            tracker = JobApplicationTracker(store=store_factory())
+            tracker.add_application("user_1", {"title": "Engineer"}, 0.8)
+            
+            added = JobApplicationTracker(store=store_factory()).add_application("user_1", {"title": "Analyst"}, 0.6)
+            self.assertEqual(tracker.get_application(added["id"])["job_title"], "Analyst")
+            self.assertIn(added["id"], [app["id"] for app in tracker.get_user_applications("user_1")])
+
+class TestReminderSystem(unittest.TestCase):
+    def test_due_reminders_come_off_the_heap_in_order(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = SQLiteApplicationStore(str(Path(tmp_dir) / "hr.db"))
+            now = datetime(2024, 1, 10, 9, 0)
+            for application_id, days in enumerate([-2, 0.5, 3, 30], start=1):
+                application = make_application(application_id)
+                application["next_followup"] = (now + timedelta(days=days)).isoformat()
+                store.insert(application)
+            
+            reminders = ReminderSystem(store=store, resync_interval=7 * 86400)
+            reminders.smtp_settings = {"smtp_server": "localhost"}
+            sent = []
+            reminders.send_reminders = lambda due: {key: sent.append(application["id"]) or True for key, application, _ in due}
+            
+            reminders.process_due_reminders(now)
+            self.assertEqual(sent, [1])
+            self.assertEqual(reminders.next_due_time(), now + timedelta(days=0.5))
+            
+            reminders.process_due_reminders(now + timedelta(days=1))
+            self.assertEqual(sent, [1, 2])
+            self.assertEqual(store.get(1)["next_followup"], (now + timedelta(days=7)).isoformat())
+            self.assertEqual(store.get(1)["version"], 2)
+            store.close()
+    
+    def test_followups_changed_after_resync_are_rechecked(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = SQLiteApplicationStore(str(Path(tmp_dir) / "hr.db"))
+            now = datetime(2024, 1, 10, 9, 0)
+            for application_id in (1, 2):
+                application = make_application(application_id)
+                application["next_followup"] = (now + timedelta(hours=1)).isoformat()
+                store.insert(application)
+            
+            reminders = ReminderSystem(store=store, resync_interval=86400)
+            reminders.rebuild_schedule(now)
+            # The tracker moves one follow-up out and deletes the other application after the heap was built
+            store.update(dict(store.get(1), next_followup=(now + timedelta(hours=5)).isoformat()))
+            with store._lock, store._conn:
+                store._conn.execute("DELETE FROM applications WHERE id = 2")
+            
+            self.assertEqual(reminders.get_due_reminders(now + timedelta(hours=2)), [])
+            self.assertEqual(reminders.next_due_time(), now + timedelta(hours=5))
+            store.close()
+    
+    def test_outbox_deduplicates_and_resumes_after_crash(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = SQLiteApplicationStore(str(Path(tmp_dir) / "hr.db"))
+            now = datetime(2024, 1, 10, 9, 0)
+            application = make_application(1)
+            application["next_followup"] = (now - timedelta(hours=1)).isoformat()
+            store.insert(application)
+            
+            # First worker enqueues and claims, then dies before sending
+            crashed = ReminderSystem(store=store, resync_interval=86400)
+            self.assertEqual(crashed.enqueue_due_reminders(now), 1)
+            self.assertEqual(crashed.outbox.enqueue([(crashed.reminder_key(application), application, "x@example.com")], now), 0)
+            self.assertEqual(len(crashed.outbox.claim("crashed-worker", now=now)), 1)
+            self.assertEqual(crashed.outbox.claim("other-worker", now=now), [])
+            
+            # The restarted worker picks the row up once the lease has expired, and sends it once
+            restarted = ReminderSystem(store=store, resync_interval=86400)
+            restarted.smtp_settings = {"smtp_server": "localhost"}
+            sent = []
+            restarted.send_reminders = lambda due: {key: sent.append(key) or True for key, _, _ in due}
+            later = now + timedelta(seconds=restarted.outbox.lease_seconds + 1)
+            restarted.process_due_reminders(later)
+            restarted.process_due_reminders(later)
+            self.assertEqual(sent, [crashed.reminder_key(application)])
+            self.assertEqual(restarted.outbox.stats(), {"sent": 1})
+            restarted.outbox.close()
+            store.close()
+    
+    def test_outbox_skips_conflicts_and_waits_for_smtp(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = SQLiteApplicationStore(str(Path(tmp_dir) / "hr.db"))
+            now = datetime(2024, 1, 10, 9, 0)
+            for application_id in (1, 2):
+                application = make_application(application_id)
+                application["next_followup"] = (now - timedelta(hours=1)).isoformat()
+                store.insert(application)
+            
+            reminders = ReminderSystem(store=store, resync_interval=86400)
+            reminders.smtp_settings = {}
+            # The tracker edits application 2 between the re-read and the batched follow-up update
+            update_many = store.update_many
+            def racing_update_many(updates):
+                store.update(dict(store.get(2), status="Interview"))
+                return update_many(updates)
+            store.update_many = racing_update_many
+            self.assertEqual(reminders.enqueue_due_reminders(now), 1)
+            
+            # Without SMTP the outbox is left alone, so no attempts are used up
+            self.assertEqual(reminders.drain_outbox(now), {"sent": 0, "failed": 0})
+            self.assertEqual(reminders.outbox.stats(), {"pending": 1})
+            
+            reminders.smtp_settings = {"smtp_server": "localhost"}
+            reminders.outbox.max_attempts = 1
+            reminders.send_reminders = lambda due: {key: False for key, _, _ in due}
+            with self.assertLogs("streamlit_app.reminder_outbox", level="ERROR"):
+                self.assertEqual(reminders.drain_outbox(now), {"sent": 0, "failed": 1})
+            self.assertEqual(reminders.outbox.stats(), {"failed": 1})
+            self.assertEqual(reminders.outbox.retry_failed(now), 1)
+            claimed = reminders.outbox.claim("worker", now=now)
+            self.assertEqual([c["application"]["id"] for c in claimed], [1])
+            reminders.outbox.close()
+            store.close()
+    
+    def test_scheduler_waits_for_resync_while_smtp_is_unset(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = SQLiteApplicationStore(str(Path(tmp_dir) / "hr.db"))
+            application = make_application(1)
+            application["next_followup"] = (datetime.now() - timedelta(hours=1)).isoformat()
+            store.insert(application)
+            
+            reminders = ReminderSystem(store=store, resync_interval=3600)
+            reminders.smtp_settings = {}
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                first_wait = reminders.run_once()
+                second_wait = reminders.run_once()
+            
+            # The queued row is already available, but nothing can send it, so the loop sleeps until the resync
+            self.assertEqual(reminders.outbox.stats(), {"pending": 1})
+            self.assertGreater(min(first_wait, second_wait), 3000)
+            self.assertEqual(output.getvalue().count("SMTP settings not configured"), 1)
+            reminders.outbox.close()
+            store.close()
+
+class TestStreamlitPages(unittest.TestCase):
+    def test_pages_import(self):
+        for module_name, entry_point in (("streamlit_app.job_application_tracker", "render_application_tracker"),
+                                         ("streamlit_app.candidate_portal", "CandidatePortal")):
+            module = importlib.import_module(module_name)
+            self.assertTrue(hasattr(module, entry_point))
+    
+    def test_filtered_matches_find_allowed_jobs_beyond_the_first_neighbours(self):
+        portal = importlib.import_module("streamlit_app.candidate_portal")
+        ranked = [{"id": str(i), "similarity": 1 - i / 1000} for i in range(1000)]
+        calls = []
+        
+        def fake_match_jobs(profile, top_k, index_version, job_ids=None):
+            calls.append((top_k, job_ids))
+            candidates = ranked if job_ids is None else [m for m in ranked if m["id"] in job_ids]
+            return candidates[:top_k]
+        
+        with mock.patch.object(portal, "match_jobs", fake_match_jobs):
+            # Few allowed postings: ranked among themselves, however far down the neighbours they are
+            self.assertEqual([m["id"] for m in portal.filtered_matches("p", 2, {"900", "950", "990"}, 1000, 1)],
+                             ["900", "950"])
+            self.assertEqual(calls, [(2, ("900", "950", "990"))])
+            
+            # Many allowed postings: the neighbour fetch widens until enough of them survive
+            calls.clear()
+            allowed = {str(i) for i in range(400, 1000)}
+            self.assertEqual([m["id"] for m in portal.filtered_matches("p", 3, allowed, 1000, 1)], ["400", "401", "402"])
+            self.assertEqual([top_k for top_k, _ in calls], [30, 120, 480])
+
+class TestEmailDelivery(unittest.TestCase):
+    def test_pipeline_reuses_pooled_connections(self):
+        server = StandInSMTPServer(("127.0.0.1", 0), StandInSMTPHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        settings = {"smtp_server": "127.0.0.1", "smtp_port": server.server_address[1], "use_tls": False}
+        
+        messages = []
+        for i in range(40):
+            message = EmailMessage()
+            message["From"] = "noreply@example.com"
+            message["To"] = f"user_{i}@example.com"
+            message["Subject"] = "Follow-up"
+            message.set_content("Reminder")
+            messages.append((i, message))
+        
+        pipeline = EmailDeliveryPipeline(settings, workers=2, batch_size=10)
+        results = pipeline.send_many(messages)
+        pipeline.close()
+        server.shutdown()
+        server.server_close()
+        
+        self.assertTrue(all(results.values()))
+        self.assertEqual(len(results), 40)
+        self.assertEqual(server.messages, 40)
+        self.assertLessEqual(pipeline.stats()["connections_opened"], 2)
+        self.assertEqual(pipeline.stats()["sent"], 40)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,7 @@
+from typing import Any, Dict
+from src.data_processing.resume_parser import EnhancedResumeParser
+from src.ml_models.model_registry import registry
+
+def parse_resume(file_path: str) -> Dict[str, Any]:
+    """Parse a PDF, DOCX or TXT resume with the process-wide shared parser"""
+    return registry.get("resume_parser", EnhancedResumeParser).parse_resume(file_path)
\ No newline at end of file